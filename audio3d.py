@@ -1,11 +1,17 @@
 from direct.showbase import Audio3DManager
 from random import choice, shuffle
-from panda3d.core import Vec3
+from panda3d.core import Vec3, ClockObject
 import random
+from frame_scheduler import FrameScheduler
 class Audio3d():
-    def __init__(self, sml, cam):
+    def __init__(self, sml, cam, scheduler=None):
         self.audio3d = Audio3DManager.Audio3DManager(sml[0], cam)
         
+        # Deferred sound cleanup shares the scene's frame budget, or runs on a private one
+        self.owns_scheduler = scheduler is None
+        self.scheduler = FrameScheduler() if scheduler is None else scheduler
+        self.cleanup_queue = self.scheduler.register('audio_cleanup', self.stopSfx, priority=-1)
+        
         # Load multiple instances of each sound for layering
         self.sfx3d = {
             'a': [
@@ -121,9 +127,8 @@ class Audio3d():
             return
             
         # Check distance to camera - don't play distant sounds
-        camera_pos = self.camera_node.getPos()
-        obj_pos = obj.getPos()
-        distance = (obj_pos - camera_pos).length()
+        # (getDistance rather than getPos, so objects parented under moving nodes work)
+        distance = obj.getDistance(self.camera_node)
         
         if distance > self.audio_range * 0.8:  # Don't play if too far
             return None
@@ -182,18 +187,20 @@ class Audio3d():
             if random.random() < 0.01:
                 print(f"No available {sfx} sounds")
             return None
-    def update_sound_velocities(self):
-        """Update velocities for all active sounds based on object movement"""
-        for sound_key, sound_data in list(self.active_sounds.items()):
-            obj = sound_data['object']
-            # For now, we'll assume objects are stationary
-            # In a more complex system, you'd track object velocities here
-            pass
+    def update_sound_velocities(self, velocity_of=None):
+        """
+        Update velocities for all active sounds based on object movement.
+        
+        velocity_of maps a sounding object to its velocity; only objects with
+        active sounds are asked. Without it objects are treated as stationary.
+        """
+        if velocity_of is None:
+            return
+        for sound_data in self.active_sounds.values():
+            self.audio3d.setSoundVelocity(sound_data['sound'], velocity_of(sound_data['object']))
     def stopSfxDeferred(self, node):
         """Queue a node for deferred audio cleanup to spread workload"""
-        if not hasattr(self, '_deferred_cleanup_queue'):
-            self._deferred_cleanup_queue = []
-        self._deferred_cleanup_queue.append(node)
+        self.cleanup_queue.push(node)
     def stopSfx(self, node):
         """Stop all sounds associated with a specific node - optimized version"""
         node_id = id(node)
@@ -232,15 +239,9 @@ class Audio3d():
     def update(self, task):
         # Update the audio system
         self.audio3d.update()
-        # Process deferred cleanup (limited per frame)
-        if hasattr(self, '_deferred_cleanup_queue') and self._deferred_cleanup_queue:
-            max_audio_cleanup_per_frame = 16
-            cleanup_count = 0
-            
-            while self._deferred_cleanup_queue and cleanup_count < max_audio_cleanup_per_frame:
-                node = self._deferred_cleanup_queue.pop(0)
-                self.stopSfx(node)
-                cleanup_count += 1
+        # Process deferred cleanup within the frame budget (a shared scheduler runs its own task)
+        if self.owns_scheduler:
+            self.scheduler.run(ClockObject.getGlobalClock().getDt())
         # Clean up finished non-looping sounds
         keys_to_remove = []
         for sound_key, sound_data in list(self.active_sounds.items()):
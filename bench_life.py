@@ -0,0 +1,160 @@
+"""
+Headless Game of Life benchmark.
+
+Steps the SymmetricGameOfLife3D simulation without opening a Panda3D
+window and prints one JSON result per backend and grid size, e.g.
+
+    python bench_life.py --backend vectorized packed --size 32 64 --generations 50
+"""
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from queue import Empty
+import numpy as np
+from counter_rng import CounterRNG
+from life_engine import LIFE_BACKENDS, PYCUDA_AVAILABLE, create_life_engine, expand_octant
+from life_rules import parse_rule
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Seconds between checks that an isolated run's process is still alive
+POLL_SECONDS = 0.5
+
+
+def peak_rss_mb(who=None):
+    """Peak resident set size in MB, or None where the platform cannot report it"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who is None else who)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(usage.ru_maxrss / scale, 2)
+
+
+def random_symmetric_grid(grid_size, rng, density=0.3):
+    """Random fundamental octant mirrored into all 8 octants, drawn from a CounterRNG as initialize_random_pattern does"""
+    half_size = grid_size // 2
+    octant = rng.random(0, 'pattern', np.arange(half_size ** 3)).reshape((half_size,) * 3) > 1 - density
+    return expand_octant(octant.astype(np.uint8))
+
+
+def run_benchmark(backend, grid_size, seed, generations, density=0.3, rule='life'):
+    """Step one backend and collect timing, memory and the live-cell trajectory"""
+    # Epoch 1 is the viewer's first pattern, so a seed replays the same run there
+    rng = CounterRNG(seed, epoch=1)
+    grid = random_symmetric_grid(grid_size, rng, density)
+
+    engine = create_life_engine(backend, grid_size, rng=rng, rule=parse_rule(rule))
+    try:
+        engine.load(grid)
+        del grid
+
+        trajectory = [engine.live_count()]
+        step_seconds = 0.0
+        for _ in range(generations):
+            start = time.perf_counter()
+            engine.step()
+            # As in the viewer, so every backend follows the octant backend's trajectory
+            engine.symmetrize()
+            step_seconds += time.perf_counter() - start
+            trajectory.append(engine.live_count())
+    finally:
+        engine.close()
+
+    result = {
+        'backend': backend,
+        'rule': engine.rule.notation(),
+        'grid_size': grid_size,
+        'seed': seed,
+        'generations': generations,
+        'step_seconds': round(step_seconds, 6),
+        'generations_per_second': round(generations / step_seconds, 3) if step_seconds > 0 else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'live_cells': trajectory,
+    }
+    if resource is not None:
+        result['peak_worker_rss_mb'] = peak_rss_mb(resource.RUSAGE_CHILDREN)
+    return result
+
+
+def _run_in_child(queue, *args):
+    try:
+        queue.put(run_benchmark(*args))
+    except Exception as e:
+        queue.put({'error': f"{type(e).__name__}: {e}"})
+
+
+def run_isolated(backend, grid_size, seed, generations, density, rule, timeout=None):
+    """
+    Run one benchmark in a fresh process so peak RSS belongs to that run alone.
+
+    A child that dies without a result (a crash, the OOM killer) or outlives
+    timeout seconds yields an error entry instead of hanging the whole run.
+    """
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_run_in_child,
+                              args=(queue, backend, grid_size, seed, generations, density, rule))
+    process.start()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    result = None
+    while result is None:
+        try:
+            result = queue.get(timeout=POLL_SECONDS)
+        except Empty:
+            if deadline is not None and time.monotonic() > deadline:
+                process.terminate()
+                result = {'error': f"timed out after {timeout:g} s"}
+            elif not process.is_alive():
+                # A result put just before exiting may still be in flight
+                try:
+                    result = queue.get(timeout=POLL_SECONDS)
+                except Empty:
+                    result = {'error': f"worker exited with code {process.exitcode} and no result"}
+    process.join()
+    if 'error' in result:
+        result.update(backend=backend, grid_size=grid_size, seed=seed, generations=generations)
+    return result
+
+
+def main(argv=None):
+    backends = list(LIFE_BACKENDS) + ([] if PYCUDA_AVAILABLE else ['gpu'])
+    parser = argparse.ArgumentParser(description="Benchmark Game of Life backends without a window")
+    parser.add_argument('--backend', nargs='+', default=['vectorized'], choices=backends,
+                        help="backends to run ('gpu' is skipped when PyCUDA is unavailable)")
+    parser.add_argument('--size', nargs='+', type=int, default=[32], help="grid sizes to run")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--generations', type=int, default=100)
+    parser.add_argument('--density', type=float, default=0.3, help="initial live fraction of the fundamental octant")
+    parser.add_argument('--rule', default='life', help="rule notation or preset name, e.g. B5/S45 or pyroclastic")
+    parser.add_argument('--in-process', action='store_true',
+                        help="run everything in this process (peak RSS then covers all runs)")
+    parser.add_argument('--timeout', type=float, help="seconds each isolated run may take before it is killed")
+    parser.add_argument('--output', help="also write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    for backend in args.backend:
+        for grid_size in args.size:
+            if backend == 'gpu' and not PYCUDA_AVAILABLE:
+                result = {'backend': backend, 'grid_size': grid_size, 'skipped': "PyCUDA not available"}
+            elif args.in_process:
+                result = run_benchmark(backend, grid_size, args.seed, args.generations, args.density, args.rule)
+            else:
+                result = run_isolated(backend, grid_size, args.seed, args.generations, args.density, args.rule,
+                                      args.timeout)
+            results.append(result)
+            print(json.dumps(result), flush=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
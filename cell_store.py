@@ -0,0 +1,169 @@
+import string
+import numpy as np
+from counter_rng import CounterRNG
+
+
+CHARS = string.ascii_lowercase
+
+# Per-cell animation attributes and the uniform range each is drawn from
+ANIMATION_RANGES = {
+    'hue_oscillation_speed': (0.5, 3.0),
+    'hue_oscillation_phase': (0.0, 2 * np.pi),
+    'brightness_phase': (0.0, 2 * np.pi),
+    'brightness_speed': (5.0, 20.0),
+    'saturation': (0.7, 1.0),
+    'pulse_phase': (0.0, 2 * np.pi),
+    'pulse_speed': (2.0, 8.0),
+    'flicker_intensity': (0.5, 1.5),
+    'flicker_interval': (0.05, 0.2),
+}
+
+
+def octant_views(array):
+    """
+    Return the 8 mirror views of an array's fundamental (lower) octant.
+
+    Each view is indexed like array[:h, :h, :h] but writes through to the
+    mirrored positions, so symmetry copies become plain array assignment.
+    The first view is the octant itself.
+    """
+    h = array.shape[0] // 2
+    views = []
+    for fx in (False, True):
+        for fy in (False, True):
+            for fz in (False, True):
+                view = array[::-1 if fx else 1, ::-1 if fy else 1, ::-1 if fz else 1]
+                views.append(view[:h, :h, :h])
+    return views
+
+
+def mirror_indices(coords, shape):
+    """Flat indices of the 8 mirror images of octant coordinates, in octant_views order"""
+    last = shape[0] - 1
+    x, y, z = coords
+    return [np.ravel_multi_index((last - x if fx else x, last - y if fy else y, last - z if fz else z), shape)
+            for fx in (False, True) for fy in (False, True) for fz in (False, True)]
+
+
+def octant_indices(indices, shape):
+    """Map flat indices of a full grid to flat indices of its fundamental octant, dropping the rest"""
+    h = shape[0] // 2
+    coords = np.unravel_index(indices, shape)
+    inside = (coords[0] < h) & (coords[1] < h) & (coords[2] < h)
+    return np.ravel_multi_index(tuple(c[inside] for c in coords), (h, h, h))
+
+
+class CellAttributeStore:
+    """
+    Structure-of-arrays store for per-voxel glyph and flicker attributes.
+
+    Random attributes come from a CounterRNG keyed by generation, attribute
+    and flat cell index, so a cell spawned in a given generation always gets
+    the same glyph and animation whatever else was drawn before it.
+    """
+
+    def __init__(self, shape, rng=None):
+        self.shape = shape
+        self.rng = rng if rng is not None else CounterRNG()
+        # Generation the next draws are keyed by; the owner advances it
+        self.generation = 0
+
+        self.char_index = np.zeros(shape, dtype=np.uint8)
+        self.is_red = np.ones(shape, dtype=np.uint8)
+        self.brightness = np.ones(shape, dtype=np.float32)
+        self.base_hue_shift = np.zeros(shape, dtype=np.float32)
+        self.hue_variation = np.zeros(shape, dtype=np.float32)
+        self.last_flicker_update = np.zeros(shape, dtype=np.float32)
+        for name in ANIMATION_RANGES:
+            setattr(self, name, np.zeros(shape, dtype=np.float32))
+
+        self.reset(hue_range=0.001)
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in self.attribute_names())
+
+    @staticmethod
+    def attribute_names():
+        return ['char_index', 'is_red', 'brightness', 'base_hue_shift', 'hue_variation',
+                'last_flicker_update'] + list(ANIMATION_RANGES)
+
+    def arrays(self):
+        """Every attribute array keyed by name, e.g. for checkpointing"""
+        return {name: getattr(self, name) for name in self.attribute_names()}
+
+    def load_arrays(self, arrays):
+        """Copy attribute arrays back in by name; attributes missing from arrays are left as they are"""
+        for name in self.attribute_names():
+            if name in arrays:
+                getattr(self, name)[...] = arrays[name]
+
+    def char_at(self, x, y, z):
+        return CHARS[self.char_index[x, y, z]]
+
+    def flat_indices(self, index=()):
+        """Flat cell indices for a boolean mask, a tuple of coordinate arrays, or () for every cell"""
+        if isinstance(index, tuple):
+            if not index:
+                return np.arange(self.char_index.size)
+            return np.ravel_multi_index(index, self.shape)
+        return np.flatnonzero(index)
+
+    def _uniform(self, name, cells, low, high):
+        return self.rng.uniform(self.generation, name, cells, low, high).astype(np.float32)
+
+    def draw_animation(self, cells, hue_range=0.01):
+        """Draw fresh animation attributes for flat cell indices, keyed by attribute name"""
+        values = {
+            'base_hue_shift': self._uniform('base_hue_shift', cells, -hue_range, hue_range),
+            'hue_variation': self._uniform('hue_variation', cells, -hue_range, hue_range),
+            'last_flicker_update': np.zeros(len(cells), dtype=np.float32),
+        }
+        for name, (low, high) in ANIMATION_RANGES.items():
+            values[name] = self._uniform(name, cells, low, high)
+        return values
+
+    def randomize_animation(self, index=(), hue_range=0.01):
+        """Draw fresh animation attributes for the selected cells (all cells by default)"""
+        cells = self.flat_indices(index)
+        for name, values in self.draw_animation(cells, hue_range).items():
+            getattr(self, name).reshape(-1)[cells] = values
+
+    def spawn(self, index, hue_range=0.01):
+        """Give newly living cells a random glyph, colour type and animation"""
+        cells = self.flat_indices(index)
+        self.char_index.reshape(-1)[cells] = self.rng.integers(self.generation, 'char_index', cells, 0, len(CHARS))
+        self.is_red.reshape(-1)[cells] = self.rng.random(self.generation, 'is_red', cells) > 0.5
+        self.brightness.reshape(-1)[cells] = 1.0
+        self.randomize_animation(cells, hue_range)
+
+    def reset(self, hue_range=0.01):
+        """Return every cell to the default glyph with fresh animation"""
+        self.char_index.fill(0)
+        self.is_red.fill(1)
+        self.brightness.fill(1.0)
+        self.randomize_animation(hue_range=hue_range)
+
+    def mirror_octant(self, mask=None):
+        """
+        Copy glyph, colour type and brightness from the fundamental octant
+        to its 7 mirror positions, giving the copies fresh animation.
+
+        Args:
+            mask: Optional boolean octant mask limiting which cells are copied
+        """
+        if mask is None:
+            for name in ('char_index', 'is_red', 'brightness'):
+                views = octant_views(getattr(self, name))
+                for view in views[1:]:
+                    view[...] = views[0]
+            self.randomize_animation()
+            return
+
+        targets = mirror_indices(np.nonzero(mask), self.shape)
+        sources = {name: getattr(self, name).reshape(-1)[targets[0]]
+                   for name in ('char_index', 'is_red', 'brightness')}
+        for cells in targets[1:]:
+            for name, value in sources.items():
+                getattr(self, name).reshape(-1)[cells] = value
+            self.randomize_animation(cells)
@@ -9,12 +9,14 @@ import math
 import sys
 import uuid
 from motion_blur import MotionBlur
+from tunnel_layers import TunnelLayers
+from glyph_pool import GlyphPool
+from frame_scheduler import FrameScheduler
+from tunnel_builder import TunnelBuilder, NearestFirst
 from panda3d.core import Fog
 from panda3d.core import loadPrcFileData
 from audio3d import Audio3d
 from panda3d.core import ClockObject
-import threading
-from queue import Queue
 
 # Configure before ShowBase initializes
 loadPrcFileData("", """
@@ -38,11 +40,13 @@ class StarfieldTunnel(ShowBase):
         # Choose the fog mode
         fog.setLinearRange(2, 8)
         fog.setExpDensity(0.05)
-        self.cell_creation_queue = Queue()
-        self.creation_thread = None
-        self.should_stop_creation = False
-        self.pending_cells = {}  # Track cells being created
-        self.pending_cells_lock = threading.Lock()  # Thread safety
+        # Deferred main-thread work, drained within a per-frame time budget
+        self.scheduler = FrameScheduler()
+        # Slices are planned as plain data on a builder thread, then attached
+        # here on the main thread, nearest slice first
+        self.attach_queue = self.scheduler.register('attach_layers', self.attach_layer, priority=1,
+                                                    items=NearestFirst())
+        self.builder = TunnelBuilder(self.plan_layer, self.attach_queue)
         
         # Start the background thread after everything else is initialized
         self.start_creation_thread()
@@ -166,6 +170,8 @@ class StarfieldTunnel(ShowBase):
         
         # Storage
         self.cells = {}
+        # Cells grouped by tunnel slice, each slice under its own rotating node
+        self.tunnel = TunnelLayers(self.layer_spacing, self.render)
         self.mesh_nodes = {}
         self.char_meshes = {}
         self.slice_rotations = {}
@@ -175,8 +181,11 @@ class StarfieldTunnel(ShowBase):
         self.setBackgroundColor(0, 0, 0, 0)
         self.setup_emissive_rendering()
         self.load_bam_meshes()
+        # Glyph copies are recycled rather than copied and destroyed as cells come and go
+        self.glyph_pool = GlyphPool(self.char_meshes)
+        self.taskMgr.doMethodLater(GlyphPool.TRIM_INTERVAL, self.glyph_pool.trim_task, "trim_glyph_pool")
         self.setup_camera()
-        self.audio3d = Audio3d(self.sfxManagerList, self.camera)
+        self.audio3d = Audio3d(self.sfxManagerList, self.camera, self.scheduler)
         # Initialize tunnel
         #self.initialize_tunnel()
         self.audio3d.setAudioRange(50.0)  # Increase range
@@ -186,6 +195,7 @@ class StarfieldTunnel(ShowBase):
         self.setup_drum_loop()
         # Start tasks
         self.taskMgr.add(self.update_tunnel, "update_tunnel")
+        self.taskMgr.add(self.scheduler.task, "frame_scheduler")
         self.taskMgr.add(self.update_flicker, "update_flicker")
         self.taskMgr.add(self.update_camera, "update_camera")
         self.taskMgr.add(self.update_rotation, "update_rotation")
@@ -199,9 +209,8 @@ class StarfieldTunnel(ShowBase):
         self.taskMgr.doMethodLater(0.1, self.delayed_audio_start, "delayed_audio")
         
     def start_creation_thread(self):
-        """Start background thread for cell creation"""
-        self.creation_thread = threading.Thread(target=self._cell_creation_worker, daemon=True)
-        self.creation_thread.start()
+        """Start background thread for slice planning"""
+        self.builder.start()
         print("Background cell creation thread started")
     def setup_drum_loop(self):
         """Setup looping drum beat that changes speed with camera velocity"""
@@ -254,70 +263,49 @@ class StarfieldTunnel(ShowBase):
             # Optional: Debug output
             if random.random() < 0.02:
                 print(f"Drum speed: {smoothed_rate:.2f} (camera speed: {camera_speed:.2f})")
-    def _cell_creation_worker(self):
-        """Background worker for creating cells"""
-        while not self.should_stop_creation:
-            try:
-                # Get creation task from queue
-                task_data = self.cell_creation_queue.get(timeout=0.1)
-                if task_data is None:  # Stop signal
-                    break
+    def plan_layer(self, index, y):
+        """Decide a slice's cells as plain data (builder thread: no scene-graph calls here)"""
+        half_size = self.grid_size // 2
+        cells = []
+        
+        for x in range(-half_size, half_size + 1):
+            for z in range(-half_size, half_size + 1):
+                distance = math.sqrt(x*x + z*z)
+                if distance <= half_size and random.random() > 0.6:
+                    char = self.random_char()
+                    if char not in self.char_meshes:
+                        char = 'a'
                     
-                cell_key, x, z, y, slice_rotation = task_data
-                self._create_cell_in_background(cell_key, x, z, y, slice_rotation)
-                
-                self.cell_creation_queue.task_done()
-            except:
-                pass  # Timeout, continue
-
-    def _create_cell_in_background(self, cell_key, x, z, y, slice_rotation):
-        """Create a cell in the background thread (mesh creation only)"""
-        try:
-            # Apply slice rotation to position
-            cos_rot = math.cos(slice_rotation)
-            sin_rot = math.sin(slice_rotation)
-            
-            # Rotate around Y axis
-            rotated_x = x * cos_rot - z * sin_rot
-            rotated_z = x * sin_rot + z * cos_rot
-            
-            world_x = rotated_x * 1.0
-            world_z = rotated_z * 1.0
-            world_y = y
-            
-            char = self.random_char()
-            
-            # Create cell data structure
-            cell_data = {
-                'char': char,
-                'is_red': self.random_color_type(),
-                'brightness': random.uniform(0.8, 1.5),
-                'flicker_speed': random.uniform(3.0, 8.0),
-                'flicker_phase': random.uniform(0, 2 * math.pi),
-                'hue_shift': random.uniform(-0.2, 0.2),
-                'pulse_speed': random.uniform(1.0, 4.0),
-                'pulse_phase': random.uniform(0, 2 * math.pi),
-                'world_pos': (world_x, world_y, world_z),
-                'slice_rotation': slice_rotation,
-                'base_pos': (x, z),
-                'last_played': 0.0
-            }
-            
-            # Create the mesh node in the background
-            if char not in self.char_meshes:
-                char = 'a'
-                
-            # This is the expensive part - creating the mesh
-            node = self.char_meshes[char].copyTo(NodePath())  # Don't attach to render yet
-            node.setPos(world_x, world_y, world_z)
+                    cells.append(((x, z, y), {
+                        'char': char,
+                        'is_red': self.random_color_type(),
+                        'brightness': random.uniform(0.8, 1.5),
+                        'flicker_speed': random.uniform(3.0, 8.0),
+                        'flicker_phase': random.uniform(0, 2 * math.pi),
+                        'hue_shift': random.uniform(-0.2, 0.2),
+                        'pulse_speed': random.uniform(1.0, 4.0),
+                        'pulse_phase': random.uniform(0, 2 * math.pi),
+                        'base_pos': (x, z),
+                        'last_played': 0.0
+                    }))
+        
+        return cells
+    
+    def attach_layer(self, plan):
+        """Build a planned slice's nodes and attach them in one go (scheduler handler, main thread)"""
+        layer = self.tunnel.layer_for(plan.y)
+        if layer is None:
+            return  # Retired while it waited
+        
+        # Cells are built under a detached root, which joins the scene once
+        cells_root = NodePath('cells')
+        for cell_key, cell_data in plan.cells:
+            x, z = cell_data['base_pos']
+            node = self.glyph_pool.acquire(cell_data['char'], cells_root)
+            node.setPos(x, 0, z)  # Offset within its slice node
             node.setScale(0.08)
             
-            # Set up visual properties
-            if cell_data['is_red']:
-                base_color = self.red_color
-            else:
-                base_color = self.blue_color
-                
+            base_color = self.red_color if cell_data['is_red'] else self.blue_color
             color = Vec4(
                 base_color.x * cell_data['brightness'],
                 base_color.y * cell_data['brightness'],
@@ -335,21 +323,15 @@ class StarfieldTunnel(ShowBase):
             node.setLightOff()
             node.setTwoSided(True)
             
-            # Store the prepared cell for main thread to finalize
-            with self.pending_cells_lock:
-                self.pending_cells[cell_key] = {
-                    'cell_data': cell_data,
-                    'node': node,
-                    'world_pos': (world_x, world_y, world_z)
-                }
-                
-        except Exception as e:
-            print(f"Error creating cell in background: {e}")
-
-    def queue_cell_creation(self, cell_key, x, z, y, slice_rotation):
-        """Queue a cell for creation in background thread"""
-        self.cell_creation_queue.put((cell_key, x, z, y, slice_rotation))
+            self.cells[cell_key] = cell_data
+            self.mesh_nodes[cell_key] = node
+            layer.cell_keys.add(cell_key)
+        cells_root.reparentTo(layer.node)
         
+        # Sounds go on once the cells are in place
+        for cell_key, cell_data in plan.cells:
+            self.setup_cell_audio(cell_key, self.mesh_nodes[cell_key], cell_data)
+    
     def setup_emissive_rendering(self):
         """Setup emissive rendering"""
         self.render.clearLight()
@@ -443,17 +425,8 @@ class StarfieldTunnel(ShowBase):
     
     def initialize_tunnel(self):
         """Initialize the tunnel with rotating slices"""
-        half_size = self.grid_size // 2
-        
-        for layer in range(self.tunnel_layers):
-            layer_y = layer * self.layer_spacing
-            slice_rotation = self.get_slice_rotation(layer_y)
-            
-            for x in range(-half_size, half_size + 1):
-                for z in range(-half_size, half_size + 1):
-                    distance = math.sqrt(x*x + z*z)
-                    if distance <= half_size and random.random() > 0.6:
-                        self.create_cell_background(x, z, layer_y, slice_rotation)
+        for layer in self.tunnel.extend_to((self.tunnel_layers - 1) * self.layer_spacing, 0):
+            self.builder.request(layer.index, layer.y)
     def setup_cell_audio(self, cell_key, node, cell_data):
         """Set up audio for a cell (must be called in main thread)"""
         try:
@@ -469,133 +442,18 @@ class StarfieldTunnel(ShowBase):
             note_index = char_to_note.get(char, 0)
             volume = random.uniform(0.0, 1.0)
             
-            # FIX: Use the same pitch calculation as in create_cell_node
+            # Pitch from the character's note in the scale
             pitch = self.scale_frequencies[note_index] / self.base_freq
             
             current_time = globalClock.getFrameTime()
             if current_time - cell_data.get('last_played', 0) > 1.0:
                 # PASS THE VELOCITY for Doppler effect
-                obj_velocity = cell_data.get('velocity', Vec3(0, 0, 0))
+                obj_velocity = self.slice_velocity(node)
                 self.audio3d.playSfx(char, node, True, random.choice(self.scale_frequencies)/self.base_freq, volume, obj_velocity)
                 cell_data['last_played'] = current_time
                 
         except Exception as e:
             print(f"Error setting up audio for cell {cell_key}: {e}")
-    def create_cell(self, x, z, y, slice_rotation):
-        """Create a cell at specific 3D position with slice rotation"""
-        cell_key = (x, z, y)
-        
-        # Apply slice rotation to position
-        cos_rot = math.cos(slice_rotation)
-        sin_rot = math.sin(slice_rotation)
-        
-        # Rotate around Y axis
-        rotated_x = x * cos_rot - z * sin_rot
-        rotated_z = x * sin_rot + z * cos_rot
-        
-        world_x = rotated_x * 1.0
-        world_z = rotated_z * 1.0
-        world_y = y
-        
-        char = self.random_char()
-        self.cells[cell_key] = {
-            'char': char,
-            'is_red': self.random_color_type(),
-            'brightness': random.uniform(0.8, 1.5),
-            'flicker_speed': random.uniform(3.0, 8.0),
-            'flicker_phase': random.uniform(0, 2 * math.pi),
-            'hue_shift': random.uniform(-0.2, 0.2),
-            'pulse_speed': random.uniform(1.0, 4.0),
-            'pulse_phase': random.uniform(0, 2 * math.pi),
-            'world_pos': (world_x, world_y, world_z),
-            'slice_rotation': slice_rotation,
-            'base_pos': (x, z),
-            'last_played': 0.0
-        }
-        
-        self.create_cell_node(cell_key, world_x, world_y, world_z)
-
-    def create_cell_node(self, cell_key, x, y, z):
-        """Create visual representation of a cell"""
-        cell_data = self.cells[cell_key]
-        char = cell_data['char']
-        
-        if char not in self.char_meshes:
-            char = 'a'
-            
-        node = self.char_meshes[char].copyTo(self.render)
-        node.setPos(x, y, z)
-        node.setScale(0.08)
-        
-        # Make them face the camera
-        node.lookAt(self.camera)
-        
-        # Set initial color
-        if cell_data['is_red']:
-            base_color = self.red_color
-        else:
-            base_color = self.blue_color
-            
-        color = Vec4(
-            base_color.x * cell_data['brightness'],
-            base_color.y * cell_data['brightness'],
-            base_color.z * cell_data['brightness'],
-            1.0
-        )
-        
-        material = Material()
-        material.setShininess(1.0)
-        material.setEmission(color)
-        material.setLocal(True)
-        
-        node.setColor(color)
-        node.setMaterial(material, 1)
-        node.setLightOff()
-        node.setTwoSided(True)
-
-        self.mesh_nodes[cell_key] = node
-        
-        # Store the sound reference in the cell data so it persists
-        try:
-            # Map character to scale index (0-25)
-            char_to_note = {
-                'a': 0, 'b': 1, 'c': 2, 'd': 3, 'e': 4, 'f': 5, 'g': 6,
-                'h': 7, 'i': 8, 'j': 9, 'k': 10, 'l': 11, 'm': 12,
-                'n': 13, 'o': 14, 'p': 15, 'q': 16, 'r': 17, 's': 18,
-                't': 19, 'u': 20, 'v': 21, 'w': 22, 'x': 23, 'y': 24, 'z': 25
-            }
-            
-            # Default to note 0 if character not found
-            note_index = char_to_note.get(char, 0)
-            
-            # TRACK CHARACTER APPEARANCE COUNT
-            if not hasattr(self, 'char_appearance_count'):
-                self.char_appearance_count = {}
-            
-            # Increment appearance count for this character
-            self.char_appearance_count[char] = self.char_appearance_count.get(char, 0) + 1
-            
-            # Calculate note index based on appearance count (wrap around scale)
-            appearance_count = self.char_appearance_count[char]
-            scale_length = len(self.scale_frequencies)
-            dynamic_note_index = (note_index + appearance_count - 1) % scale_length
-            
-            # FIX: Use proper volume range (0.0 to 1.0)
-            volume = random.uniform(0.3, 0.8)  # More reasonable volume range
-            
-            # Calculate pitch based on character appearance
-            pitch = self.scale_frequencies[dynamic_note_index] / self.base_freq
-            
-            print(f"Character '{char}' -> appearance {appearance_count} -> note {dynamic_note_index} -> pitch {pitch:.4f} -> volume {volume:.2f}")
-            
-            # FIX: Add a small delay to prevent audio overload
-            current_time = globalClock.getFrameTime()
-            if current_time - cell_data.get('last_played', 0) > 1.0:  # 100ms cooldown
-                self.audio3d.playSfx(char, node, True, random.choice(self.scale_frequencies)/self.base_freq, volume)
-                cell_data['last_played'] = current_time
-                
-        except Exception as e:
-            print(f"Error playing sound for cell {cell_key}: {e}")
     
     def update_cell_visual(self, cell_key):
         """Update cell visual appearance"""
@@ -747,54 +605,24 @@ class StarfieldTunnel(ShowBase):
         """Update slice rotations for DNA-like effect"""
         dt = ClockObject.getGlobalClock().getDt()
         
-        # Store previous positions for velocity calculation
-        prev_positions = {}
-        for cell_key, cell_data in self.cells.items():
-            if cell_key in self.mesh_nodes:
-                prev_positions[cell_key] = self.mesh_nodes[cell_key].getPos()
-        
         # Update global slice rotation
         self.slice_rotation += self.rotation_speed * dt * self.rotation_direction
         
-        # Update all cells with new rotations
-        for cell_key, cell_data in list(self.cells.items()):
-            x, z = cell_data['base_pos']
-            y = cell_key[2]
-            
-            slice_index = int(y / self.layer_spacing)
-            slice_base_rotation = (slice_index % 4) * (math.pi / 2)
-            total_rotation = slice_base_rotation + self.slice_rotation
-            
-            cos_rot = math.cos(total_rotation)
-            sin_rot = math.sin(total_rotation)
-            
-            rotated_x = x * cos_rot - z * sin_rot
-            rotated_z = x * sin_rot + z * cos_rot
-            
-            world_x = rotated_x * 1.0
-            world_z = rotated_z * 1.0
-            
-            # Update cell position
-            cell_data['world_pos'] = (world_x, y, world_z)
-            cell_data['slice_rotation'] = total_rotation
-            
-            # Update visual node
-            if cell_key in self.mesh_nodes:
-                self.mesh_nodes[cell_key].setPos(world_x, y, world_z)
-                
-                # Calculate velocity for Doppler effect
-                current_pos = self.mesh_nodes[cell_key].getPos()
-                if cell_key in prev_positions:
-                    prev_pos = prev_positions[cell_key]
-                    velocity = (current_pos - prev_pos) / dt
-                    cell_data['velocity'] = velocity
+        # Each slice is one node carrying its cells at fixed offsets: one roll per slice
+        for layer in self.tunnel:
+            total_rotation = self.get_slice_rotation(layer.y) + self.slice_rotation
+            layer.node.setR(-math.degrees(total_rotation))
         
         return Task.cont
     
+    def slice_velocity(self, node):
+        """Doppler velocity of a cell node, derived from the slices' angular speed around the tunnel axis"""
+        angular_speed = self.rotation_speed * self.rotation_direction
+        pos = node.getPos(self.render)
+        return Vec3(-angular_speed * pos.z, 0, angular_speed * pos.x)
+    
     def update_tunnel(self, task):
         """Manage tunnel cells with background creation"""
-        cells_to_remove = []
-        half_size = self.grid_size // 2
         # Debug background thread occasionally
         if random.random() < 0.1:
             self.debug_background_thread()
@@ -802,131 +630,38 @@ class StarfieldTunnel(ShowBase):
         visible_range_ahead = 32
         visible_range_behind = 6
         
-        # First, finalize any cells created in background
-        cells_finalized = self.finalize_pending_cells()
-        
-        # Remove cells that are too far behind camera
-        for cell_key, cell_data in list(self.cells.items()):
-            world_y = cell_data['world_pos'][1]
-            if world_y < self.camera_position - visible_range_behind:
-                cells_to_remove.append(cell_key)
-        
-        # Remove old cells (including audio)
-        max_deletions_per_frame = 8
-        deletions_this_frame = 0
-        
-        for cell_key in cells_to_remove:
-            if deletions_this_frame >= max_deletions_per_frame:
-                break
-                
-            if cell_key in self.mesh_nodes:
-                node = self.mesh_nodes[cell_key]
-                self.audio3d.stopSfx(node)
-                node.removeNode()
-                del self.mesh_nodes[cell_key]
-            if cell_key in self.cells:
-                del self.cells[cell_key]
-            
-            deletions_this_frame += 1
-        
-        # Find the farthest Y position we have cells for
-        farthest_y = max([cell_data['world_pos'][1] for cell_data in self.cells.values()]) if self.cells else self.camera_position
-        
-        # Queue new cells for background creation
-        max_creations_per_frame = 25
-        creations_this_frame = 0
-        
-        # Calculate how many layers we need to create
-        layers_needed = math.ceil((self.camera_position + visible_range_ahead - farthest_y) / self.layer_spacing)
-        
-        for layer_offset in range(layers_needed):
-            if creations_this_frame >= max_creations_per_frame:
-                break
-                
-            new_y = farthest_y + (layer_offset * self.layer_spacing)
-            slice_rotation = self.get_slice_rotation(new_y) + self.slice_rotation
-            
-            # Queue cells for background creation
-            for x in range(-half_size, half_size + 1):
-                for z in range(-half_size, half_size + 1):
-                    if creations_this_frame >= max_creations_per_frame:
-                        break
-                        
-                    distance = math.sqrt(x*x + z*z)
-                    if distance <= half_size and random.random() > 0.6:
-                        cell_key = (x, z, new_y)
-                        # Check if not already existing or pending
-                        if cell_key not in self.cells and cell_key not in self.pending_cells:
-                            self.create_cell_background(x, z, new_y, slice_rotation)
-                            creations_this_frame += 1
+        # Retire whole slices that fell behind the camera, returning their glyphs to the pool
+        for layer in self.tunnel.retire(self.camera_position - visible_range_behind):
+            for cell_key in layer.cell_keys:
+                node = self.mesh_nodes.pop(cell_key, None)
+                if node is not None:
+                    self.audio3d.stopSfx(node)
+                    self.glyph_pool.release(node)
+                self.cells.pop(cell_key, None)
+            layer.node.removeNode()
+        
+        # New slices ahead of the camera are planned on the builder thread
+        for layer in self.tunnel.extend_to(self.camera_position + visible_range_ahead,
+                                           self.camera_position):
+            self.builder.request(layer.index, layer.y)
         
         # Debug output
         if random.random() < 0.05:
-            pending_count = len(self.pending_cells)
-            queue_size = self.cell_creation_queue.qsize()
             active_cells = len(self.cells)
-            print(f"Cells: {active_cells}, Pending: {pending_count}, Queue: {queue_size}, Finalized: {cells_finalized}, Created: {creations_this_frame}")
-            print(f"Camera Y: {self.camera_position:.1f}, Farthest Y: {farthest_y:.1f}")
+            print(f"Cells: {active_cells}, Planning: {self.builder.pending()}, Ready to attach: {len(self.attach_queue)}")
+            print(f"Scheduled work: {self.scheduler.spent * 1000:.2f} ms")
+            print(f"Camera Y: {self.camera_position:.1f}, Farthest Y: {self.tunnel.farthest_y}, Layers: {len(self.tunnel)}")
         
         return Task.cont
     def debug_background_thread(self):
         """Debug the background thread status"""
-        if not hasattr(self, 'creation_thread'):
-            print("Background thread not created!")
-            return
-            
-        if not self.creation_thread.is_alive():
+        if not self.builder.is_alive():
             print("Background thread is dead!")
             return
             
-        print(f"Background thread alive: {self.creation_thread.is_alive()}")
-        print(f"Queue size: {self.cell_creation_queue.qsize()}")
-        print(f"Pending cells: {len(self.pending_cells)}")
-    def finalize_pending_cells(self):
-        """Finalize cells created in background thread (call this in main thread)"""
-        with self.pending_cells_lock:
-            if not self.pending_cells:
-                return 0
-                
-            finalized_count = 0
-            # DRAMATICALLY INCREASE finalization rate to match creation rate
-            max_finalize_per_frame = 25  # Increased from 8 to 25
-            
-            # Process pending cells in order of creation (oldest first)
-            pending_keys = sorted(self.pending_cells.keys(), key=lambda k: k[2])  # Sort by Y position
-            
-            for cell_key in pending_keys:
-                if finalized_count >= max_finalize_per_frame:
-                    break
-                    
-                if cell_key in self.pending_cells:
-                    pending_data = self.pending_cells[cell_key]
-                    cell_data = pending_data['cell_data']
-                    node = pending_data['node']
-                    world_x, world_y, world_z = pending_data['world_pos']
-                    
-                    # Only finalize cells that are near the camera (within audio range)
-                    camera_pos = self.camera.getPos()
-                    cell_pos = Vec3(world_x, world_y, world_z)
-                    distance = (cell_pos - camera_pos).length()
-                    
-                    if distance < self.audio3d.audio_range * 1.5:  # Only finalize if within range
-                        # Finalize the cell in main thread
-                        node.reparentTo(self.render)
-                        node.lookAt(self.camera)
-                        
-                        # Store in main data structures
-                        self.cells[cell_key] = cell_data
-                        self.mesh_nodes[cell_key] = node
-                        
-                        # Set up audio
-                        self.setup_cell_audio(cell_key, node, cell_data)
-                        
-                        # Remove from pending
-                        del self.pending_cells[cell_key]
-                        finalized_count += 1
-            
-            return finalized_count
+        print(f"Background thread alive: {self.builder.is_alive()}")
+        print(f"Slices planning: {self.builder.pending()}")
+        print(f"Slices ready to attach: {len(self.attach_queue)}")
     def update_flicker(self, task):
         """Update flickering effects"""
         dt = ClockObject.getGlobalClock().getDt()
@@ -953,34 +688,12 @@ class StarfieldTunnel(ShowBase):
         return task.done
 
     def pre_warm_tunnel(self, layers=5):
-        """Pre-create some tunnel sections to avoid initial creation spikes"""
-        half_size = self.grid_size // 2
-        
-        for layer in range(layers):
-            layer_y = layer * self.layer_spacing
-            slice_rotation = self.get_slice_rotation(layer_y)
-            
-            # Create fewer cells for pre-warming (lower density)
-            for x in range(-half_size, half_size + 1):
-                for z in range(-half_size, half_size + 1):
-                    distance = math.sqrt(x*x + z*z)
-                    if distance <= half_size and random.random() > 0.8:  # Lower density
-                        cell_key = (x, z, layer_y)
-                        # Use the background creation method
-                        self.create_cell_background(x, z, layer_y, slice_rotation)
+        """Request the first few tunnel sections up front to avoid initial creation spikes"""
+        for layer in self.tunnel.extend_to((layers - 1) * self.layer_spacing, 0):
+            self.builder.request(layer.index, layer.y)
         
         print(f"Pre-warmed {layers} tunnel layers")
             
-    def create_cell_background(self, x, z, y, slice_rotation):
-        """Queue cell creation in background thread"""
-        cell_key = (x, z, y)
-        
-        # Check if cell already exists or is being created
-        if cell_key in self.cells or cell_key in self.pending_cells:
-            return
-        
-        # Queue for background creation
-        self.queue_cell_creation(cell_key, x, z, y, slice_rotation)
     def update_audio(self, task):
         """Update audio system every frame"""
         dt = globalClock.getDt()
@@ -995,15 +708,12 @@ class StarfieldTunnel(ShowBase):
         # Update drum speed based on camera velocity
         self.update_drum_speed()
         # Update sound velocities for moving letters
-        self.audio3d.update_sound_velocities()
+        self.audio3d.update_sound_velocities(self.slice_velocity)
         
         return Task.cont
     def quit(self):
         # Stop background thread
-        self.should_stop_creation = True
-        self.cell_creation_queue.put(None)  # Signal to stop
-        if self.creation_thread:
-            self.creation_thread.join(timeout=6.0)
+        self.builder.stop(timeout=6.0)
         
         # Clean up audio
         if hasattr(self, 'audio3d'):
@@ -0,0 +1,129 @@
+"""
+Counter-based random numbers for reproducible, vectorized randomness.
+
+Every value is a pure function of (seed, epoch, generation, stream, index),
+computed with the Philox4x32-10 block cipher. Nothing is consumed from a
+shared sequence, so whole arrays are drawn in one call, in any order, and
+every backend that asks for the same key gets bit-identical values.
+"""
+import zlib
+import numpy as np
+
+# Philox4x32 round multipliers and Weyl key increments (Salmon et al., Random123)
+PHILOX_M0 = np.uint64(0xD2511F53)
+PHILOX_M1 = np.uint64(0xCD9E8D57)
+PHILOX_W0 = 0x9E3779B9
+PHILOX_W1 = 0xBB67AE85
+PHILOX_ROUNDS = 10
+
+MASK32 = np.uint64(0xFFFFFFFF)
+
+
+def philox4x32(counter, key, rounds=PHILOX_ROUNDS):
+    """
+    Philox4x32 block function, vectorized over the counter words.
+
+    Args:
+        counter: Four uint64 arrays (or scalars) holding 32-bit counter words
+        key: Pair of 32-bit key words
+
+    Returns:
+        Four uint64 arrays of 32-bit output words
+    """
+    c0, c1, c2, c3 = (np.asarray(word, dtype=np.uint64) for word in counter)
+    k0, k1 = int(key[0]), int(key[1])
+    for _ in range(rounds):
+        p0 = c0 * PHILOX_M0
+        p1 = c2 * PHILOX_M1
+        c0, c1, c2, c3 = ((p1 >> np.uint64(32)) ^ c1 ^ np.uint64(k0), p1 & MASK32,
+                          (p0 >> np.uint64(32)) ^ c3 ^ np.uint64(k1), p0 & MASK32)
+        k0 = (k0 + PHILOX_W0) & 0xFFFFFFFF
+        k1 = (k1 + PHILOX_W1) & 0xFFFFFFFF
+    return c0, c1, c2, c3
+
+
+def stream_id(stream):
+    """32-bit stream number for an int or a descriptive name like 'flips'"""
+    if isinstance(stream, str):
+        return zlib.crc32(stream.encode('utf-8'))
+    return int(stream) & 0xFFFFFFFF
+
+
+class CounterRNG:
+    """
+    Keyed random source shared by the stepping backends, cell store and viewer.
+
+    Args:
+        seed: 64-bit seed; a fresh random one when None
+        epoch: Run number folded into every key, bumped to start a new pattern
+    """
+
+    def __init__(self, seed=None, epoch=0):
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+        self.seed = int(seed) & 0xFFFFFFFFFFFFFFFF
+        self.epoch = epoch
+
+    @property
+    def state(self):
+        """Everything needed to reproduce future draws, as a JSON-friendly dict"""
+        return {'counter_rng': 'philox4x32-10', 'seed': self.seed, 'epoch': self.epoch}
+
+    @state.setter
+    def state(self, state):
+        self.seed = int(state['seed'])
+        self.epoch = int(state['epoch'])
+
+    def bits(self, generation, stream, index):
+        """Four 32-bit words per index, keyed by (seed, epoch, generation, stream, index)"""
+        index = np.asarray(index, dtype=np.uint64)
+        counter = (index & MASK32,
+                   (index >> np.uint64(32)) ^ np.uint64((self.epoch & 0xFFFF) << 16),
+                   np.uint64(generation & 0xFFFFFFFF),
+                   np.uint64(stream_id(stream)))
+        key = (self.seed & 0xFFFFFFFF, self.seed >> 32)
+        return philox4x32(counter, key)
+
+    def random(self, generation, stream, index):
+        """Uniform float64 in [0, 1) per index, from 53 of the 64 bits in two words"""
+        w0, w1, _, _ = self.bits(generation, stream, index)
+        return (((w0 << np.uint64(32)) | w1) >> np.uint64(11)) * (1.0 / (1 << 53))
+
+    def uniform(self, generation, stream, index, low=0.0, high=1.0):
+        return low + (high - low) * self.random(generation, stream, index)
+
+    def integers(self, generation, stream, index, low, high):
+        """Integers in [low, high) per index"""
+        return low + np.floor(self.random(generation, stream, index) * (high - low)).astype(np.int64)
+
+    def flips(self, generation, cell_count, probability, stream='flips'):
+        """
+        Sorted flat indices of the cells hit by Bernoulli(probability) noise.
+
+        Rather than testing every cell, the gaps between hits are drawn from
+        the geometric distribution, so the cost follows the number of hits.
+        Draw k of the generation gives the k-th gap, so the result depends
+        only on the key, not on who asks.
+        """
+        if probability <= 0 or cell_count == 0:
+            return np.empty(0, dtype=np.intp)
+        if probability >= 1:
+            return np.arange(cell_count, dtype=np.intp)
+
+        log_miss = np.log1p(-probability)
+        expected = cell_count * probability
+        batch = int(expected + 4 * np.sqrt(expected) + 16)
+
+        hits = []
+        position = -1
+        drawn = 0
+        while True:
+            u = self.random(generation, stream, np.arange(drawn, drawn + batch))
+            gaps = np.floor(np.log1p(-u) / log_miss).astype(np.int64) + 1
+            positions = position + np.cumsum(gaps)
+            hits.append(positions[positions < cell_count])
+            if positions[-1] >= cell_count:
+                break
+            position = int(positions[-1])
+            drawn += batch
+        return np.concatenate(hits).astype(np.intp)
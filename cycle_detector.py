@@ -0,0 +1,83 @@
+from collections import deque
+import numpy as np
+
+
+# What the viewer does when the simulation settles into a cycle
+CYCLE_ACTIONS = ('noise', 'reseed', 'slow', 'none')
+
+
+class ZobristHash:
+    """
+    64-bit Zobrist hash of a grid's live cells.
+
+    Every cell has a random 64-bit key and the hash is the XOR of the keys of
+    the live cells, so toggling cells updates it in O(toggled cells).
+    """
+
+    def __init__(self, cell_count, seed=0x5EED):
+        # Keys come from their own generator so hashing never disturbs the simulation's draws
+        self.keys = np.random.default_rng(seed).integers(0, 2**64, cell_count, dtype=np.uint64)
+        self.value = np.uint64(0)
+
+    def combine(self, indices):
+        """XOR of the keys at the given flat indices"""
+        if len(indices) == 0:
+            return np.uint64(0)
+        return np.bitwise_xor.reduce(self.keys[indices])
+
+    def reset(self, grid):
+        self.value = self.combine(np.flatnonzero(grid))
+
+    def toggle(self, indices):
+        self.value ^= self.combine(indices)
+
+
+class CycleDetector:
+    """
+    Spots still lifes and period-N oscillators from a table of recent grid hashes.
+
+    Random flip noise would stop the grid from ever repeating exactly, so the
+    hash compared each generation is that of the rule's output: the grid
+    with this generation's noise flips toggled back.
+    """
+
+    def __init__(self, shape, window=64, seed=0x5EED):
+        self.window = window
+        self.zobrist = ZobristHash(int(np.prod(shape)), seed)
+        self.recent = deque()
+        self.seen = {}
+
+    def reset(self, grid, generation=0):
+        """Start over from grid, forgetting every stored hash"""
+        self.zobrist.reset(grid)
+        self.recent.clear()
+        self.seen.clear()
+        self._record(generation, self.zobrist.value)
+
+    def _record(self, generation, key):
+        key = int(key)
+        self.recent.append((generation, key))
+        self.seen[key] = generation
+        while self.recent and self.recent[0][0] <= generation - self.window:
+            old_generation, old_key = self.recent.popleft()
+            if self.seen.get(old_key) == old_generation:
+                del self.seen[old_key]
+
+    def observe(self, generation, changed, flips=()):
+        """
+        Fold one generation's changes into the hash and look for a repeat.
+
+        Args:
+            generation: Generation number the changes produced
+            changed: Flat indices of every cell that changed state
+            flips: Flat indices of the cells toggled by noise this generation
+
+        Returns:
+            The cycle period if this state was seen within the window, else None
+        """
+        self.zobrist.toggle(changed)
+        key = int(self.zobrist.value ^ self.zobrist.combine(flips))
+
+        previous = self.seen.get(key)
+        self._record(generation, key)
+        return generation - previous if previous is not None else None
@@ -0,0 +1,72 @@
+import numpy as np
+
+
+# Brightness band edges for the 5-stop palette, and each band's blend ramp
+BAND_EDGES = np.array([0.6, 1.0, 1.4, 1.8])
+BAND_OFFSETS = np.array([1.4, 1.4, 1.0, 0.6, 0.0])
+BAND_SLOPES = np.array([2.5, 2.5, 2.5, 2.5, 1.7])
+
+
+def rgb_to_hsv_array(rgb):
+    """Convert an (n, 3) RGB array to HSV, matching the scalar rgb_to_hsv"""
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    max_val = rgb.max(axis=1)
+    delta = max_val - rgb.min(axis=1)
+
+    grey = delta == 0
+    s = delta / np.maximum(max_val, 1e-12)
+    delta[grey] = 1.0
+
+    h = np.where(max_val == r, (g - b) / delta,
+                 np.where(max_val == g, 2.0 + (b - r) / delta, 4.0 + (r - g) / delta))
+    h /= 6.0
+    h[h < 0] += 1.0
+    h[grey] = 0.0
+
+    return h, s, max_val
+
+
+def hsv_to_rgb_array(h, s, v):
+    """Convert HSV arrays back to an (n, 3) RGB array, matching the scalar hsv_to_rgb"""
+    # Closed form of the 6-sector conversion, one channel per sector offset
+    k = np.array([5.0, 3.0, 1.0]) + h[:, None] * 6.0
+    k[k >= 6.0] -= 6.0
+    ramp = np.clip(np.minimum(k, 4.0 - k), 0.0, 1.0)
+    return v[:, None] * (1.0 - s[:, None] * ramp)
+
+
+def palette_colors(palettes, is_red, brightness):
+    """
+    Blend the 5-stop flame palette for every cell, like get_base_color_for_cell.
+
+    Args:
+        palettes: (2, 5, 3) array holding the blue then red palette
+        is_red: Per-cell colour type flags
+        brightness: Per-cell brightness
+
+    Returns:
+        (n, 3) array of base colours
+    """
+    # Each band blends palette[low] towards palette[low - 1]
+    low = 4 - np.searchsorted(BAND_EDGES, brightness, side='left')
+    factor = np.clip((brightness - BAND_OFFSETS[low]) * BAND_SLOPES[low], 0.0, 1.0)[:, None]
+
+    stops = palettes.reshape(-1, 3)
+    first = is_red.astype(np.intp) * palettes.shape[1]
+    color1 = stops[first + low]
+    color2 = stops[first + np.maximum(low - 1, 0)]
+    return color1 + (color2 - color1) * factor
+
+
+def flame_colors(palettes, is_red, brightness, hue_shift, saturation, pulse):
+    """Run the full per-cell flame colour chain as array math, returning (n, 3) RGB"""
+    base = palette_colors(palettes, is_red, brightness)
+
+    h, s, v = rgb_to_hsv_array(base)
+    h += hue_shift
+    h -= np.floor(h)
+    s = s * saturation
+
+    rgb = hsv_to_rgb_array(h, s, v)
+    rgb = np.minimum(1.0, rgb * brightness[:, None])
+    return np.minimum(1.0, rgb * pulse[:, None])
@@ -0,0 +1,106 @@
+import time
+from collections import deque
+from panda3d.core import ClockObject
+
+
+class WorkQueue:
+    """
+    One kind of deferrable work for FrameScheduler: items drained in order
+    by a single handler, with a running estimate of what an item costs.
+
+    Items live in a deque unless another container is given; it needs
+    append, popleft, appendleft and len, and decides the drain order.
+    """
+
+    # Assumed cost of an item until one has been measured, in seconds
+    INITIAL_COST = 0.0005
+    # Weight of each new measurement in the moving average of item cost
+    COST_SMOOTHING = 0.1
+
+    def __init__(self, name, handler, priority, items=None):
+        self.name = name
+        self.handler = handler
+        self.priority = priority
+        self.items = deque() if items is None else items
+        self.cost = self.INITIAL_COST
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, item):
+        """Queue an item; safe to call from a worker thread"""
+        self.items.append(item)
+
+    def clear(self):
+        self.items.clear()
+
+
+class FrameScheduler:
+    """
+    Drains deferrable per-frame work within a millisecond budget.
+
+    Scenes register work queues with a priority instead of hard-coding how
+    many items each may process per frame. Every frame the scheduler runs
+    items, highest priority first, while the measured cost of a queue's
+    next item still fits in what is left of the budget. A fast machine
+    therefore clears a backlog in a few frames and a slow one spreads it
+    out rather than dropping frames.
+
+    Every non-empty queue runs at least one item a frame, so a busy
+    high-priority queue cannot starve the ones below it for good.
+
+    A handler that returns False has found its item not ready yet: the
+    item goes back to the front of its queue until the next frame.
+    """
+
+    def __init__(self, target_frame_time=1 / 60, budget_fraction=0.25, min_budget=0.001):
+        self.target_frame_time = target_frame_time
+        # Share of the target frame time deferred work may use
+        self.budget_fraction = budget_fraction
+        self.min_budget = min_budget
+        self.queues = []
+        # Seconds the last run() took, for debug output
+        self.spent = 0.0
+
+    def register(self, name, handler, priority=0, items=None):
+        """Add a work queue whose items are passed to handler; returns the WorkQueue to push to"""
+        queue = WorkQueue(name, handler, priority, items)
+        self.queues.append(queue)
+        self.queues.sort(key=lambda q: -q.priority)
+        return queue
+
+    def frame_budget(self, dt):
+        """Seconds of deferred work to allow this frame: a share of the target frame, less the last frame's overrun"""
+        budget = self.target_frame_time * self.budget_fraction
+        overrun = dt - self.target_frame_time
+        if overrun > 0:
+            budget -= overrun
+        return max(self.min_budget, budget)
+
+    def run(self, dt):
+        """Drain queued work for one frame; returns the number of items run"""
+        start = time.perf_counter()
+        deadline = start + self.frame_budget(dt)
+        ran = 0
+        for queue in self.queues:
+            queue_ran = 0
+            while queue.items:
+                now = time.perf_counter()
+                # Each queue runs at least one item a frame, so none starves behind busier ones
+                if queue_ran and now + queue.cost > deadline:
+                    break
+                item = queue.items.popleft()
+                ready = queue.handler(item)
+                queue.cost += (time.perf_counter() - now - queue.cost) * queue.COST_SMOOTHING
+                queue_ran += 1
+                if ready is False:
+                    queue.items.appendleft(item)
+                    break
+            ran += queue_ran
+        self.spent = time.perf_counter() - start
+        return ran
+
+    def task(self, task):
+        """Task callback running the scheduler once per frame"""
+        self.run(ClockObject.getGlobalClock().getDt())
+        return task.cont
@@ -0,0 +1,126 @@
+"""
+Distance-based level of detail for glyph meshes.
+
+Every glyph gets three tiers: the full BAM mesh near the camera, a
+vertex-clustered decimation of it mid-range, and a flat quad covering its
+bounds far away, where a glyph is only a few pixels and its shape is lost anyway.
+"""
+from panda3d.core import (Geom, GeomNode, GeomTriangles, GeomVertexArrayFormat, GeomVertexData,
+                          GeomVertexFormat, GeomVertexReader, InternalName, NodePath)
+import numpy as np
+
+# Tier indices
+FULL, DECIMATED, FAR = 0, 1, 2
+
+# Camera distances (world units) where glyphs drop to the decimated and far tiers
+LOD_DISTANCES = (4.0, 10.0)
+
+
+def mesh_arrays(mesh):
+    """
+    Triangle soup of every Geom under a NodePath, in the node's own space.
+
+    Returns:
+        Tuple of (vertices, triangles): (V, 3) float32 and (T, 3) int64 arrays
+    """
+    mesh = mesh.copyTo(NodePath('lod_source'))
+    mesh.flattenStrong()
+    vertices, triangles = [], []
+    base = 0
+    for geom_node in mesh.findAllMatches('**/+GeomNode'):
+        for geom in geom_node.node().getGeoms():
+            vdata = geom.getVertexData()
+            reader = GeomVertexReader(vdata, 'vertex')
+            points = []
+            while not reader.isAtEnd():
+                point = reader.getData3()
+                points.append((point.x, point.y, point.z))
+            for primitive in geom.getPrimitives():
+                primitive = primitive.decompose()
+                indices = [primitive.getVertex(i) for i in range(primitive.getNumVertices())]
+                triangles.append(np.array(indices, dtype=np.int64).reshape(-1, 3) + base)
+            vertices.append(np.array(points, dtype=np.float32).reshape(-1, 3))
+            base += len(points)
+    if not vertices:
+        return np.empty((0, 3), dtype=np.float32), np.empty((0, 3), dtype=np.int64)
+    return np.concatenate(vertices), np.concatenate(triangles) if triangles else np.empty((0, 3), dtype=np.int64)
+
+
+def decimate(vertices, triangles, cells=4):
+    """
+    Vertex-clustering decimation: snap vertices to a lattice of cubes, cells
+    across the mesh's widest side, merge those that land together and drop
+    collapsed triangles. The thin extrusion depth collapses entirely.
+    """
+    if len(vertices) == 0:
+        return vertices, triangles
+    low = vertices.min(axis=0)
+    extent = max(float((vertices.max(axis=0) - low).max()), 1e-6)
+    lattice = np.minimum((vertices - low) / extent * cells, cells - 1).astype(np.int64)
+    keys = np.ravel_multi_index(lattice.T, (cells, cells, cells))
+    clusters, remap = np.unique(keys, return_inverse=True)
+
+    # Each cluster sits at the mean of its vertices
+    merged = np.zeros((len(clusters), 3), dtype=np.float64)
+    np.add.at(merged, remap, vertices)
+    merged /= np.bincount(remap, minlength=len(clusters))[:, None]
+
+    triangles = remap[triangles]
+    keep = (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & \
+        (triangles[:, 0] != triangles[:, 2])
+    triangles = triangles[keep]
+    # Front and back faces of the extruded glyph fold onto the same triangles
+    _, first = np.unique(np.sort(triangles, axis=1), axis=0, return_index=True)
+    return merged.astype(np.float32), triangles[np.sort(first)]
+
+
+def quad_arrays(vertices):
+    """A quad in the glyph's XZ plane covering its bounds, the far tier"""
+    if len(vertices) == 0:
+        low, high = np.full(3, -0.3), np.full(3, 0.3)
+    else:
+        low, high = vertices.min(axis=0), vertices.max(axis=0)
+    quad = np.array([(low[0], 0, low[2]), (high[0], 0, low[2]), (high[0], 0, high[2]), (low[0], 0, high[2])],
+                    dtype=np.float32)
+    return quad, np.array([(0, 1, 2), (0, 2, 3)], dtype=np.int64)
+
+
+def build_mesh(name, vertices, triangles):
+    """A NodePath drawing the triangles, written with whole-array buffer copies"""
+    array_format = GeomVertexArrayFormat()
+    array_format.addColumn(InternalName.getVertex(), 3, Geom.NT_float32, Geom.C_point)
+    vertex_format = GeomVertexFormat.registerFormat(GeomVertexFormat(array_format))
+
+    vdata = GeomVertexData(name, vertex_format, Geom.UH_static)
+    vdata.uncleanSetNumRows(len(vertices))
+    np.frombuffer(memoryview(vdata.modifyArray(0)).cast('B'), dtype=np.float32)[:] = vertices.reshape(-1)
+
+    primitive = GeomTriangles(Geom.UH_static)
+    primitive.setIndexType(Geom.NT_uint32)
+    indices = primitive.modifyVertices()
+    indices.uncleanSetNumRows(triangles.size)
+    np.frombuffer(memoryview(indices).cast('B'), dtype=np.uint32)[:] = triangles.reshape(-1)
+
+    geom = Geom(vdata)
+    geom.addPrimitive(primitive)
+    node = GeomNode(name)
+    node.addGeom(geom)
+    # Under a plain root, like a loaded model, so '**/+GeomNode' searches find it
+    root = NodePath(name)
+    root.attachNewNode(node)
+    return root
+
+
+def build_lod_meshes(name, mesh, cells=4):
+    """The [full, decimated, far] tier meshes for one glyph"""
+    vertices, triangles = mesh_arrays(mesh)
+    decimated = build_mesh(f'{name}_decimated', *decimate(vertices, triangles, cells))
+    far = build_mesh(f'{name}_far', *quad_arrays(vertices))
+    return [mesh, decimated, far]
+
+
+def classify(positions, camera_position, distances=LOD_DISTANCES):
+    """LOD tier (FULL, DECIMATED or FAR) of every position, by distance to the camera"""
+    offsets = np.asarray(positions, dtype=np.float32) - np.asarray(camera_position, dtype=np.float32)
+    squared = np.einsum('ij,ij->i', offsets, offsets)
+    return np.searchsorted(np.square(np.asarray(distances, dtype=np.float32)), squared, side='right')
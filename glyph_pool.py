@@ -0,0 +1,69 @@
+from panda3d.core import NodePath
+
+
+class GlyphPool:
+    """
+    Recycles copies of glyph meshes instead of copying and destroying them.
+
+    acquire() hands out a parked copy of the glyph, or a fresh copyTo() when
+    none is free; release() detaches it and clears the transform, colour and
+    billboard state its last user set, so the next user starts clean.
+    Callers still set their own material each time they acquire.
+
+    Free lists grow on demand. trim() drops copies that sat unused since the
+    previous trim, so a burst (a finale of fireworks, a fast stretch of
+    tunnel) does not hold its peak allocation for ever.
+
+    The pool is not thread-safe and hands out scene-graph nodes, so use it
+    from the main thread only; builder threads plan plain data instead.
+    """
+
+    # Seconds between trims when driven by trim_task
+    TRIM_INTERVAL = 5.0
+
+    def __init__(self, meshes):
+        self.meshes = meshes
+        self.free = {glyph: [] for glyph in meshes}
+        # Fewest copies each free list held since the last trim: those were never needed
+        self.idle = {glyph: 0 for glyph in meshes}
+
+    def acquire(self, glyph, parent=None):
+        """A copy of glyph's mesh, attached to parent if one is given"""
+        free = self.free[glyph]
+        if free:
+            node = free.pop()
+        else:
+            node = self.meshes[glyph].copyTo(NodePath())
+            node.setPythonTag('glyph', glyph)
+        self.idle[glyph] = min(self.idle[glyph], len(free))
+        if parent is not None:
+            node.reparentTo(parent)
+        return node
+
+    def release(self, node):
+        """Take a copy back: detach it and reset the state acquirers set"""
+        node.detachNode()
+        node.clearTransform()
+        node.clearColor()
+        node.clearColorScale()
+        node.clearBillboard()
+        self.free[node.getPythonTag('glyph')].append(node)
+
+    def trim(self):
+        """Destroy the copies that stayed free since the last trim"""
+        for glyph, free in self.free.items():
+            for _ in range(self.idle[glyph]):
+                free.pop().removeNode()
+            self.idle[glyph] = len(free)
+
+    def trim_task(self, task):
+        """doMethodLater callback: trim every TRIM_INTERVAL seconds"""
+        self.trim()
+        return task.again
+
+    def clear(self):
+        for glyph, free in self.free.items():
+            for node in free:
+                node.removeNode()
+            free.clear()
+            self.idle[glyph] = 0
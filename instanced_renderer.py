@@ -0,0 +1,116 @@
+from panda3d.core import GeomEnums, OmniBoundingVolume, Shader, Texture
+import numpy as np
+from glyph_lod import build_lod_meshes
+
+
+class GlyphBatch:
+    """One glyph mesh drawn once per instance from a packed buffer texture"""
+
+    # Texels per instance: (x, y, z, scale) then (r, g, b, a)
+    TEXELS = 2
+
+    def __init__(self, mesh, parent):
+        self.node = mesh.copyTo(parent)
+        # Bake the BAM's internal transforms so vertices sit in glyph space
+        self.node.flattenStrong()
+        self.node.clearMaterial()
+        self.node.setTwoSided(True)
+
+        # Instances are placed in the shader, so never cull the batch on its own bounds
+        for geom_node in self.node.findAllMatches('**/+GeomNode'):
+            geom_node.node().setBounds(OmniBoundingVolume())
+            geom_node.node().setFinal(True)
+
+        self.texture = Texture('instance_data')
+        self.capacity = 0
+        self.reserve(256)
+
+    def reserve(self, count):
+        """Grow the buffer texture so it can hold at least count instances"""
+        if count <= self.capacity:
+            return
+        capacity = max(count, self.capacity * 2)
+        self.texture.setupBufferTexture(capacity * self.TEXELS, Texture.T_float,
+                                        Texture.F_rgba32, GeomEnums.UH_dynamic)
+        self.texture.setRamImage(np.zeros(capacity * self.TEXELS * 4, dtype=np.float32).tobytes())
+        self.node.setShaderInput('instance_data', self.texture)
+        self.capacity = capacity
+
+    def upload(self, packed):
+        """Copy an (n, 2, 4) float32 instance array into the buffer texture and draw n instances"""
+        count = len(packed)
+        if count == 0:
+            self.node.hide()
+            return
+        self.reserve(count)
+        buffer = np.frombuffer(memoryview(self.texture.modifyRamImage()), dtype=np.float32)
+        buffer[:packed.size] = packed.reshape(-1)
+        self.node.setInstanceCount(count)
+        self.node.show()
+
+    def remove(self):
+        self.node.removeNode()
+
+
+class InstancedGlyphRenderer:
+    """
+    Draws all live cells that share a glyph in a single instanced draw call.
+
+    Each glyph has a batch per LOD tier (see glyph_lod), so a cell's tier
+    just picks which batch it is packed into.
+    """
+
+    def __init__(self, parent, char_meshes, chars):
+        self.root = parent.attachNewNode('instanced_glyphs')
+        self.root.setShader(Shader.load(Shader.SL_GLSL,
+                                        vertex='shaders/instanced_glyph.vert',
+                                        fragment='shaders/instanced_glyph.frag'))
+        self.root.setLightOff()
+
+        # Batch tier * len(chars) + i draws glyph chars[i] at that LOD tier
+        self.glyph_count = len(chars)
+        tiers = [build_lod_meshes(char, char_meshes.get(char, char_meshes.get('a'))) for char in chars]
+        self.batches = [GlyphBatch(meshes[tier], self.root)
+                        for tier in range(len(tiers[0])) for meshes in tiers]
+
+    @staticmethod
+    def is_supported(gsg):
+        return gsg is not None and gsg.getSupportsBufferTexture() and gsg.getSupportsGeometryInstancing()
+
+    def update(self, char_index, positions, colors, scales, tiers=None):
+        """
+        Refresh every batch from the simulation arrays.
+
+        Args:
+            char_index: (n,) glyph index per instance
+            positions: (n, 3) world positions
+            colors: (n, 3) RGB colours
+            scales: (n,) uniform scales
+            tiers: Optional (n,) LOD tier per instance; all full detail when None
+        """
+        packed = np.empty((len(char_index), GlyphBatch.TEXELS, 4), dtype=np.float32)
+        packed[:, 0, :3] = positions
+        packed[:, 0, 3] = scales
+        packed[:, 1, :3] = colors
+        packed[:, 1, 3] = 1.0
+
+        # Group instances by glyph so each batch gets one contiguous slice
+        batch_index = char_index if tiers is None else tiers * self.glyph_count + char_index
+        order = np.argsort(batch_index, kind='stable')
+        packed = packed[order]
+        ends = np.cumsum(np.bincount(batch_index, minlength=len(self.batches)))
+        start = 0
+        for batch, end in zip(self.batches, ends):
+            batch.upload(packed[start:end])
+            start = end
+
+    def hide(self):
+        self.root.hide()
+
+    def show(self):
+        self.root.show()
+
+    def destroy(self):
+        for batch in self.batches:
+            batch.remove()
+        self.root.removeNode()
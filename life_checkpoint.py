@@ -0,0 +1,173 @@
+"""
+Checkpoint files for Game of Life runs.
+
+Layout, with every section starting on an ALIGNMENT byte boundary:
+
+    MAGIC | header length (uint64, little endian) | JSON header
+    grid section: the grid as raw packed bits, one bit per cell
+    attribute sections: each per-cell array as zlib-compressed chunks
+
+The grid is stored uncompressed so opening a checkpoint is a memory map
+rather than a parse; the attribute arrays are only inflated on request.
+"""
+import json
+import zlib
+import numpy as np
+
+MAGIC = b'LIFECKPT'
+VERSION = 1
+ALIGNMENT = 64
+CHUNK_BYTES = 1 << 20
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _compress_chunks(array, chunk_bytes, level):
+    raw = memoryview(np.ascontiguousarray(array)).cast('B')
+    return [zlib.compress(raw[start:start + chunk_bytes], level)
+            for start in range(0, len(raw), chunk_bytes)]
+
+
+def _rng_state(rng):
+    """JSON-friendly state of a CounterRNG or a numpy Generator"""
+    if rng is None:
+        return None
+    return rng.state if hasattr(rng, 'state') else rng.bit_generator.state
+
+
+def save_checkpoint(path, grid, generation=0, attributes=None, rng=None, metadata=None,
+                    chunk_bytes=CHUNK_BYTES, level=1):
+    """
+    Write a checkpoint of the grid, per-cell attributes and RNG state.
+
+    Args:
+        path: Destination file
+        grid: (N, N, N) array, non-zero for live cells
+        generation: Generation number the grid belongs to
+        attributes: Optional dict of per-cell arrays, e.g. from CellAttributeStore
+        rng: Optional CounterRNG or numpy Generator whose state is needed to resume exactly
+        metadata: Optional JSON-serialisable dict stored alongside
+        chunk_bytes: Uncompressed size of each attribute chunk
+        level: zlib compression level
+    """
+    grid = np.asarray(grid)
+    bits = np.packbits(grid.reshape(-1) != 0, bitorder='little')
+
+    # Compress first so every section's offset is known when the header is written
+    compressed = {name: (np.asarray(array), _compress_chunks(array, chunk_bytes, level))
+                  for name, array in (attributes or {}).items()}
+
+    def layout(base):
+        """Place every section from base onwards, returning the header and (offset, bytes) writes"""
+        writes = [(base, bits.tobytes())]
+        grid_section = {'offset': base, 'nbytes': int(bits.nbytes), 'encoding': 'packbits-little'}
+        offset = _aligned(base + bits.nbytes)
+
+        attribute_sections = {}
+        for name, (array, chunks) in compressed.items():
+            chunk_table = []
+            for chunk in chunks:
+                writes.append((offset, chunk))
+                chunk_table.append([offset, len(chunk)])
+                offset += len(chunk)
+            offset = _aligned(offset)
+            attribute_sections[name] = {'dtype': array.dtype.str, 'shape': list(array.shape),
+                                        'encoding': 'zlib', 'chunks': chunk_table}
+
+        header = {
+            'version': VERSION,
+            'generation': int(generation),
+            'shape': list(grid.shape),
+            'grid': grid_section,
+            'attributes': attribute_sections,
+            'rng': _rng_state(rng),
+            'metadata': metadata or {},
+        }
+        return json.dumps(header).encode('utf-8'), writes
+
+    # Offsets depend on the header's own length, so settle it by iterating
+    base = 0
+    while True:
+        header, writes = layout(base)
+        data_start = _aligned(len(MAGIC) + 8 + len(header))
+        if data_start <= base:
+            break
+        base = data_start
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(np.uint64(len(header)).tobytes())
+        f.write(header)
+        # Seeking past the end leaves the alignment padding zero-filled
+        for offset, data in writes:
+            f.seek(offset)
+            f.write(data)
+
+
+class Checkpoint:
+    """A checkpoint opened for reading; the packed grid is memory-mapped, not read"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a Life checkpoint")
+            header_length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+            self.header = json.loads(f.read(header_length))
+
+        if self.header['version'] > VERSION:
+            raise ValueError(f"{path} uses checkpoint version {self.header['version']}, "
+                             f"newer than supported version {VERSION}")
+
+        self.generation = self.header['generation']
+        self.shape = tuple(self.header['shape'])
+        self.metadata = self.header['metadata']
+
+        grid = self.header['grid']
+        self.grid_bits = np.memmap(path, dtype=np.uint8, mode='r',
+                                   offset=grid['offset'], shape=(grid['nbytes'],))
+
+    def dense(self):
+        """Unpack the memory-mapped grid to a (N, N, N) uint8 array"""
+        cell_count = int(np.prod(self.shape))
+        return np.unpackbits(self.grid_bits, count=cell_count, bitorder='little').reshape(self.shape)
+
+    def attribute_names(self):
+        return list(self.header['attributes'])
+
+    def attribute(self, name):
+        """Inflate one per-cell attribute array"""
+        section = self.header['attributes'][name]
+        array = np.empty(section['shape'], dtype=np.dtype(section['dtype']))
+        out = memoryview(array).cast('B')
+        position = 0
+        with open(self.path, 'rb') as f:
+            for offset, nbytes in section['chunks']:
+                f.seek(offset)
+                chunk = zlib.decompress(f.read(nbytes))
+                out[position:position + len(chunk)] = chunk
+                position += len(chunk)
+        return array
+
+    def attributes(self):
+        return {name: self.attribute(name) for name in self.attribute_names()}
+
+    def restore_rng(self, rng):
+        """Put rng back in the state it had when the checkpoint was saved"""
+        if self.header['rng'] is None:
+            raise ValueError(f"{self.path} has no RNG state")
+        if hasattr(rng, 'state'):
+            rng.state = self.header['rng']
+        else:
+            rng.bit_generator.state = self.header['rng']
+        return rng
+
+    def close(self):
+        # Drop the mapping; arrays from dense() and attribute() are copies and stay valid
+        self.grid_bits = None
+
+
+def load_checkpoint(path):
+    return Checkpoint(path)
@@ -0,0 +1,991 @@
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+import multiprocessing
+import os
+import numpy as np
+from cell_store import octant_views
+from counter_rng import CounterRNG
+from life_rules import LIFE
+
+# PyCUDA is optional; the GPU backend is only registered when it imports
+try:
+    import pycuda.autoinit
+    import pycuda.gpuarray as gpuarray
+    from pycuda.compiler import SourceModule
+    PYCUDA_AVAILABLE = True
+except ImportError:
+    PYCUDA_AVAILABLE = False
+
+
+# Chance that any cell flips state each generation
+FLIP_PROBABILITY = 0.002
+
+
+def box_sum(grid, radius=1):
+    """Toroidal (2R+1)^3 box sum of every cell, the cell itself included"""
+    grid = grid.astype(np.uint8, copy=False)
+    if radius > 1:
+        return box_sum_interior(np.pad(grid, radius, mode='wrap'), radius)
+
+    # Separable 3x3x3 box sum: 6 rolls instead of 26, wrapping like the CUDA kernel
+    total = grid + np.roll(grid, 1, axis=0) + np.roll(grid, -1, axis=0)
+    total = total + np.roll(total, 1, axis=1) + np.roll(total, -1, axis=1)
+    return total + np.roll(total, 1, axis=2) + np.roll(total, -1, axis=2)
+
+
+def count_alive_neighbors(grid):
+    """Count the 26 toroidal neighbors of every cell in one batch"""
+    grid = grid.astype(np.uint8, copy=False)
+    return box_sum(grid) - grid
+
+
+def box_sum_interior(padded, radius=1):
+    """(2R+1)^3 box sum over the last three axes of an array padded by radius cells on each side"""
+    if radius == 1:
+        total = padded[..., :-2, :, :] + padded[..., 1:-1, :, :] + padded[..., 2:, :, :]
+        total = total[..., :-2, :] + total[..., 1:-1, :] + total[..., 2:, :]
+        return total[..., :-2] + total[..., 1:-1] + total[..., 2:]
+
+    # Summed-volume table, built and differenced one axis at a time, so the
+    # cost per cell does not grow with the radius
+    width = 2 * radius + 1
+    total = padded
+    for axis in (-3, -2, -1):
+        running = np.moveaxis(np.cumsum(total, axis=axis, dtype=np.int32), axis, 0)
+        window = running[width - 1:].copy()
+        window[1:] -= running[:-width]
+        total = np.moveaxis(window, 0, axis)
+    return total
+
+
+def expand_octant(octant):
+    """Build the full mirror-symmetric grid from its fundamental (lower) octant"""
+    full = np.concatenate([octant, octant[::-1]], axis=0)
+    full = np.concatenate([full, full[:, ::-1]], axis=1)
+    return np.concatenate([full, full[:, :, ::-1]], axis=2)
+
+
+def mirror_fundamental_octant(grid):
+    """Overwrite the 7 mirror octants with the fundamental octant, dead cells included, in place"""
+    grid_views = octant_views(grid)
+    for view in grid_views[1:]:
+        view[...] = grid_views[0]
+
+
+class LifeEngine:
+    """
+    Base class for Game of Life stepping backends.
+
+    A backend owns the grid in whatever representation suits it. Callers
+    load a dense grid, step it, and ask for a dense view when rendering.
+    Dense grids hold rule states: 0 dead, 1 alive, and for Generations
+    rules 2 and up for dying cells.
+    """
+
+    name = None
+
+    # Whether the backend can keep up with an interactive frame loop
+    realtime = True
+
+    # Whether the backend may be stepped from a thread other than the one that built it
+    threaded = True
+
+    def __init__(self, grid_size, flip_probability=FLIP_PROBABILITY, rng=None, rule=None):
+        self.rule = rule if rule is not None else LIFE
+        if not self.supports(self.rule):
+            raise ValueError(f"The {self.name} backend does not support rule {self.rule.notation()}")
+        self.grid_size = grid_size
+        self.shape = (grid_size, grid_size, grid_size)
+        self.flip_probability = flip_probability
+        # A CounterRNG: flips are keyed by generation, so every backend draws the same ones
+        self.rng = rng if rng is not None else CounterRNG()
+        self.generation = 0
+        # Flat indices of the cells the last step toggled with random noise
+        self.flips = np.empty(0, dtype=np.intp)
+
+    @classmethod
+    def supports(cls, rule):
+        """Whether this backend can step the given LifeRule"""
+        return True
+
+    def load(self, grid):
+        """Replace the engine state with a dense grid of rule states"""
+        raise NotImplementedError
+
+    def dense(self):
+        """Return the current state as a dense uint8 grid"""
+        raise NotImplementedError
+
+    def live_count(self):
+        """Number of live cells, without building a dense grid where the backend can avoid it"""
+        return int(np.count_nonzero(self.dense()))
+
+    def close(self):
+        """Release any worker processes or shared buffers; arrays from dense() must not be used afterwards"""
+
+    def symmetrize(self):
+        """
+        Impose the viewer's mirror symmetry: the fundamental octant overwrites
+        the other 7, so flip noise outside it is dropped and every backend
+        matches the octant-only one
+        """
+        grid = self.dense().copy()
+        mirror_fundamental_octant(grid)
+        self.load(grid)
+
+    def next_flips(self, cell_count=None):
+        """Advance the generation counter and draw that generation's flip noise"""
+        self.generation += 1
+        cell_count = self.grid_size ** 3 if cell_count is None else cell_count
+        return self.rng.flips(self.generation, cell_count, self.flip_probability)
+
+    @staticmethod
+    def toggle(flat, flips):
+        """Flip noise: dead cells come alive, live and dying cells die"""
+        flat[flips] = flat[flips] == 0
+
+    def step(self):
+        """
+        Advance one generation.
+
+        Returns:
+            Sorted flat indices of cells that came alive this step and need
+            fresh cell data
+        """
+        raise NotImplementedError
+
+
+class LoopLifeEngine(LifeEngine):
+    """Reference engine: the original per-cell Python loop, kept as a benchmark baseline"""
+
+    name = 'cpu-loop'
+    realtime = False
+
+    def __init__(self, grid_size, flip_probability=FLIP_PROBABILITY, rng=None, rule=None):
+        super().__init__(grid_size, flip_probability, rng, rule)
+        self.grid = np.zeros(self.shape, dtype=np.uint8)
+
+    @classmethod
+    def supports(cls, rule):
+        # The original loop hard-codes B3/S23
+        return rule.is_life
+
+    def load(self, grid):
+        self.grid = (grid != 0).astype(np.uint8)
+
+    def dense(self):
+        return self.grid
+
+    def count_alive_neighbors(self, x, y, z):
+        count = 0
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    if dx == 0 and dy == 0 and dz == 0:
+                        continue
+                    nx = (x + dx) % self.grid_size
+                    ny = (y + dy) % self.grid_size
+                    nz = (z + dz) % self.grid_size
+                    if self.grid[nx, ny, nz]:
+                        count += 1
+        return count
+
+    def step(self):
+        temp_grid = np.zeros_like(self.grid)
+        spawned = []
+        flips = set(self.next_flips().tolist())
+
+        for x in range(self.grid_size):
+            for y in range(self.grid_size):
+                for z in range(self.grid_size):
+                    neighbors = self.count_alive_neighbors(x, y, z)
+                    current_state = self.grid[x, y, z]
+                    new_state = current_state
+                    born = False
+
+                    if current_state:
+                        if neighbors < 2 or neighbors > 3:
+                            new_state = 0
+                    elif neighbors == 3:
+                        new_state = 1
+                        born = True
+
+                    index = (x * self.grid_size + y) * self.grid_size + z
+                    if index in flips:
+                        new_state = 1 - new_state
+                        born = bool(new_state)
+
+                    if born and new_state:
+                        spawned.append(index)
+                    temp_grid[x, y, z] = new_state
+
+        self.grid = temp_grid
+        self.flips = np.array(sorted(flips), dtype=np.intp)
+        return np.array(spawned, dtype=np.intp)
+
+
+class VectorizedLifeEngine(LifeEngine):
+    """Whole-grid NumPy stepping engine for the 3D Game of Life"""
+
+    name = 'vectorized'
+
+    def __init__(self, grid_size, flip_probability=FLIP_PROBABILITY, rng=None, rule=None):
+        super().__init__(grid_size, flip_probability, rng, rule)
+        self.grid = np.zeros(self.shape, dtype=np.uint8)
+
+    def load(self, grid):
+        self.grid = self.rule.clamp(grid)
+
+    def dense(self):
+        return self.grid
+
+    def step(self):
+        rule = self.rule
+        next_state, births = rule.apply(self.grid, box_sum(rule.alive(self.grid), rule.radius))
+
+        flips = self.next_flips()
+        flat = next_state.reshape(-1)
+        self.toggle(flat, flips)
+        spawned = np.union1d(np.flatnonzero(births), flips)
+
+        self.grid = next_state
+        self.flips = flips
+        return spawned[flat[spawned] == 1]
+
+
+def _add_bit_planes(a, b):
+    """Ripple-carry add two bit-sliced numbers given as LSB-first lists of word arrays"""
+    if len(a) < len(b):
+        a, b = b, a
+    total = []
+    carry = None
+    for i, x in enumerate(a):
+        if i < len(b):
+            half = x ^ b[i]
+            if carry is None:
+                total.append(half)
+                carry = x & b[i]
+            else:
+                total.append(half ^ carry)
+                carry = (x & b[i]) | (carry & half)
+        elif carry is not None:
+            total.append(x ^ carry)
+            carry = x & carry
+        else:
+            total.append(x)
+    if carry is not None:
+        total.append(carry)
+    return total
+
+
+def _equals(planes, value):
+    """Word mask of cells whose bit-sliced count equals value"""
+    result = None
+    for i, plane in enumerate(planes):
+        term = plane if (value >> i) & 1 else ~plane
+        result = term if result is None else result & term
+    return result
+
+
+class PackedLifeEngine(LifeEngine):
+    """
+    Bit-packed stepping engine: cells are packed along z, 64 per uint64 word
+    (or 8 per byte when the grid size is not a multiple of 64).
+
+    Neighbor counts are computed with bitwise adders across whole words, so
+    memory is one bit per cell and the dense grid is only built on request.
+    """
+
+    name = 'packed'
+
+    # Bits needed for a 3x3x3 box sum (0..27)
+    COUNT_BITS = 5
+
+    def __init__(self, grid_size, flip_probability=FLIP_PROBABILITY, rng=None, rule=None):
+        if grid_size % 8:
+            raise ValueError(f"Packed engine needs a grid size divisible by 8, got {grid_size}")
+        super().__init__(grid_size, flip_probability, rng, rule)
+        self.word_dtype = np.uint64 if grid_size % 64 == 0 else np.uint8
+        self.word_bits = np.dtype(self.word_dtype).itemsize * 8
+        self.words = np.zeros((grid_size, grid_size, grid_size // self.word_bits), dtype=self.word_dtype)
+        self._dense = None
+
+    @classmethod
+    def supports(cls, rule):
+        # One bit per cell and a 5-bit box sum: two states, radius 1 only
+        return rule.states == 2 and rule.radius == 1
+
+    def pack(self, grid):
+        packed = np.packbits(grid != 0, axis=2, bitorder='little')
+        return packed.view(self.word_dtype)
+
+    def load(self, grid):
+        self.words = np.ascontiguousarray(self.pack(grid))
+        self._dense = None
+
+    def packed_bytes(self):
+        """The packed grid as (N, N, N/8) bytes, bit k of byte j holding z = 8j + k"""
+        return self.words.view(np.uint8)
+
+    def dense(self):
+        if self._dense is None:
+            self._dense = np.unpackbits(self.packed_bytes(), axis=2, bitorder='little')
+        return self._dense
+
+    def live_count(self):
+        if hasattr(np, 'bitwise_count'):
+            return int(np.bitwise_count(self.words).sum())
+        return int(np.unpackbits(self.packed_bytes()).sum())
+
+    def _shift_z(self, words, direction):
+        """Shift cells one step along z with toroidal carry between words"""
+        one = self.word_dtype(1)
+        top = self.word_dtype(self.word_bits - 1)
+        if direction > 0:
+            # Cell z takes the value of z - 1
+            return (words << one) | (np.roll(words, 1, axis=2) >> top)
+        # Cell z takes the value of z + 1
+        return (words >> one) | (np.roll(words, -1, axis=2) << top)
+
+    def box_sum(self, words):
+        """Bit-sliced 3x3x3 toroidal box sum (cell included) as LSB-first word planes"""
+        below = self._shift_z(words, 1)
+        above = self._shift_z(words, -1)
+
+        # Full adder down each z column: 0..3
+        half = below ^ above
+        column = [half ^ words, (below & above) | (words & half)]
+
+        # Then across y (0..9) and x (0..27)
+        planes = column
+        for axis in (1, 0):
+            rolled_up = [np.roll(p, 1, axis=axis) for p in planes]
+            rolled_down = [np.roll(p, -1, axis=axis) for p in planes]
+            planes = _add_bit_planes(_add_bit_planes(planes, rolled_up), rolled_down)
+            planes = planes[:self.COUNT_BITS]
+        return planes
+
+    def cell_indices(self, words):
+        """Flat cell indices of the set bits in a packed word array"""
+        data = words.view(np.uint8).reshape(-1)
+        nonzero = np.flatnonzero(data)
+        bits = np.unpackbits(data[nonzero][:, None], axis=1, bitorder='little')
+        rows, offsets = np.nonzero(bits)
+        byte_index = nonzero[rows]
+        bytes_per_row = self.grid_size // 8
+        return (byte_index // bytes_per_row) * self.grid_size + (byte_index % bytes_per_row) * 8 + offsets
+
+    def flip(self, indices):
+        """Toggle the given flat cell indices in place"""
+        rows, z = np.divmod(indices, self.grid_size)
+        word = rows * (self.grid_size // self.word_bits) + z // self.word_bits
+        bits = np.left_shift(self.word_dtype(1), (z % self.word_bits).astype(self.word_dtype))
+        np.bitwise_xor.at(self.words.reshape(-1), word, bits)
+
+    def is_set(self, indices):
+        rows, z = np.divmod(indices, self.grid_size)
+        word = self.words.reshape(-1)[rows * (self.grid_size // self.word_bits) + z // self.word_bits]
+        return ((word >> (z % self.word_bits).astype(self.word_dtype)) & self.word_dtype(1)) != 0
+
+    def step(self):
+        words = self.words
+        total = self.box_sum(words)
+
+        # The rule's tables as totals (cell included) that give birth or survival
+        birth_totals, survival_totals = self.rule.birth_totals(), self.rule.survival_totals()
+        matches = {value: _equals(total, value) for value in set(birth_totals) | set(survival_totals)}
+        born_words = np.zeros_like(words)
+        kept_words = np.zeros_like(words)
+        for value in birth_totals:
+            born_words |= matches[value]
+        for value in survival_totals:
+            kept_words |= matches[value]
+
+        next_words = (born_words & ~words) | (kept_words & words)
+        births = next_words & ~words
+        self.words = next_words
+
+        # Sparse flip noise: only the sampled cells are touched
+        flips = self.next_flips()
+        self.flip(flips)
+        self.flips = flips
+        self._dense = None
+
+        born = self.cell_indices(births)
+        born = born[self.is_set(born)]
+        revived = flips[self.is_set(flips)]
+        return np.union1d(born, revived)
+
+
+class SparseLifeEngine(LifeEngine):
+    """
+    Chunked stepping engine that only recomputes active bricks.
+
+    The grid is split into BRICK^3 bricks. A brick is recomputed only if it
+    or one of its 26 neighbors changed last generation, so quiescent regions
+    cost nothing and the step scales with activity rather than volume.
+    """
+
+    name = 'sparse'
+
+    BRICK = 8
+
+    def __init__(self, grid_size, flip_probability=FLIP_PROBABILITY, rng=None, rule=None):
+        if grid_size % self.BRICK:
+            raise ValueError(f"Sparse engine needs a grid size divisible by {self.BRICK}, got {grid_size}")
+        super().__init__(grid_size, flip_probability, rng, rule)
+        self.bricks_per_axis = grid_size // self.BRICK
+        # Bricks within this many bricks of a change can be affected by it
+        self.brick_reach = -(-self.rule.radius // self.BRICK)
+        self.grid = np.zeros(self.shape, dtype=np.uint8)
+        self.active = np.ones((self.bricks_per_axis,) * 3, dtype=bool)
+
+    def load(self, grid):
+        self.grid = self.rule.clamp(grid)
+        # Nothing is known to be stable after an external edit
+        self.active.fill(True)
+
+    def dense(self):
+        return self.grid
+
+    def symmetrize(self):
+        """Mirror the octant in place, waking only the bricks whose cells the mirror changed"""
+        grid_views = octant_views(self.grid)
+        changed = np.zeros(self.shape, dtype=bool)
+        for view, changed_view in zip(grid_views[1:], octant_views(changed)[1:]):
+            changed_view[...] = view != grid_views[0]
+            view[...] = grid_views[0]
+        b, n = self.bricks_per_axis, self.BRICK
+        self.active |= changed.reshape(b, n, b, n, b, n).any(axis=(1, 3, 5))
+
+    def brick_view(self):
+        """Writable (B, B, B, BRICK, BRICK, BRICK) view of the grid"""
+        b, n = self.bricks_per_axis, self.BRICK
+        return self.grid.reshape(b, n, b, n, b, n).transpose(0, 2, 4, 1, 3, 5)
+
+    def dirty_bricks(self):
+        """Active bricks dilated by their 26 toroidal neighbors (further for wide rules)"""
+        dirty = self.active
+        for _ in range(self.brick_reach):
+            for axis in range(3):
+                dirty = dirty | np.roll(dirty, 1, axis=axis) | np.roll(dirty, -1, axis=axis)
+        return np.argwhere(dirty)
+
+    def gather(self, bricks):
+        """Copy each brick plus a radius-cell toroidal halo into a (K, BRICK+2R, BRICK+2R, BRICK+2R) array"""
+        radius = self.rule.radius
+        offsets = np.arange(-radius, self.BRICK + radius)
+        coords = (bricks[:, :, None] * self.BRICK + offsets) % self.grid_size
+        x, y, z = coords[:, 0], coords[:, 1], coords[:, 2]
+        return self.grid[x[:, :, None, None], y[:, None, :, None], z[:, None, None, :]]
+
+    def step(self):
+        bricks = self.dirty_bricks()
+        blocks = self.gather(bricks)
+
+        # Box sum of live cells inside each haloed block
+        rule, r = self.rule, self.rule.radius
+        total = box_sum_interior(rule.alive(blocks), r)
+        current = blocks[:, r:-r, r:-r, r:-r]
+        next_state, births = rule.apply(current, total)
+
+        changed = (next_state != current).reshape(len(bricks), self.BRICK ** 3).any(axis=1)
+        self.active.fill(False)
+        self.active[tuple(bricks[changed].T)] = True
+
+        # All blocks were gathered before any write, so update the grid in place
+        self.brick_view()[tuple(bricks.T)] = next_state
+
+        # Flat indices of rule births from brick-local coordinates
+        k, bx, by, bz = np.nonzero(births)
+        origin = bricks[k] * self.BRICK
+        born = np.ravel_multi_index((origin[:, 0] + bx, origin[:, 1] + by, origin[:, 2] + bz), self.shape)
+
+        # Sparse flip noise wakes up the bricks it lands in
+        flips = self.next_flips()
+        flat = self.grid.reshape(-1)
+        self.toggle(flat, flips)
+        self.flips = flips
+        fx, fy, fz = np.unravel_index(flips, self.shape)
+        self.active[fx // self.BRICK, fy // self.BRICK, fz // self.BRICK] = True
+
+        spawned = np.union1d(born, flips)
+        return spawned[flat[spawned] == 1]
+
+
+class OctantLifeEngine(LifeEngine):
+    """
+    Symmetry-aware stepping engine that simulates only the fundamental octant.
+
+    A grid mirrored across all three mid-planes is its own toroidal
+    neighbor across every octant face, so stepping the lower octant with
+    reflective boundaries gives exactly the full-grid result for 1/8 of
+    the work. The full grid is only expanded when dense() is called.
+    """
+
+    name = 'octant'
+
+    def __init__(self, grid_size, flip_probability=FLIP_PROBABILITY, rng=None, rule=None):
+        if grid_size % 2:
+            raise ValueError(f"Octant engine needs an even grid size, got {grid_size}")
+        super().__init__(grid_size, flip_probability, rng, rule)
+        self.half_size = grid_size // 2
+        self.octant = np.zeros((self.half_size,) * 3, dtype=np.uint8)
+        self._dense = None
+
+    def load(self, grid):
+        """Take the fundamental octant of grid; the rest is implied by symmetry"""
+        h = self.half_size
+        self.octant = self.rule.clamp(grid[:h, :h, :h])
+        self._dense = None
+
+    def dense(self):
+        if self._dense is None:
+            self._dense = expand_octant(self.octant)
+        return self._dense
+
+    def live_count(self):
+        return int(np.count_nonzero(self.octant)) * 8
+
+    def symmetrize(self):
+        """Nothing to do: the octant is all this engine keeps"""
+
+    def mirror_indices(self, indices):
+        """Full-grid flat indices of the 8 mirror images of octant flat indices"""
+        coords = np.unravel_index(indices, self.octant.shape)
+        last = self.grid_size - 1
+        mirrored = [np.ravel_multi_index((fx, fy, fz), self.shape)
+                    for fx in (coords[0], last - coords[0])
+                    for fy in (coords[1], last - coords[1])
+                    for fz in (coords[2], last - coords[2])]
+        return np.sort(np.concatenate(mirrored))
+
+    def step(self):
+        # Reflective padding: the cells past each octant face mirror those inside it
+        rule = self.rule
+        padded = np.pad(rule.alive(self.octant), rule.radius, mode='symmetric')
+        next_state, births = rule.apply(self.octant, box_sum_interior(padded, rule.radius))
+
+        # The same keyed flips as the full-grid backends; those in the octant appear in all 8 mirrors
+        flips = self.next_flips()
+        coords = np.unravel_index(flips, self.shape)
+        inside = (coords[0] < self.half_size) & (coords[1] < self.half_size) & (coords[2] < self.half_size)
+        flips = np.ravel_multi_index(tuple(c[inside] for c in coords), self.octant.shape)
+        flat = next_state.reshape(-1)
+        self.toggle(flat, flips)
+        spawned = np.union1d(np.flatnonzero(births), flips)
+        spawned = spawned[flat[spawned] == 1]
+
+        self.octant = next_state
+        self.flips = self.mirror_indices(flips)
+        self._dense = None
+
+        # Report spawns at their fundamental-octant positions in the full grid
+        return np.ravel_multi_index(np.unravel_index(spawned, self.octant.shape), self.shape)
+
+
+def _slab_worker(connection, buffer_names, grid_size, start, stop, rule):
+    """Worker process loop: step rows [start, stop) of the shared double buffer on request"""
+    shape = (grid_size, grid_size, grid_size)
+    buffers = [shared_memory.SharedMemory(name=name) for name in buffer_names]
+    grids = [np.ndarray(shape, dtype=np.uint8, buffer=buffer.buf) for buffer in buffers]
+    r = rule.radius
+    halo_rows = np.arange(start - r, stop + r)
+    current = target = None
+
+    try:
+        while True:
+            source = connection.recv()
+            if source is None:
+                break
+            current, target = grids[source], grids[1 - source]
+
+            # Own rows plus radius halo layers from the neighboring slabs, wrapped toroidally
+            slab = current.take(halo_rows, axis=0, mode='wrap')
+            alive = np.pad(rule.alive(slab), ((0, 0), (r, r), (r, r)), mode='wrap')
+            next_state, births = rule.apply(slab[r:-r], box_sum_interior(alive, r))
+            target[start:stop] = next_state
+            connection.send(np.flatnonzero(births) + start * grid_size * grid_size)
+    finally:
+        del grids, current, target
+        for buffer in buffers:
+            buffer.close()
+
+
+class ParallelLifeEngine(LifeEngine):
+    """
+    Multi-process stepping engine.
+
+    The grid lives in a shared-memory double buffer split into slabs along
+    the first (contiguous) axis. Each worker process steps its own slab,
+    reading the halo layers of its neighbors straight from the shared
+    front buffer and writing into the back buffer.
+    """
+
+    name = 'parallel'
+
+    def __init__(self, grid_size, flip_probability=FLIP_PROBABILITY, rng=None, rule=None, workers=None):
+        super().__init__(grid_size, flip_probability, rng, rule)
+        workers = workers or os.cpu_count() or 1
+        workers = max(1, min(workers, grid_size))
+
+        size = grid_size ** 3
+        self.buffers = [shared_memory.SharedMemory(create=True, size=size) for _ in range(2)]
+        self.grids = [np.ndarray(self.shape, dtype=np.uint8, buffer=buffer.buf) for buffer in self.buffers]
+        for grid in self.grids:
+            grid.fill(0)
+        self.front = 0
+
+        bounds = np.linspace(0, grid_size, workers + 1).astype(int)
+        self.connections = []
+        self.processes = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            parent_end, child_end = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_slab_worker,
+                args=(child_end, [buffer.name for buffer in self.buffers], grid_size, int(start), int(stop), self.rule),
+                daemon=True
+            )
+            process.start()
+            child_end.close()
+            self.connections.append(parent_end)
+            self.processes.append(process)
+
+    def load(self, grid):
+        self.grids[self.front][...] = self.rule.clamp(grid)
+
+    def dense(self):
+        return self.grids[self.front]
+
+    def step(self):
+        for connection in self.connections:
+            connection.send(self.front)
+        born = np.concatenate([connection.recv() for connection in self.connections])
+        self.front = 1 - self.front
+
+        flips = self.next_flips()
+        flat = self.grids[self.front].reshape(-1)
+        self.toggle(flat, flips)
+        self.flips = flips
+
+        spawned = np.union1d(born, flips)
+        return spawned[flat[spawned] == 1]
+
+    def close(self):
+        if not self.processes:
+            return
+        for connection in self.connections:
+            connection.send(None)
+            connection.close()
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
+
+        del self.grids
+        for buffer in self.buffers:
+            buffer.close()
+            buffer.unlink()
+
+
+class EmulatedGridDevice:
+    """
+    NumPy stand-in for CudaGridDevice with the same operations and results,
+    so the device-resident engine can be run and checked without a GPU.
+    """
+
+    def __init__(self, grid_size, rule):
+        self.grid_size = grid_size
+        self.rule = rule
+        self.shape = (grid_size, grid_size, grid_size)
+        self.grid = np.zeros(self.shape, dtype=np.uint8)
+        self.synced = np.zeros(self.shape, dtype=np.uint8)
+
+    def upload(self, grid):
+        self.grid[...] = grid
+        self.synced[...] = grid
+
+    def step(self):
+        """Apply the rule; returns the (unsorted) flat indices of rule births"""
+        rule = self.rule
+        self.grid, births = rule.apply(self.grid, box_sum(rule.alive(self.grid), rule.radius))
+        return np.flatnonzero(births)
+
+    def toggle(self, flips):
+        """Apply flip noise at flat indices; returns each flipped cell's new state"""
+        flat = self.grid.reshape(-1)
+        flat[flips] = flat[flips] == 0
+        return flat[flips]
+
+    def mirror_octant(self):
+        mirror_fundamental_octant(self.grid)
+
+    def changes(self):
+        """Flat indices and states of the cells that changed since the last call or upload"""
+        changed = np.flatnonzero(self.grid != self.synced)
+        states = self.grid.reshape(-1)[changed]
+        self.synced.reshape(-1)[changed] = states
+        return changed, states
+
+    def close(self):
+        pass
+
+
+class CudaGridDevice:
+    """
+    The grid kept resident in GPU memory as uint8 states.
+
+    Stepping, flip noise and symmetry run as kernels; the host only receives
+    compacted index lists, appended through an atomic counter.
+    """
+
+    KERNELS = """
+    __global__ void step_rule(const unsigned char *grid, unsigned char *next, int grid_size,
+                              const unsigned char *transition, int table_width, int radius,
+                              int include_center, int *births, int *birth_count) {
+        int x = blockIdx.x * blockDim.x + threadIdx.x;
+        int y = blockIdx.y * blockDim.y + threadIdx.y;
+        int z = blockIdx.z * blockDim.z + threadIdx.z;
+        if (x >= grid_size || y >= grid_size || z >= grid_size) return;
+
+        int idx = (x * grid_size + y) * grid_size + z;
+        int neighbors = 0;
+        for (int dx = -radius; dx <= radius; dx++) {
+            for (int dy = -radius; dy <= radius; dy++) {
+                for (int dz = -radius; dz <= radius; dz++) {
+                    if (dx == 0 && dy == 0 && dz == 0 && !include_center) continue;
+                    int nx = ((x + dx) % grid_size + grid_size) % grid_size;
+                    int ny = ((y + dy) % grid_size + grid_size) % grid_size;
+                    int nz = ((z + dz) % grid_size + grid_size) % grid_size;
+                    if (grid[(nx * grid_size + ny) * grid_size + nz] == 1) neighbors++;
+                }
+            }
+        }
+
+        // Same lookup table as the CPU backends: transition[state][neighbors]
+        unsigned char state = grid[idx];
+        unsigned char next_state = transition[state * table_width + neighbors];
+        next[idx] = next_state;
+        if (state == 0 && next_state == 1) births[atomicAdd(birth_count, 1)] = idx;
+    }
+
+    __global__ void toggle_cells(unsigned char *grid, const int *flips, int count, unsigned char *flipped) {
+        int i = blockIdx.x * blockDim.x + threadIdx.x;
+        if (i >= count) return;
+        unsigned char state = grid[flips[i]] == 0;
+        grid[flips[i]] = state;
+        flipped[i] = state;
+    }
+
+    __global__ void mirror_octant(unsigned char *grid, int grid_size) {
+        int half = grid_size / 2;
+        int x = blockIdx.x * blockDim.x + threadIdx.x;
+        int y = blockIdx.y * blockDim.y + threadIdx.y;
+        int z = blockIdx.z * blockDim.z + threadIdx.z;
+        if (x >= half || y >= half || z >= half) return;
+
+        unsigned char state = grid[(x * grid_size + y) * grid_size + z];
+        int last = grid_size - 1;
+        for (int m = 1; m < 8; m++) {
+            int mx = (m & 4) ? last - x : x;
+            int my = (m & 2) ? last - y : y;
+            int mz = (m & 1) ? last - z : z;
+            grid[(mx * grid_size + my) * grid_size + mz] = state;
+        }
+    }
+
+    __global__ void collect_changes(const unsigned char *grid, unsigned char *synced, int cell_count,
+                                    int *changed, unsigned char *states, int *change_count) {
+        int idx = blockIdx.x * blockDim.x + threadIdx.x;
+        if (idx >= cell_count || grid[idx] == synced[idx]) return;
+        synced[idx] = grid[idx];
+        int slot = atomicAdd(change_count, 1);
+        changed[slot] = idx;
+        states[slot] = grid[idx];
+    }
+    """
+
+    THREADS_PER_BLOCK = (4, 4, 4)
+    THREADS_PER_LINE = 256
+
+    def __init__(self, grid_size, rule):
+        self.grid_size = grid_size
+        self.rule = rule
+        self.shape = (grid_size, grid_size, grid_size)
+        self.cell_count = grid_size ** 3
+
+        self.module = SourceModule(self.KERNELS, options=['-arch=sm_52'])
+        self.step_kernel = self.module.get_function('step_rule')
+        self.toggle_kernel = self.module.get_function('toggle_cells')
+        self.mirror_kernel = self.module.get_function('mirror_octant')
+        self.collect_kernel = self.module.get_function('collect_changes')
+
+        self.transition = gpuarray.to_gpu(np.ascontiguousarray(rule.transition))
+        self.grid = gpuarray.zeros(self.shape, dtype=np.uint8)
+        self.next = gpuarray.zeros(self.shape, dtype=np.uint8)
+        self.synced = gpuarray.zeros(self.shape, dtype=np.uint8)
+        # Compaction outputs, sized for the worst case of every cell
+        self.indices = gpuarray.zeros(self.cell_count, dtype=np.int32)
+        self.states = gpuarray.zeros(self.cell_count, dtype=np.uint8)
+        self.count = gpuarray.zeros(1, dtype=np.int32)
+
+        self.blocks = tuple((grid_size + t - 1) // t for t in self.THREADS_PER_BLOCK)
+        half = grid_size // 2
+        self.octant_blocks = tuple(max(1, (half + t - 1) // t) for t in self.THREADS_PER_BLOCK)
+
+    def _lines(self, count):
+        return ((count + self.THREADS_PER_LINE - 1) // self.THREADS_PER_LINE, 1, 1)
+
+    def _compacted(self):
+        """Number of entries the last kernel appended, resetting the counter for the next one"""
+        count = int(self.count.get()[0])
+        self.count.fill(0)
+        return count
+
+    def upload(self, grid):
+        grid = np.ascontiguousarray(grid, dtype=np.uint8)
+        self.grid.set(grid)
+        self.synced.set(grid)
+
+    def step(self):
+        rule = self.rule
+        self.step_kernel(self.grid, self.next, np.int32(self.grid_size), self.transition,
+                         np.int32(rule.transition.shape[1]), np.int32(rule.radius), np.int32(rule.include_center),
+                         self.indices, self.count, block=self.THREADS_PER_BLOCK, grid=self.blocks)
+        self.grid, self.next = self.next, self.grid
+        count = self._compacted()
+        return self.indices[:count].get().astype(np.intp)
+
+    def toggle(self, flips):
+        if len(flips) == 0:
+            return np.empty(0, dtype=np.uint8)
+        flips_gpu = gpuarray.to_gpu(np.asarray(flips, dtype=np.int32))
+        self.toggle_kernel(self.grid, flips_gpu, np.int32(len(flips)), self.states,
+                           block=(self.THREADS_PER_LINE, 1, 1), grid=self._lines(len(flips)))
+        return self.states[:len(flips)].get()
+
+    def mirror_octant(self):
+        self.mirror_kernel(self.grid, np.int32(self.grid_size),
+                           block=self.THREADS_PER_BLOCK, grid=self.octant_blocks)
+
+    def changes(self):
+        self.collect_kernel(self.grid, self.synced, np.int32(self.cell_count), self.indices, self.states, self.count,
+                            block=(self.THREADS_PER_LINE, 1, 1), grid=self._lines(self.cell_count))
+        count = self._compacted()
+        if count == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.uint8)
+        return self.indices[:count].get().astype(np.intp), self.states[:count].get()
+
+    def close(self):
+        for name in ('transition', 'grid', 'next', 'synced', 'indices', 'states', 'count'):
+            getattr(self, name).gpudata.free()
+
+
+class ResidentLifeEngine(LifeEngine):
+    """
+    Keeps the grid on a device between steps instead of round-tripping it.
+
+    Each step the host receives only the rule's births, the new states of
+    the flipped cells and, when it asks for a dense grid, the cells that
+    changed since it last asked; its host copy is patched from those.
+    """
+
+    Device = EmulatedGridDevice
+
+    def __init__(self, grid_size, flip_probability=FLIP_PROBABILITY, rng=None, rule=None):
+        super().__init__(grid_size, flip_probability, rng, rule)
+        self.device = self.Device(grid_size, self.rule)
+        self.host_grid = np.zeros(self.shape, dtype=np.uint8)
+
+    def load(self, grid):
+        self.host_grid = self.rule.clamp(grid)
+        self.device.upload(self.host_grid)
+
+    def dense(self):
+        changed, states = self.device.changes()
+        self.host_grid.reshape(-1)[changed] = states
+        return self.host_grid
+
+    def symmetrize(self):
+        self.device.mirror_octant()
+
+    def step(self):
+        births = self.device.step()
+        flips = self.next_flips()
+        flipped = self.device.toggle(flips)
+        self.flips = flips
+        # Births that were flipped straight back are gone; flips that landed alive are new
+        return np.union1d(np.setdiff1d(births, flips), flips[flipped == 1])
+
+    def close(self):
+        self.device.close()
+
+
+class EmulatedGpuLifeEngine(ResidentLifeEngine):
+    """The device-resident engine on EmulatedGridDevice: the GPU code path, run by NumPy"""
+
+    name = 'gpu-emulated'
+
+
+class CudaLifeEngine(ResidentLifeEngine):
+    """PyCUDA backend: the grid stays in GPU memory and only changed cell indices come back"""
+
+    name = 'gpu'
+
+    Device = CudaGridDevice
+
+    def __init__(self, grid_size, flip_probability=FLIP_PROBABILITY, rng=None, rule=None):
+        if not PYCUDA_AVAILABLE:
+            raise RuntimeError("PyCUDA is not available")
+        super().__init__(grid_size, flip_probability, rng, rule)
+        # pycuda.autoinit makes its context current on the importing thread only
+        self.context = pycuda.autoinit.context
+
+    @contextmanager
+    def current(self):
+        """Make the CUDA context current on the calling thread, so the worker thread can step too"""
+        self.context.push()
+        try:
+            yield
+        finally:
+            self.context.pop()
+
+    def load(self, grid):
+        with self.current():
+            super().load(grid)
+
+    def dense(self):
+        with self.current():
+            return super().dense()
+
+    def symmetrize(self):
+        with self.current():
+            super().symmetrize()
+
+    def step(self):
+        with self.current():
+            return super().step()
+
+    def close(self):
+        with self.current():
+            super().close()
+
+
+LIFE_BACKENDS = {
+    LoopLifeEngine.name: LoopLifeEngine,
+    VectorizedLifeEngine.name: VectorizedLifeEngine,
+    PackedLifeEngine.name: PackedLifeEngine,
+    SparseLifeEngine.name: SparseLifeEngine,
+    ParallelLifeEngine.name: ParallelLifeEngine,
+    OctantLifeEngine.name: OctantLifeEngine,
+    EmulatedGpuLifeEngine.name: EmulatedGpuLifeEngine,
+}
+if PYCUDA_AVAILABLE:
+    LIFE_BACKENDS[CudaLifeEngine.name] = CudaLifeEngine
+
+
+def create_life_engine(name, grid_size, flip_probability=FLIP_PROBABILITY, rng=None, rule=None):
+    """Build a stepping backend by name, optionally for a LifeRule other than B3/S23"""
+    if name not in LIFE_BACKENDS:
+        raise ValueError(f"Unknown Life backend '{name}', expected one of {sorted(LIFE_BACKENDS)}")
+    return LIFE_BACKENDS[name](grid_size, flip_probability, rng, rule=rule)
@@ -0,0 +1,72 @@
+import tempfile
+import numpy as np
+
+
+class GenerationHistory:
+    """
+    Ring buffer of the last capacity generations in a memory-mapped file.
+
+    Generation g lives in slot g % capacity, so looking one up is a single
+    index and the file never grows; the OS pages slots in and out as needed.
+    Two-state grids are bit-packed; rules with more states (Generations
+    rules, where dying cells count down) keep a byte per cell instead.
+    """
+
+    def __init__(self, shape, capacity=256, path=None, states=2):
+        self.shape = tuple(shape)
+        self.capacity = capacity
+        self.cell_count = int(np.prod(self.shape))
+        self.packed = states <= 2
+        slot_bytes = -(-self.cell_count // 8) if self.packed else self.cell_count
+
+        # Without a path the backing file is anonymous and vanishes on close
+        self._file = open(path, 'w+b') if path is not None else tempfile.TemporaryFile()
+        self.slots = np.memmap(self._file, dtype=np.uint8, mode='w+', shape=(capacity, slot_bytes))
+        self.slot_generation = np.full(capacity, -1, dtype=np.int64)
+
+    @property
+    def oldest(self):
+        stored = self.slot_generation[self.slot_generation >= 0]
+        return int(stored.min()) if len(stored) else None
+
+    @property
+    def newest(self):
+        stored = self.slot_generation[self.slot_generation >= 0]
+        return int(stored.max()) if len(stored) else None
+
+    def __contains__(self, generation):
+        return generation >= 0 and self.slot_generation[generation % self.capacity] == generation
+
+    def __len__(self):
+        return int(np.count_nonzero(self.slot_generation >= 0))
+
+    def push(self, generation, grid):
+        """
+        Store a generation's grid, dropping any stored generations after it.
+
+        Pushing an earlier generation than the newest (after scrubbing back
+        and resuming) starts a new branch, so the old future is discarded.
+        """
+        self.slot_generation[self.slot_generation >= generation] = -1
+        slot = generation % self.capacity
+        if self.packed:
+            self.slots[slot] = np.packbits(grid.reshape(-1) != 0, bitorder='little')
+        else:
+            self.slots[slot] = grid.reshape(-1)
+        self.slot_generation[slot] = generation
+
+    def get(self, generation):
+        """Unpack a stored generation to a dense uint8 grid"""
+        if generation not in self:
+            raise KeyError(f"generation {generation} is not in the history")
+        slot = self.slots[generation % self.capacity]
+        if not self.packed:
+            return np.array(slot).reshape(self.shape)
+        return np.unpackbits(slot, count=self.cell_count, bitorder='little').reshape(self.shape)
+
+    def clear(self):
+        self.slot_generation.fill(-1)
+
+    def close(self):
+        self.slots = None
+        self._file.close()
@@ -0,0 +1,188 @@
+"""
+Isosurface render mode: the live region as one smooth mesh.
+
+Surface nets: every 2x2x2 block of cells that straddles the isosurface
+gets one vertex, placed at the mean of the block's edge crossings, and
+every cell edge that crosses the surface becomes a quad joining the four
+blocks around it. Everything is computed with whole-array NumPy passes and
+streamed into a single GeomVertexData, so the grid is one draw call.
+"""
+from panda3d.core import (Geom, GeomNode, GeomTriangles, GeomVertexArrayFormat, GeomVertexData,
+                          GeomVertexFormat, InternalName)
+import numpy as np
+from life_engine import box_sum_interior
+
+# Corner k of a block sits at offset ((k >> 2) & 1, (k >> 1) & 1, k & 1)
+CORNERS = np.array([((k >> 2) & 1, (k >> 1) & 1, k & 1) for k in range(8)])
+# The 12 block edges as corner pairs differing in one axis
+EDGES = np.array([(a, b) for a in range(8) for b in range(8)
+                  if a < b and np.abs(CORNERS[a] - CORNERS[b]).sum() == 1])
+
+
+def smoothed_field(grid, smoothing=0.3):
+    """
+    Alive field with a 3x3x3 blur mixed in.
+
+    Any smoothing below 1 keeps live cells above 0.5 and dead ones below
+    it, so the blur rounds the surface off without changing which cells
+    it encloses.
+    """
+    alive = (np.asarray(grid) == 1).astype(np.float32)
+    if smoothing <= 0:
+        return alive
+    blurred = box_sum_interior(np.pad(alive, 1), 1) / np.float32(27)
+    return (1 - smoothing) * alive + smoothing * blurred
+
+
+def surface_nets(field, level=0.5):
+    """
+    Extract the level isosurface of a 3D scalar field.
+
+    The field is padded with empty space so the mesh is closed at the grid edges.
+
+    Returns:
+        Tuple of (vertices, triangles, vertex_cells): (V, 3) float32 positions
+        in cell units, (T, 3) uint32 vertex indices, and the flat index of the
+        grid cell each vertex takes its colour from
+    """
+    field = np.pad(np.asarray(field, dtype=np.float32), 1)
+    blocks = tuple(size - 1 for size in field.shape)
+    corner_slices = [(slice(x, x + blocks[0]), slice(y, y + blocks[1]), slice(z, z + blocks[2]))
+                     for x, y, z in CORNERS]
+
+    inside = field > level
+    inside_count = np.zeros(blocks, dtype=np.uint8)
+    for window in corner_slices:
+        inside_count += inside[window]
+    active = (inside_count > 0) & (inside_count < 8)
+
+    block_flat = np.flatnonzero(active)
+    block_coords = np.stack(np.unravel_index(block_flat, blocks))
+    # Corner values of the active blocks, one contiguous row per corner
+    values = np.stack([field[window][active] for window in corner_slices])
+    vertex_index = np.full(active.size, -1, dtype=np.int64)
+    vertex_index[block_flat] = np.arange(len(block_flat))
+
+    # Vertex = block corner + mean of the edge crossings
+    sums = np.zeros((3, len(block_flat)), dtype=np.float32)
+    counts = np.zeros(len(block_flat), dtype=np.float32)
+    for start, end in EDGES:
+        a, b = values[start], values[end]
+        crosses = (a > level) != (b > level)
+        t = np.divide(level - a, b - a, out=np.zeros_like(a), where=crosses)
+        axis = np.flatnonzero(CORNERS[end] - CORNERS[start])[0]
+        for other in range(3):
+            if CORNERS[start][other]:
+                sums[other] += crosses
+        sums[axis] += t
+        counts += crosses
+    # -1 undoes the padding, so positions are in grid cell coordinates
+    vertices = (block_coords + sums / counts - 1).T.astype(np.float32)
+
+    # Colour from the block's most-inside corner, which is always a real, live cell
+    corner = CORNERS[np.argmax(values, axis=0)].T
+    vertex_cells = np.ravel_multi_index(block_coords + corner - 1, tuple(size - 2 for size in field.shape))
+
+    # One quad per crossing edge, joining the 4 blocks that share it. Edges
+    # are indexed by their lower end point, which has the same coordinates as
+    # a block; edges in the padding never cross, so all 4 blocks exist.
+    strides = np.array([blocks[1] * blocks[2], blocks[2], 1])
+    quads = []
+    for axis in range(3):
+        # Cyclic (u, v) so u x v points along +axis for every axis
+        u, v = (axis + 1) % 3, (axis + 2) % 3
+        shifted = corner_slices[4 >> axis]
+        entering = ~inside[corner_slices[0]] & inside[shifted]
+        leaving = inside[corner_slices[0]] & ~inside[shifted]
+        edges = np.flatnonzero(entering | leaving)
+
+        su, sv = strides[u], strides[v]
+        corners = [vertex_index[edges - su - sv], vertex_index[edges - sv],
+                   vertex_index[edges], vertex_index[edges - su]]
+        # Wind each quad to face out of the live region: reversing 0-1-2-3 is swapping 1 and 3
+        flip = entering.reshape(-1)[edges]
+        corners[1], corners[3] = np.where(flip, corners[3], corners[1]), np.where(flip, corners[1], corners[3])
+        quads.append(np.stack(corners, axis=1))
+
+    quads = np.concatenate(quads).astype(np.uint32)
+    triangles = np.concatenate([quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]])
+    return vertices, triangles, vertex_cells
+
+
+class IsosurfaceRenderer:
+    """
+    One GeomNode holding the surface-nets mesh of the grid.
+
+    Positions and triangle indices are rebuilt per generation and colours
+    per frame, each by writing whole NumPy arrays into the vertex and index
+    buffers rather than one addData call per vertex.
+    """
+
+    def __init__(self, parent, grid_size, voxel_size, smoothing=0.3):
+        self.grid_size = grid_size
+        self.voxel_size = voxel_size
+        self.smoothing = smoothing
+
+        # Positions and colours in separate arrays, so colour updates leave positions alone
+        positions = GeomVertexArrayFormat()
+        positions.addColumn(InternalName.getVertex(), 3, Geom.NT_float32, Geom.C_point)
+        colors = GeomVertexArrayFormat()
+        colors.addColumn(InternalName.getColor(), 4, Geom.NT_float32, Geom.C_color)
+        vertex_format = GeomVertexFormat()
+        vertex_format.addArray(positions)
+        vertex_format.addArray(colors)
+
+        self.vdata = GeomVertexData('life_isosurface', GeomVertexFormat.registerFormat(vertex_format), Geom.UH_dynamic)
+        self.triangles = GeomTriangles(Geom.UH_dynamic)
+        self.triangles.setIndexType(Geom.NT_uint32)
+        geom = Geom(self.vdata)
+        geom.addPrimitive(self.triangles)
+        geom_node = GeomNode('life_isosurface')
+        geom_node.addGeom(geom)
+
+        self.node = parent.attachNewNode(geom_node)
+        self.node.setLightOff()
+        self.node.setTwoSided(True)
+
+        # Grid cell each vertex is coloured from; cells are the unique ones, slots map vertices to them
+        self.vertex_cells = np.empty(0, dtype=np.intp)
+        self.cells = np.empty(0, dtype=np.intp)
+        self.cell_slots = np.empty(0, dtype=np.intp)
+
+    @staticmethod
+    def _write(array_data, values, dtype):
+        np.frombuffer(memoryview(array_data).cast('B'), dtype=dtype)[:] = values.reshape(-1)
+
+    def build(self, grid):
+        """Rebuild the mesh from a grid of rule states; returns the triangle count"""
+        vertices, triangles, self.vertex_cells = surface_nets(smoothed_field(grid, self.smoothing))
+        self.cells, self.cell_slots = np.unique(self.vertex_cells, return_inverse=True)
+
+        world = (vertices - self.grid_size / 2) * self.voxel_size
+        self.vdata.uncleanSetNumRows(len(world))
+        self._write(self.vdata.modifyArray(0), world, np.float32)
+
+        indices = self.triangles.modifyVertices()
+        indices.uncleanSetNumRows(triangles.size)
+        self._write(indices, triangles, np.uint32)
+        return len(triangles)
+
+    def update_colors(self, cell_colors):
+        """
+        Colour every vertex from its cell.
+
+        Args:
+            cell_colors: (len(cells), 3) RGB colours, in the order of self.cells
+        """
+        colors = np.ones((len(self.vertex_cells), 4), dtype=np.float32)
+        colors[:, :3] = cell_colors[self.cell_slots]
+        self._write(self.vdata.modifyArray(1), colors, np.float32)
+
+    def hide(self):
+        self.node.hide()
+
+    def show(self):
+        self.node.show()
+
+    def destroy(self):
+        self.node.removeNode()
@@ -0,0 +1,235 @@
+"""
+Cellular automaton rules for the 3D Game of Life.
+
+A rule is parsed once from its notation and compiled into a transition
+lookup table, next_state = transition[state, count], that every stepping
+backend indexes (or, for the bit-packed one, turns into bit-plane tests).
+
+Supported notations:
+
+    B3/S23          birth / survival counts; digits, or comma separated
+    B5-7,12/S4..9   values and ranges once counts go past 9
+    B3/S23/C5       Generations: C states, the extra ones dying cells
+    23/3/5          the classic survival/birth[/states] order
+    R2,C0,M0,S10..16,B12..14,NM
+                    Larger than Life: radius R Moore neighborhood, M1
+                    counting the cell itself
+"""
+import re
+import numpy as np
+
+
+# Named rules selectable from the viewer
+RULE_PRESETS = {
+    'life': 'B3/S23',
+    '4555': 'B5/S4-5',
+    '5766': 'B6/S5-7',
+    'clouds': 'B13-14,17-19/S13-26',
+    '445': 'B4/S4/C5',
+    'pyroclastic': 'B6-8/S4-7/C10',
+    'ltl-r2': 'R2,C0,M0,S14..28,B16..22,NM',
+}
+
+
+def _parse_counts(text):
+    """Parse '23', '5-7,12' or '4..9' into a set of neighbor counts"""
+    counts = set()
+    if not text:
+        return counts
+    if not re.search(r'[,\-.]', text) and text.isdigit():
+        # Bare digits are single counts, as in the 2D notation
+        return {int(digit) for digit in text}
+    for part in text.split(','):
+        bounds = re.split(r'\.\.|-', part)
+        if not all(bound.isdigit() for bound in bounds) or len(bounds) > 2:
+            raise ValueError(f"Bad neighbor count '{part}'")
+        low, high = int(bounds[0]), int(bounds[-1])
+        counts.update(range(low, high + 1))
+    return counts
+
+
+def _format_counts(counts, dash='-', digits=True):
+    """Inverse of _parse_counts, collapsing runs into ranges"""
+    counts = sorted(counts)
+    if digits and all(count < 10 for count in counts):
+        return ''.join(str(count) for count in counts)
+    runs = []
+    for count in counts:
+        if runs and count == runs[-1][1] + 1:
+            runs[-1][1] = count
+        else:
+            runs.append([count, count])
+    return ','.join(f"{low}" if low == high else f"{low}{dash}{high}" for low, high in runs)
+
+
+class LifeRule:
+    """
+    A totalistic 3D rule compiled into a transition table.
+
+    Args:
+        birth: Counts of live neighbors that bring a dead cell to life
+        survival: Counts that keep a live cell alive
+        states: 2 for plain Life; more for Generations, where a live cell that
+            does not survive passes through states 2..states-1 before dying
+        radius: Moore neighborhood radius (1 is the usual 26 neighbors)
+        include_center: Whether a live cell counts itself (the LtL M1 flag)
+    """
+
+    def __init__(self, birth, survival, states=2, radius=1, include_center=False):
+        if states < 2 or states > 255:
+            raise ValueError(f"Rules need 2 to 255 states, got {states}")
+        if radius < 1:
+            raise ValueError(f"Neighborhood radius must be at least 1, got {radius}")
+
+        self.birth = frozenset(birth)
+        self.survival = frozenset(survival)
+        self.states = states
+        self.radius = radius
+        self.include_center = include_center
+        self.max_count = (2 * radius + 1) ** 3 - (0 if include_center else 1)
+
+        out_of_range = [count for count in self.birth | self.survival if count > self.max_count]
+        if out_of_range:
+            raise ValueError(f"Counts {sorted(out_of_range)} exceed the {self.max_count} neighbors of a radius {radius} rule")
+
+        # transition[state, live neighbor count] -> next state
+        self.transition = np.zeros((states, self.max_count + 1), dtype=np.uint8)
+        counts = np.arange(self.max_count + 1)
+        self.transition[0] = np.isin(counts, list(self.birth))
+        self.transition[1] = np.where(np.isin(counts, list(self.survival)), 1, 2 if states > 2 else 0)
+        for state in range(2, states):
+            self.transition[state] = state + 1 if state + 1 < states else 0
+
+    @property
+    def is_life(self):
+        return self == LIFE
+
+    def __eq__(self, other):
+        return isinstance(other, LifeRule) and self.notation() == other.notation()
+
+    def __hash__(self):
+        return hash(self.notation())
+
+    def __repr__(self):
+        return f"LifeRule('{self.notation()}')"
+
+    def notation(self):
+        """Canonical rule string, accepted back by parse_rule"""
+        if self.radius > 1 or self.include_center:
+            survival = _format_counts(self.survival, '..', digits=False)
+            birth = _format_counts(self.birth, '..', digits=False)
+            return (f"R{self.radius},C{self.states if self.states > 2 else 0},M{int(self.include_center)},"
+                    f"S{survival},B{birth},NM")
+        text = f"B{_format_counts(self.birth)}/S{_format_counts(self.survival)}"
+        return text + (f"/C{self.states}" if self.states > 2 else '')
+
+    def birth_totals(self):
+        """Box-sum totals (cell included) at which a dead cell is born"""
+        return sorted(self.birth)
+
+    def survival_totals(self):
+        """Box-sum totals (cell included) at which a live cell survives"""
+        return sorted(count + (0 if self.include_center else 1) for count in self.survival)
+
+    def clamp(self, grid):
+        """Copy a grid into valid uint8 states, e.g. one saved under another rule"""
+        return np.minimum(grid, self.states - 1).astype(np.uint8)
+
+    def alive(self, state):
+        """Cells that count as live neighbors; dying Generations states do not"""
+        return (state == 1).view(np.uint8)
+
+    def apply(self, state, total):
+        """
+        Step state arrays given their box sums (which include the cell itself).
+
+        Returns:
+            Tuple of (next_state uint8 array, births boolean array)
+        """
+        if self.states == 2 and len(self.birth) + len(self.survival) <= 8:
+            # For small two-state rules a few comparisons beat a table gather
+            live = state == 1
+            born = np.zeros(state.shape, dtype=bool)
+            kept = np.zeros(state.shape, dtype=bool)
+            for value in self.birth_totals():
+                born |= total == value
+            for value in self.survival_totals():
+                kept |= total == value
+            births = born & ~live
+            return (births | (kept & live)).view(np.uint8), births
+
+        index = state.astype(np.intp) * self.transition.shape[1]
+        index += total
+        if not self.include_center:
+            index -= state == 1
+        next_state = self.transition.reshape(-1).take(index)
+        births = (state == 0) & (next_state == 1)
+        return next_state, births
+
+
+def parse_rule(text):
+    """
+    Parse rule notation (or a RULE_PRESETS name) into a LifeRule.
+
+    Raises:
+        ValueError: If the notation cannot be parsed
+    """
+    text = RULE_PRESETS.get(text.strip().lower(), text).strip()
+    if re.match(r'^[Rr]\d', text):
+        return _parse_larger_than_life(text)
+
+    tokens = text.replace(' ', '').split('/')
+    birth = survival = None
+    states = 2
+    if any(token[:1].isalpha() for token in tokens):
+        for token in tokens:
+            key, value = token[:1].upper(), token[1:]
+            if key == 'B':
+                birth = _parse_counts(value)
+            elif key == 'S':
+                survival = _parse_counts(value)
+            elif key in 'CG' and value.isdigit():
+                states = int(value)
+            else:
+                raise ValueError(f"Bad rule token '{token}' in '{text}'")
+    else:
+        # Classic survival/birth[/states] order
+        if len(tokens) not in (2, 3):
+            raise ValueError(f"Bad rule '{text}'")
+        survival, birth = _parse_counts(tokens[0]), _parse_counts(tokens[1])
+        if len(tokens) == 3:
+            states = int(tokens[2])
+
+    if birth is None or survival is None:
+        raise ValueError(f"Rule '{text}' needs both birth and survival counts")
+    return LifeRule(birth, survival, states=max(states, 2))
+
+
+def _parse_larger_than_life(text):
+    """Parse Golly-style 'R2,C0,M0,S4..9,B5..6,NM' notation"""
+    fields = {'S': set(), 'B': set()}
+    radius, states, include_center = 1, 2, False
+    current = None
+    for token in text.replace(' ', '').split(','):
+        key, value = token[:1].upper(), token[1:]
+        if key == 'R' and value.isdigit():
+            radius = int(value)
+        elif key == 'C' and value.isdigit():
+            states = max(int(value), 2)
+        elif key == 'M' and value in ('0', '1'):
+            include_center = value == '1'
+        elif key in fields:
+            current = key
+            fields[key] |= _parse_counts(value)
+        elif key == 'N':
+            if value.upper() != 'M':
+                raise ValueError(f"Only the Moore neighborhood (NM) is supported, got '{token}'")
+        elif token[:1].isdigit() and current:
+            # A bare range continues the previous S or B list
+            fields[current] |= _parse_counts(token)
+        else:
+            raise ValueError(f"Bad rule token '{token}' in '{text}'")
+    return LifeRule(fields['B'], fields['S'], states=states, radius=radius, include_center=include_center)
+
+
+LIFE = LifeRule({3}, {2, 3})
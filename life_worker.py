@@ -0,0 +1,171 @@
+"""
+Background stepping for the Life viewer.
+
+A worker thread computes generation N+1 into a back buffer while the
+renderer shows generation N. The render loop only polls for a finished
+generation and swaps it in at a frame boundary, so it never waits on a step.
+"""
+import threading
+import time
+
+import numpy as np
+
+
+class SteppedGeneration:
+    """One finished generation, handed from the worker to the render loop"""
+
+    def __init__(self, generation, grid, spawned, births, deaths, flips, seconds):
+        self.generation = generation
+        self.grid = grid
+        self.spawned = spawned
+        # Flat indices of cells empty before the step and occupied after it, and the reverse;
+        # unlike spawned, these cover every octant and never list a cell that was already alive
+        self.births = births
+        self.deaths = deaths
+        self.flips = flips
+        self.seconds = seconds
+
+
+class SimulationWorker:
+    """
+    Steps a LifeEngine on a background thread, one generation per request.
+
+    Everything that touches the engine goes through the worker: its lock is
+    held for each step, and load() / replace_engine() discard any result
+    computed from the old state, so a swapped-in generation always follows
+    the grid on screen.
+
+    Args:
+        engine: The LifeEngine to step
+        symmetric: Re-impose mirror symmetry on each stepped grid, inside the
+            engine (on the device, for resident engines) before it is read back
+    """
+
+    def __init__(self, engine, symmetric=False):
+        self.engine = engine
+        self.symmetric = symmetric
+        self.step_seconds = 0.0
+        # Which cells the last generation handed out had occupied, to find deaths against
+        self._occupied = None
+
+        self._lock = threading.Lock()
+        self._wake = threading.Condition()
+        self._token = 0
+        self._wanted = False
+        self._outstanding = False
+        self._ready = None
+        self._stop = False
+
+        self.thread = threading.Thread(target=self._run, name='life-step', daemon=True)
+        self.thread.start()
+
+    @property
+    def busy(self):
+        """Whether a requested generation has not been collected yet"""
+        return self._outstanding
+
+    def request(self):
+        """Ask for the next generation unless one is already on its way"""
+        with self._wake:
+            if self._outstanding:
+                return
+            self._outstanding = True
+            if self.engine.threaded:
+                self._wanted = True
+                self._wake.notify()
+                return
+        # Engines bound to the thread that built them step right here
+        result = self._step()
+        with self._wake:
+            self._ready = result
+
+    def poll(self):
+        """The finished generation, or None if it is not ready; never blocks on a step"""
+        with self._wake:
+            result, self._ready = self._ready, None
+            if result is not None:
+                self._outstanding = False
+            return result
+
+    def step_now(self):
+        """Step on the calling thread, first collecting any generation the worker already made"""
+        with self._lock:
+            result = self.poll()
+            if result is None:
+                result = self._step_locked()
+        return result
+
+    def load(self, grid, generation):
+        """Replace the engine's grid, dropping any generation stepped from the old one"""
+        with self._lock:
+            self._invalidate()
+            self.engine.load(grid)
+            self.engine.generation = generation
+            self._occupied = grid != 0
+
+    def replace_engine(self, engine):
+        """Swap in a new engine (after a backend or rule change), closing the old one"""
+        with self._lock:
+            self._invalidate()
+            self.engine.close()
+            self.engine = engine
+            self._occupied = None
+
+    def close(self):
+        with self._wake:
+            self._stop = True
+            self._wake.notify()
+        self.thread.join()
+        with self._lock:
+            self.engine.close()
+
+    def _invalidate(self):
+        with self._wake:
+            self._token += 1
+            self._wanted = False
+            self._outstanding = False
+            self._ready = None
+
+    def _step(self):
+        with self._lock:
+            return self._step_locked()
+
+    def _step_locked(self):
+        start = time.perf_counter()
+        if self._occupied is None:
+            self._occupied = self.engine.dense() != 0
+        spawned = self.engine.step()
+        if self.symmetric:
+            self.engine.symmetrize()
+        # Copy: some backends reuse the buffers behind dense() on later steps
+        grid = self.engine.dense().copy()
+        if self.symmetric:
+            # Flips outside the fundamental octant were overwritten by its mirror
+            spawned = spawned[grid.reshape(-1)[spawned] != 0]
+        # Diffed here, off the render thread, which then only touches the cells that changed
+        occupied = grid != 0
+        births = np.flatnonzero(occupied & ~self._occupied)
+        deaths = np.flatnonzero(self._occupied & ~occupied)
+        self._occupied = occupied
+        seconds = time.perf_counter() - start
+        self.step_seconds = seconds
+        return SteppedGeneration(self.engine.generation, grid, spawned, births, deaths, self.engine.flips, seconds)
+
+    def _run(self):
+        while True:
+            with self._wake:
+                while not (self._wanted or self._stop):
+                    self._wake.wait()
+                if self._stop:
+                    return
+                self._wanted = False
+                token = self._token
+
+            with self._lock:
+                # A load() since the request means this step would start from a stale grid
+                if token != self._token:
+                    continue
+                result = self._step_locked()
+                # Publish before releasing the lock, or step_now() could step past this result
+                with self._wake:
+                    self._ready = result
@@ -7,17 +7,24 @@ import string
 import os
 import math
 import sys
+from life_engine import LIFE_BACKENDS, PYCUDA_AVAILABLE, create_life_engine, expand_octant
+from life_rules import LIFE, RULE_PRESETS, parse_rule
+from cell_store import CellAttributeStore, CHARS, octant_indices, octant_views
+from flame_colors import flame_colors
+from instanced_renderer import InstancedGlyphRenderer
+from life_checkpoint import load_checkpoint, save_checkpoint
+from life_history import GenerationHistory
+from cycle_detector import CYCLE_ACTIONS, CycleDetector
+from counter_rng import CounterRNG
+from life_worker import SimulationWorker
+from voxel_surface import SurfaceTracker
+from life_isosurface import IsosurfaceRenderer
+from glyph_lod import LOD_DISTANCES, build_lod_meshes, classify
 
-# Try to import PyCUDA, fall back to CPU if not available
-try:
-    import pycuda.autoinit
-    import pycuda.driver as cuda
-    from pycuda.compiler import SourceModule
-    import pycuda.gpuarray as gpuarray
-    PYCUDA_AVAILABLE = True
+# PyCUDA is imported by life_engine; fall back to CPU if not available
+if PYCUDA_AVAILABLE:
     print("PyCUDA available - using GPU acceleration!")
-except ImportError:
-    PYCUDA_AVAILABLE = False
+else:
     print("PyCUDA not available - falling back to CPU computation")
 
 class SymmetricGameOfLife3D(ShowBase):
@@ -46,6 +53,7 @@ class SymmetricGameOfLife3D(ShowBase):
         
         # Flame flicker effects
         self.flicker_time = 0.0
+        self.flicker_frame = 0
         self.base_brightness = 1.0
         self.flicker_intensity = 0.8
         
@@ -55,32 +63,52 @@ class SymmetricGameOfLife3D(ShowBase):
         self.generation = 0
         
         # Game state
-        self.current_grid = np.zeros((self.grid_size, self.grid_size, self.grid_size), dtype=np.int32)
+        # Keyed by (seed, generation, cell), so a seed replays identically on every backend
+        self.rng = CounterRNG()
+        print(f"Random seed: {self.rng.seed}")
+        self.current_grid = np.zeros((self.grid_size, self.grid_size, self.grid_size), dtype=np.uint8)
         self.next_grid = np.zeros_like(self.current_grid)
         
-        # Store cell data - simplified color type as boolean flag
-        self.cell_data = np.empty((self.grid_size, self.grid_size, self.grid_size), dtype=object)
-        for x in range(self.grid_size):
-            for y in range(self.grid_size):
-                for z in range(self.grid_size):
-                    self.cell_data[x, y, z] = {
-                        'char': 'a', 
-                        'is_red': True,  # Simple boolean flag for color type
-                        'alive': False,
-                        'brightness': 1.0,
-                        'base_hue_shift': random.uniform(-0.001, 0.001),
-                        'hue_oscillation_speed': random.uniform(0.5, 3.0),
-                        'hue_oscillation_phase': random.uniform(0, 2 * math.pi),
-                        'brightness_phase': random.uniform(0, 2 * math.pi),
-                        'brightness_speed': random.uniform(5.0, 20.0),
-                        'saturation': random.uniform(0.7, 1.0),
-                        'pulse_phase': random.uniform(0, 2 * math.pi),
-                        'pulse_speed': random.uniform(2.0, 8.0),
-                        'flicker_intensity': random.uniform(0.5, 1.5),
-                        'hue_variation': random.uniform(-0.001, 0.001),
-                        'last_flicker_update': 0.0,
-                        'flicker_interval': random.uniform(0.05, 0.2)
-                    }
+        # Checkpoints; a non-zero interval also saves one every that many generations
+        self.checkpoint_dir = 'checkpoints'
+        self.checkpoint_interval = 0
+        
+        # Recent generations on disk for rewinding and scrubbing
+        self.history = GenerationHistory(self.current_grid.shape, capacity=512)
+        
+        # Still life / oscillator detection and what to do about it (see CYCLE_ACTIONS).
+        # The fundamental octant determines the mirrored grid, so only it is hashed.
+        half_size = self.grid_size // 2
+        self.cycle_detector = CycleDetector((half_size, half_size, half_size), window=64)
+        self.cycle_action = 'noise'
+        self.noise_fraction = 0.02
+        self.base_update_interval = self.update_interval
+        self.max_slowdown = 8
+        
+        # Stepping backend: the GPU when PyCUDA works, otherwise vectorized NumPy
+        self.life_rule = LIFE
+        self.life_backend = 'vectorized'
+        if PYCUDA_AVAILABLE:
+            try:
+                self.life_engine = create_life_engine('gpu', self.grid_size, rng=self.rng)
+                self.life_backend = 'gpu'
+                print(f"CUDA initialized for {self.grid_size}^3 grid")
+            except Exception as e:
+                print(f"CUDA setup failed: {e}")
+        if self.life_backend != 'gpu':
+            self.life_engine = create_life_engine(self.life_backend, self.grid_size, rng=self.rng)
+        
+        # Generation N+1 is stepped on a worker thread while N is on screen
+        self.simulation = SimulationWorker(self.life_engine, symmetric=True)
+        self.status_interval = 10
+        
+        # Cross-fade from the previous generation when steps are further apart than a frame
+        self.crossfade_time = 0.5
+        self.fade_from = None
+        self.fade_start = 0.0
+        
+        # Per-cell glyph and flicker attributes, one typed array per attribute
+        self.cells = CellAttributeStore(self.current_grid.shape, rng=self.rng)
         
         # Color palettes - we'll use these to generate colors based on the flag
         self.red_base_colors = [
@@ -99,11 +127,26 @@ class SymmetricGameOfLife3D(ShowBase):
             (0.4, 0.2, 0.8)
         ]
         
-        # Mesh nodes storage
+        # Blue and red palettes stacked so is_red indexes them directly
+        self.palettes = np.array([self.blue_base_colors, self.red_base_colors], dtype=np.float64)
+        
+        # Mesh nodes storage, with the glyph each grid cell is rendered as (-1 for none)
         self.mesh_nodes = {}
+        # Nodes of cells that just died or were buried, kept until their fade-out ends
+        self.dying_nodes = {}
+        self.rendered_chars = np.full(self.current_grid.shape, -1, dtype=np.int16)
+        
+        # Only cells with an empty face neighbour can be seen; the rest get no glyph
+        self.surface_only = True
+        self.surface = SurfaceTracker(self.current_grid.shape)
+        self.visible = self.surface.mask
         self.char_meshes = {}
         self.load_bam_meshes()
         
+        # Full, decimated and far (quad) glyph meshes, switched by camera distance
+        self.glyph_lod = True
+        self.lod_meshes = {char: build_lod_meshes(char, mesh) for char, mesh in self.char_meshes.items()}
+        
         # Set black background
         self.setBackgroundColor(0, 0, 0, 1)
         
@@ -111,8 +154,15 @@ class SymmetricGameOfLife3D(ShowBase):
         self.setup_camera_controls()
         self.setup_emissive_rendering()
         
-        if PYCUDA_AVAILABLE:
-            self.setup_cuda_simple()
+        # Draw each glyph as one instanced call when the GPU allows it, else one node per cell
+        self.instanced_renderer = None
+        if InstancedGlyphRenderer.is_supported(self.win.getGsg() if self.win else None):
+            self.instanced_renderer = InstancedGlyphRenderer(self.render, self.char_meshes, CHARS)
+        self.use_instancing = self.instanced_renderer is not None
+        
+        # 'glyphs' draws a glyph per visible cell; 'isosurface' one smooth mesh of the live region
+        self.render_mode = 'glyphs'
+        self.isosurface = None
         
         # Initialize with random symmetric pattern
         self.initialize_random_pattern()
@@ -208,9 +258,9 @@ class SymmetricGameOfLife3D(ShowBase):
         ambient_node = self.render.attachNewNode(ambient_light)
         self.render.setLight(ambient_node)
     
-    def get_base_color_for_cell(self, cell_info, brightness):
+    def get_base_color_for_cell(self, is_red, brightness):
         """Get base color based on the is_red flag and brightness"""
-        if cell_info['is_red']:
+        if is_red:
             base_colors = self.red_base_colors
         else:
             base_colors = self.blue_base_colors
@@ -307,7 +357,15 @@ class SymmetricGameOfLife3D(ShowBase):
         if char not in self.char_meshes:
             char = 'a'
             
-        node = self.char_meshes[char].copyTo(self.render)
+        if self.glyph_lod:
+            # Panda's LODNode picks the tier during culling: switches are (out, in) distances
+            node = self.render.attachNewNode(LODNode('glyph_lod'))
+            switches = zip((0.0,) + LOD_DISTANCES, LOD_DISTANCES + (float('inf'),))
+            for mesh, (near, far) in zip(self.lod_meshes[char], switches):
+                node.node().addSwitch(far, near)
+                mesh.instanceTo(node)
+        else:
+            node = self.char_meshes[char].copyTo(self.render)
         node.setPos(position)
         node.setScale(1)
         # Make it a billboard that always faces the camera
@@ -407,76 +465,112 @@ class SymmetricGameOfLife3D(ShowBase):
         """Update flame flicker effects for all alive cells - every frame"""
         dt = globalClock.getDt()
         self.flicker_time += dt
+        current_time = globalClock.getFrameTime()
         
-        for x in range(self.grid_size):
-            for y in range(self.grid_size):
-                for z in range(self.grid_size):
-                    if self.current_grid[x, y, z]:
-                        cell_info = self.cell_data[x, y, z]
-                        
-                        # Update flicker at random intervals for more natural effect
-                        current_time = globalClock.getFrameTime()
-                        if current_time - cell_info['last_flicker_update'] > cell_info['flicker_interval']:
-                            # Randomize flicker intensity
-                            cell_info['flicker_intensity'] = random.uniform(0.5, 1.5)
-                            # Randomize hue variation
-                            cell_info['hue_variation'] = random.uniform(-0.001, 0.001)
-                            # Randomize next update interval
-                            cell_info['flicker_interval'] = random.uniform(0.05, 0.2)
-                            cell_info['last_flicker_update'] = current_time
-                        
-                        brightness_flicker1 = math.sin(self.flicker_time * cell_info['brightness_speed'] + cell_info['brightness_phase'])
-                        brightness_flicker2 = math.sin(self.flicker_time * cell_info['brightness_speed'] * 1.7 + cell_info['brightness_phase'] * 2.3)
-                        brightness_flicker3 = math.sin(self.flicker_time * cell_info['brightness_speed'] * 2.5 + cell_info['brightness_phase'] * 1.4)
-                        
-                        combined_brightness_flicker = (brightness_flicker1 + brightness_flicker2 * 0.7 + brightness_flicker3 * 0.3) / 2.0
-                        
-                        brightness_random = 0.3 + 0.7 * random.random()
-                        cell_info['brightness'] = (self.base_brightness + 
-                                                 combined_brightness_flicker * self.flicker_intensity * brightness_random * cell_info['flicker_intensity'])
-                        
-                        cell_info['brightness'] = max(0.2, min(2.5, cell_info['brightness']))
-                        
-                        if (x, y, z) in self.mesh_nodes:
-                            self.update_cell_visualization(x, y, z)
+        if self.render_mode == 'isosurface':
+            if len(self.isosurface.cells):
+                colors, _ = self.compute_flame_state(self.isosurface.cells, current_time)
+                self.isosurface.update_colors(colors)
+            return Task.cont
+        
+        live, weights = self.fading_cells(current_time)
+        if weights is None and self.dying_nodes:
+            self.release_dying_nodes()
+        if len(live) == 0:
+            if self.use_instancing:
+                # Upload empty batches, or the last live cells would stay drawn
+                self.instanced_renderer.update(np.empty(0, dtype=np.intp), np.empty((0, 3)), np.empty((0, 3)), np.empty(0))
+            return Task.cont
+        
+        colors, scales = self.compute_flame_state(live, current_time)
+        if weights is not None:
+            colors *= weights[:, None]
+            scales *= weights
+        
+        if self.use_instancing:
+            positions = (np.stack(np.unravel_index(live, self.current_grid.shape), axis=1) - self.grid_size/2) * self.voxel_size
+            tiers = classify(positions, self.camera.getPos(self.render)) if self.glyph_lod else None
+            self.instanced_renderer.update(self.cells.char_index.reshape(-1)[live], positions, colors, scales, tiers)
+            return Task.cont
+        
+        for key, color, scale in zip(zip(*np.unravel_index(live, self.current_grid.shape)), colors, scales):
+            mesh_node = self.mesh_nodes.get(key, self.dying_nodes.get(key))
+            if mesh_node is not None:
+                self.apply_cell_appearance(mesh_node, color, scale)
         
         return Task.cont
     
-    def update_cell_visualization(self, x, y, z):
-        """Update the visual appearance of a single cell with flame effect - every frame"""
-        cell_info = self.cell_data[x, y, z]
-        brightness = cell_info['brightness']
-        
-        # Get base color based on the is_red flag
-        base_color = self.get_base_color_for_cell(cell_info, brightness)
-        
-        # Apply hue oscillation based on color type
-        if cell_info['is_red']:
-            hue_oscillation = math.sin(self.flicker_time * cell_info['hue_oscillation_speed'] + cell_info['hue_oscillation_phase']) * 0.15
-        else:
-            hue_oscillation = math.sin(self.flicker_time * cell_info['hue_oscillation_speed'] + cell_info['hue_oscillation_phase']) * 0.2
-        
-        # Apply random hue variation for flicker effect
-        total_hue_shift = cell_info['base_hue_shift'] + hue_oscillation + cell_info['hue_variation']
-        
-        r, g, b = self.apply_hue_shift(base_color[0], base_color[1], base_color[2], total_hue_shift)
-        
-        h, s, v = self.rgb_to_hsv(r, g, b)
-        s *= cell_info['saturation']
-        r, g, b = self.hsv_to_rgb(h, s, v)
-        
-        r = min(1.0, r * brightness)
-        g = min(1.0, g * brightness)
-        b = min(1.0, b * brightness)
+    def fading_cells(self, current_time):
+        """
+        Flat indices of the visible cells to draw and their cross-fade weights.
         
-        pulse = math.sin(self.flicker_time * cell_info['pulse_speed'] + cell_info['pulse_phase']) * 0.1 + 1.0
-        r = min(1.0, r * pulse)
-        g = min(1.0, g * pulse)
-        b = min(1.0, b * pulse)
+        Just after a generation swap, cells born in it fade in and cells that
+        died fade out over crossfade_time (or the step interval, if shorter).
         
-        final_color = Vec4(r, g, b, 1.0)
+        Returns:
+            Tuple of (cells, weights); weights is None once the fade is over
+        """
+        live = self.visible.reshape(-1)
+        duration = min(self.crossfade_time, self.update_interval)
+        progress = (current_time - self.fade_start) / duration if duration > 0 else 1.0
+        if self.fade_from is None or progress >= 1.0:
+            return np.flatnonzero(live), None
+        
+        was_live = self.fade_from.reshape(-1) != 0
+        cells = np.flatnonzero(live | was_live)
+        weights = np.where(live[cells], np.where(was_live[cells], 1.0, progress), 1.0 - progress)
+        return cells, weights
+    
+    def compute_flame_state(self, live, current_time):
+        """
+        Advance flicker for the given flat cell indices in one vectorized pass.
         
-        mesh_node = self.mesh_nodes[(x, y, z)]
+        Returns:
+            Tuple of (colors, scales): an (n, 3) RGB array and an (n,) scale array
+        """
+        cells = self.cells
+        t = self.flicker_time
+        
+        # Re-roll flicker parameters for cells whose random interval has elapsed
+        last_update = cells.last_flicker_update.reshape(-1)
+        due = live[current_time - last_update[live] > cells.flicker_interval.reshape(-1)[live]]
+        frame = self.flicker_frame = self.flicker_frame + 1
+        cells.flicker_intensity.reshape(-1)[due] = self.rng.uniform(frame, 'flicker:intensity', due, 0.5, 1.5)
+        cells.hue_variation.reshape(-1)[due] = self.rng.uniform(frame, 'flicker:hue', due, -0.001, 0.001)
+        cells.flicker_interval.reshape(-1)[due] = self.rng.uniform(frame, 'flicker:interval', due, 0.05, 0.2)
+        last_update[due] = current_time
+        
+        def gather(array):
+            return array.reshape(-1)[live].astype(np.float64)
+        
+        brightness_speed = gather(cells.brightness_speed)
+        brightness_phase = gather(cells.brightness_phase)
+        combined_brightness_flicker = (np.sin(t * brightness_speed + brightness_phase) +
+                                       np.sin(t * brightness_speed * 1.7 + brightness_phase * 2.3) * 0.7 +
+                                       np.sin(t * brightness_speed * 2.5 + brightness_phase * 1.4) * 0.3) / 2.0
+        
+        brightness_random = 0.3 + 0.7 * self.rng.random(frame, 'flicker:brightness', live)
+        brightness = (self.base_brightness +
+                      combined_brightness_flicker * self.flicker_intensity * brightness_random * gather(cells.flicker_intensity))
+        brightness = np.clip(brightness, 0.2, 2.5)
+        cells.brightness.reshape(-1)[live] = brightness
+        
+        # Hue oscillation is wider for blue cells
+        is_red = cells.is_red.reshape(-1)[live]
+        hue_oscillation = np.sin(t * gather(cells.hue_oscillation_speed) + gather(cells.hue_oscillation_phase))
+        hue_oscillation *= np.where(is_red, 0.15, 0.2)
+        hue_shift = gather(cells.base_hue_shift) + hue_oscillation + gather(cells.hue_variation)
+        
+        pulse = np.sin(t * gather(cells.pulse_speed) + gather(cells.pulse_phase)) * 0.1 + 1.0
+        
+        colors = flame_colors(self.palettes, is_red, brightness, hue_shift, gather(cells.saturation), pulse)
+        scales = 0.1 * (0.6 + 0.8 * (brightness - 0.2) / 2.3) * pulse
+        
+        return colors, scales
+    
+    def apply_cell_appearance(self, mesh_node, color, scale):
+        """Write a precomputed flame colour and scale to a single cell node"""
+        final_color = Vec4(color[0], color[1], color[2], 1.0)
         
         # Update material with new emissive color
         material = Material()
@@ -486,64 +580,12 @@ class SymmetricGameOfLife3D(ShowBase):
         material.setLocal(True)
         
         mesh_node.setMaterial(material, 1)
-        
-        scale_variation = 0.6 + 0.8 * (brightness - 0.2) / 2.3
-        mesh_node.setScale(0.1 * scale_variation * pulse)
+        mesh_node.setScale(scale)
     
     def setup_camera_controls(self):
         self.disableMouse()
         self.update_camera_transform()
     
-    def setup_cuda_simple(self):
-        try:
-            cuda_kernel = """
-            __global__ void game_of_life_3d_simple(int *current_grid, int *next_grid, int grid_size) {
-                int x = blockIdx.x * blockDim.x + threadIdx.x;
-                int y = blockIdx.y * blockDim.y + threadIdx.y;
-                int z = blockIdx.z * blockDim.z + threadIdx.z;
-                
-                if (x >= grid_size || y >= grid_size || z >= grid_size) return;
-                
-                int idx = x * grid_size * grid_size + y * grid_size + z;
-                int neighbors = 0;
-                
-                for (int dx = -1; dx <= 1; dx++) {
-                    for (int dy = -1; dy <= 1; dy++) {
-                        for (int dz = -1; dz <= 1; dz++) {
-                            if (dx == 0 && dy == 0 && dz == 0) continue;
-                            int nx = (x + dx + grid_size) % grid_size;
-                            int ny = (y + dy + grid_size) % grid_size;
-                            int nz = (z + dz + grid_size) % grid_size;
-                            int nidx = nx * grid_size * grid_size + ny * grid_size + nz;
-                            if (current_grid[nidx] == 1) neighbors++;
-                        }
-                    }
-                }
-                
-                int current_state = current_grid[idx];
-                int new_state = current_state;
-                
-                if (current_state == 1) {
-                    if (neighbors < 2 || neighbors > 3) new_state = 0;
-                } else {
-                    if (neighbors == 3) new_state = 1;
-                }
-                
-                next_grid[idx] = new_state;
-            }
-            """
-            
-            self.mod = SourceModule(cuda_kernel, options=['-arch=sm_52'])
-            self.game_of_life_kernel = self.mod.get_function("game_of_life_3d_simple")
-            self.current_grid_gpu = gpuarray.to_gpu(self.current_grid.astype(np.int32))
-            self.next_grid_gpu = gpuarray.to_gpu(self.next_grid.astype(np.int32))
-            print(f"CUDA initialized for {self.grid_size}^3 grid")
-            
-        except Exception as e:
-            print(f"CUDA setup failed: {e}")
-            global PYCUDA_AVAILABLE
-            PYCUDA_AVAILABLE = False
-    
     def update_camera_transform(self):
         self.camera.setPos(self.camera_pos)
         self.camera.setHpr(self.camera_hpr)
@@ -641,91 +683,36 @@ class SymmetricGameOfLife3D(ShowBase):
         
         return Task.cont
         
-    def random_char(self):
-        return random.choice(string.ascii_lowercase)
-
-    def random_color_type(self):
-        return random.random() > 0.5  # True for red, False for blue
-
     def initialize_random_pattern(self):
         print("Initializing random symmetric pattern...")
         
         self.current_grid.fill(0)
         self.generation = 0
+        self.cells.generation = 0
+        # A new epoch gives a new pattern while generation numbers restart at 0
+        self.rng.epoch += 1
         
         half_size = self.grid_size // 2
-        
-        for x in range(half_size):
-            for y in range(half_size):
-                for z in range(half_size):
-                    if random.random() > 0.7:
-                        self.current_grid[x, y, z] = 1
-                        self.cell_data[x, y, z] = {
-                            'char': self.random_char(),
-                            'is_red': self.random_color_type(),  # Use boolean flag
-                            'alive': True,
-                            'brightness': 1.0,
-                            'base_hue_shift': random.uniform(-0.001, 0.001),
-                            'hue_oscillation_speed': random.uniform(0.5, 3.0),
-                            'hue_oscillation_phase': random.uniform(0, 2 * math.pi),
-                            'brightness_phase': random.uniform(0, 2 * math.pi),
-                            'brightness_speed': random.uniform(5.0, 20.0),
-                            'saturation': random.uniform(0.7, 1.0),
-                            'pulse_phase': random.uniform(0, 2 * math.pi),
-                            'pulse_speed': random.uniform(2.0, 8.0),
-                            'flicker_intensity': random.uniform(0.5, 1.5),
-                            'hue_variation': random.uniform(-0.001, 0.001),
-                            'last_flicker_update': 0.0,
-                            'flicker_interval': random.uniform(0.05, 0.2)
-                        }
+        octant = self.rng.random(0, 'pattern', np.arange(half_size ** 3)).reshape((half_size,) * 3) > 0.7
+        self.current_grid[:half_size, :half_size, :half_size] = octant
+        self.cells.spawn(self.current_grid != 0, hue_range=0.001)
         
         self.apply_3d_symmetry()
         
-        if PYCUDA_AVAILABLE:
-            self.current_grid_gpu.set(self.current_grid.astype(np.int32))
+        self.upload_grid()
+        self.history.clear()
+        self.history.push(self.generation, self.current_grid)
+        self.cycle_detector.reset(self.fundamental_octant(), self.generation)
         
         live_count = np.sum(self.current_grid)
         print(f"Initialized with {live_count} live cells")
         self.update_visualization()
 
     def apply_3d_symmetry(self):
+        """Mirror the fundamental octant's state and glyphs into the other 7 octants"""
         half_size = self.grid_size // 2
-        
-        for x in range(half_size):
-            for y in range(half_size):
-                for z in range(half_size):
-                    source_data = self.cell_data[x, y, z]
-                    source_alive = self.current_grid[x, y, z]
-                    
-                    symmetric_positions = [
-                        (x, y, z), (self.grid_size - x - 1, y, z),
-                        (x, self.grid_size - y - 1, z), (x, y, self.grid_size - z - 1),
-                        (self.grid_size - x - 1, self.grid_size - y - 1, z),
-                        (self.grid_size - x - 1, y, self.grid_size - z - 1),
-                        (x, self.grid_size - y - 1, self.grid_size - z - 1),
-                        (self.grid_size - x - 1, self.grid_size - y - 1, self.grid_size - z - 1)
-                    ]
-                    
-                    for pos_x, pos_y, pos_z in symmetric_positions:
-                        self.current_grid[pos_x, pos_y, pos_z] = source_alive
-                        self.cell_data[pos_x, pos_y, pos_z] = {
-                            'char': source_data['char'],
-                            'is_red': source_data['is_red'],  # Copy the boolean flag
-                            'alive': bool(source_alive),
-                            'brightness': source_data['brightness'],
-                            'base_hue_shift': random.uniform(-0.01, 0.01),
-                            'hue_oscillation_speed': random.uniform(0.5, 3.0),
-                            'hue_oscillation_phase': random.uniform(0, 2 * math.pi),
-                            'brightness_phase': random.uniform(0, 2 * math.pi),
-                            'brightness_speed': random.uniform(5.0, 20.0),
-                            'saturation': random.uniform(0.7, 1.0),
-                            'pulse_phase': random.uniform(0, 2 * math.pi),
-                            'pulse_speed': random.uniform(2.0, 8.0),
-                            'flicker_intensity': random.uniform(0.5, 1.5),
-                            'hue_variation': random.uniform(-0.001, 0.001),
-                            'last_flicker_update': 0.0,
-                            'flicker_interval': random.uniform(0.05, 0.2)
-                        }
+        self.current_grid[...] = expand_octant(self.current_grid[:half_size, :half_size, :half_size])
+        self.cells.mirror_octant()
 
     def setup_controls(self):
         self.keyMap = {
@@ -764,6 +751,19 @@ class SymmetricGameOfLife3D(ShowBase):
         self.accept('c', self.clear_grid)
         self.accept('n', self.next_generation)
         self.accept('t', self.toggle_auto_rotate)
+        self.accept('i', self.toggle_instancing)
+        self.accept('o', self.toggle_surface_only)
+        self.accept('m', self.toggle_isosurface)
+        self.accept('g', self.toggle_glyph_lod)
+        self.accept('b', self.cycle_life_backend)
+        self.accept('u', self.cycle_life_rule)
+        self.accept('v', self.cycle_cycle_action)
+        self.accept('k', self.save_checkpoint)
+        self.accept('l', self.restore_checkpoint)
+        self.accept('[', self.scrub_history, [-1])
+        self.accept('[-repeat', self.scrub_history, [-1])
+        self.accept(']', self.scrub_history, [1])
+        self.accept(']-repeat', self.scrub_history, [1])
 
     def update_key(self, key, value):
         self.keyMap[key] = value
@@ -773,204 +773,344 @@ class SymmetricGameOfLife3D(ShowBase):
         state = "ON" if self.auto_rotate else "OFF"
         print(f"Auto-rotation {state}")
 
-    def count_alive_neighbors_cpu(self, x, y, z):
-        count = 0
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                for dz in (-1, 0, 1):
-                    if dx == 0 and dy == 0 and dz == 0:
-                        continue
-                    nx = (x + dx) % self.grid_size
-                    ny = (y + dy) % self.grid_size
-                    nz = (z + dz) % self.grid_size
-                    if self.current_grid[nx, ny, nz]:
-                        count += 1
-        return count
-
-    def update_visualization(self):
+    def toggle_instancing(self):
+        if self.instanced_renderer is None:
+            print("Instanced rendering not supported - using per-node rendering")
+            return
+        
+        if self.render_mode != 'glyphs':
+            print("Instancing only applies to glyph rendering")
+            return
+        
+        self.use_instancing = not self.use_instancing
+        if self.use_instancing:
+            # Drop the per-node glyphs; the instanced batches are refreshed every frame
+            for node in self.mesh_nodes.values():
+                node.removeNode()
+            self.mesh_nodes.clear()
+            self.release_dying_nodes()
+            self.rendered_chars.fill(-1)
+            self.instanced_renderer.show()
+        else:
+            self.instanced_renderer.hide()
+            self.update_visualization()
+        
+        state = "instanced" if self.use_instancing else "per-node"
+        print(f"Rendering {state}")
+
+    def update_visible(self, changed=None):
+        """Recompute which cells get a glyph: the surface cells, or every occupied cell"""
+        surface = self.surface.update(self.current_grid, changed)
+        self.visible = surface if self.surface_only else self.surface.occupied
+
+    def toggle_surface_only(self):
+        self.surface_only = not self.surface_only
+        self.update_visualization()
+        state = "ON" if self.surface_only else "OFF"
+        print(f"Surface-only rendering {state}: drawing {np.count_nonzero(self.visible)} "
+              f"of {np.count_nonzero(self.current_grid)} cells")
+
+    def toggle_glyph_lod(self):
+        self.glyph_lod = not self.glyph_lod
+        # Per-node glyphs bake the choice in, so rebuild them
         for node in self.mesh_nodes.values():
             node.removeNode()
         self.mesh_nodes.clear()
+        self.rendered_chars.fill(-1)
+        self.update_visualization()
+        state = "ON" if self.glyph_lod else "OFF"
+        print(f"Glyph LOD {state} (decimated beyond {LOD_DISTANCES[0]:g}, quads beyond {LOD_DISTANCES[1]:g})")
+
+    def toggle_isosurface(self):
+        """Switch between a glyph per cell and one isosurface mesh of the live region"""
+        if self.render_mode == 'glyphs':
+            if self.isosurface is None:
+                self.isosurface = IsosurfaceRenderer(self.render, self.grid_size, self.voxel_size)
+            self.render_mode = 'isosurface'
+            for node in self.mesh_nodes.values():
+                node.removeNode()
+            self.mesh_nodes.clear()
+            self.rendered_chars.fill(-1)
+            if self.instanced_renderer is not None:
+                self.instanced_renderer.hide()
+            self.isosurface.show()
+        else:
+            self.render_mode = 'glyphs'
+            self.isosurface.hide()
+            if self.use_instancing:
+                self.instanced_renderer.show()
         
-        for x in range(self.grid_size):
-            for y in range(self.grid_size):
-                for z in range(self.grid_size):
-                    if self.current_grid[x, y, z]:
-                        cell_info = self.cell_data[x, y, z]
-                        world_x = (x - self.grid_size/2) * self.voxel_size
-                        world_y = (y - self.grid_size/2) * self.voxel_size  
-                        world_z = (z - self.grid_size/2) * self.voxel_size
-                        
-                        mesh_node = self.create_mesh_node(
-                            cell_info['char'], 
-                            cell_info['is_red'],  # Pass the boolean flag
-                            Point3(world_x, world_y, world_z)
-                        )
-                        self.mesh_nodes[(x, y, z)] = mesh_node
-
-    def next_generation_gpu(self):
-        threads_per_block = (4, 4, 4)
-        blocks_per_grid = (
-            (self.grid_size + threads_per_block[0] - 1) // threads_per_block[0],
-            (self.grid_size + threads_per_block[1] - 1) // threads_per_block[1],
-            (self.grid_size + threads_per_block[2] - 1) // threads_per_block[2]
-        )
-        
-        self.game_of_life_kernel(
-            self.current_grid_gpu, 
-            self.next_grid_gpu, 
-            np.int32(self.grid_size),
-            block=threads_per_block,
-            grid=blocks_per_grid
-        )
+        self.update_visualization()
+        print(f"Rendering {self.render_mode}")
+
+    def update_visualization(self, changed=None):
+        """
+        Diff the rendered glyphs against the visible cells, touching only those
+        that appeared, vanished or changed glyph. changed, if known, lists the
+        flat indices of the cells that came alive or died since the last call.
+        """
+        # A new diff restarts the fade, so whatever was still fading out goes now
+        self.release_dying_nodes()
+        self.update_visible(changed)
+        if self.render_mode == 'isosurface':
+            self.isosurface.build(self.current_grid)
+            return
+        if self.use_instancing:
+            return
+        
+        wanted = np.where(self.visible, self.cells.char_index.astype(np.int16), -1)
+        changed = self.rendered_chars != wanted
+        
+        # Deaths and newly buried cells fade out before their nodes go (see fading_cells);
+        # survivors whose glyph was respawned are swapped straight away
+        for key in zip(*np.nonzero(changed & (self.rendered_chars >= 0))):
+            node = self.mesh_nodes.pop(key)
+            if wanted[key] < 0 and self.fade_from is not None:
+                self.dying_nodes[key] = node
+            else:
+                node.removeNode()
         
-        self.current_grid_gpu, self.next_grid_gpu = self.next_grid_gpu, self.current_grid_gpu
-        self.current_grid = self.current_grid_gpu.get()
-
-    def next_generation_cpu(self):
-        temp_grid = np.zeros_like(self.current_grid)
-        
-        for x in range(self.grid_size):
-            for y in range(self.grid_size):
-                for z in range(self.grid_size):
-                    neighbors = self.count_alive_neighbors_cpu(x, y, z)
-                    current_state = self.current_grid[x, y, z]
-                    new_state = current_state
-                    
-                    if current_state:
-                        if neighbors < 2 or neighbors > 3:
-                            new_state = 0
-                    else:
-                        if neighbors == 3:
-                            new_state = 1
-                            self.cell_data[x, y, z] = {
-                                'char': self.random_char(),
-                                'is_red': self.random_color_type(),  # Use boolean flag
-                                'alive': True,
-                                'brightness': 1.0,
-                                'base_hue_shift': random.uniform(-0.01, 0.01),
-                                'hue_oscillation_speed': random.uniform(0.5, 3.0),
-                                'hue_oscillation_phase': random.uniform(0, 2 * math.pi),
-                                'brightness_phase': random.uniform(0, 2 * math.pi),
-                                'brightness_speed': random.uniform(5.0, 20.0),
-                                'saturation': random.uniform(0.7, 1.0),
-                                'pulse_phase': random.uniform(0, 2 * math.pi),
-                                'pulse_speed': random.uniform(2.0, 8.0),
-                                'flicker_intensity': random.uniform(0.5, 1.5),
-                                'hue_variation': random.uniform(-0.01, 0.01),
-                                'last_flicker_update': 0.0,
-                                'flicker_interval': random.uniform(0.05, 0.2)
-                            }
-                    
-                    if random.random() < 0.002:
-                        new_state = 1 - new_state
-                        if new_state:
-                            self.cell_data[x, y, z] = {
-                                'char': self.random_char(),
-                                'is_red': self.random_color_type(),  # Use boolean flag
-                                'alive': True,
-                                'brightness': 1.0,
-                                'base_hue_shift': random.uniform(-0.01, 0.01),
-                                'hue_oscillation_speed': random.uniform(0.5, 3.0),
-                                'hue_oscillation_phase': random.uniform(0, 2 * math.pi),
-                                'brightness_phase': random.uniform(0, 2 * math.pi),
-                                'brightness_speed': random.uniform(5.0, 20.0),
-                                'saturation': random.uniform(0.7, 1.0),
-                                'pulse_phase': random.uniform(0, 2 * math.pi),
-                                'pulse_speed': random.uniform(2.0, 8.0),
-                                'flicker_intensity': random.uniform(0.5, 1.5),
-                                'hue_variation': random.uniform(-0.01, 0.01),
-                                'last_flicker_update': 0.0,
-                                'flicker_interval': random.uniform(0.05, 0.2)
-                            }
-                    
-                    temp_grid[x, y, z] = new_state
-        
-        self.current_grid = temp_grid
+        # Births and newly exposed cells, plus the replacement nodes for respawned glyphs
+        for x, y, z in zip(*np.nonzero(changed & (wanted >= 0))):
+            world_x = (x - self.grid_size/2) * self.voxel_size
+            world_y = (y - self.grid_size/2) * self.voxel_size  
+            world_z = (z - self.grid_size/2) * self.voxel_size
+            
+            mesh_node = self.create_mesh_node(
+                self.cells.char_at(x, y, z), 
+                self.cells.is_red[x, y, z],  # Pass the boolean flag
+                Point3(world_x, world_y, world_z)
+            )
+            self.mesh_nodes[(x, y, z)] = mesh_node
+        
+        self.rendered_chars = wanted
+
+    def release_dying_nodes(self):
+        """Remove the nodes kept for cells fading out"""
+        for node in self.dying_nodes.values():
+            node.removeNode()
+        self.dying_nodes.clear()
+
+    def upload_grid(self):
+        """Push the host grid to whichever backend steps it, dropping any generation stepped ahead"""
+        self.simulation.load(self.current_grid, self.generation)
+
+    def cycle_life_backend(self):
+        names = [name for name, engine in LIFE_BACKENDS.items()
+                 if engine.realtime and engine.supports(self.life_rule)]
+        index = names.index(self.life_backend) if self.life_backend in names else -1
+        self.life_backend = names[(index + 1) % len(names)]
+        self.rebuild_life_engine()
+        print(f"Life backend: {self.life_backend}")
+
+    def cycle_life_rule(self):
+        names = list(RULE_PRESETS)
+        rules = [parse_rule(name) for name in names]
+        index = rules.index(self.life_rule) if self.life_rule in rules else -1
+        self.set_life_rule(rules[(index + 1) % len(rules)])
+        print(f"Life rule: {names[(index + 1) % len(names)]} ({self.life_rule.notation()})")
+
+    def set_life_rule(self, rule):
+        """Switch rules, moving to the vectorized backend if the current one cannot run it"""
+        self.life_rule = rule
+        if not LIFE_BACKENDS[self.life_backend].supports(rule):
+            print(f"The {self.life_backend} backend does not support {rule.notation()} - using vectorized")
+            self.life_backend = 'vectorized'
+        self.rebuild_life_engine()
+        if self.history.packed != (rule.states <= 2):
+            # Generations rules need a state byte per cell; two-state rules go back to packed bits
+            capacity = self.history.capacity
+            self.history.close()
+            self.history = GenerationHistory(self.current_grid.shape, capacity, states=rule.states)
+            self.history.push(self.generation, self.current_grid)
+
+    def rebuild_life_engine(self):
+        """Replace the engine with one for life_backend and life_rule, keeping the grid"""
+        # clamp copies, so the grid outlives memory the old engine is about to release
+        self.current_grid = self.life_rule.clamp(self.current_grid)
+        self.life_engine = create_life_engine(self.life_backend, self.grid_size, rng=self.rng, rule=self.life_rule)
+        self.simulation.replace_engine(self.life_engine)
+        self.upload_grid()
 
     def update_simulation(self, task):
+        """Swap in the generation the worker stepped ahead, if it is due and ready, and queue the next"""
         current_time = globalClock.getFrameTime()
         if self.running and (current_time - self.last_update_time) >= self.update_interval:
-            self.next_generation()
-            self.last_update_time = current_time
+            result = self.simulation.poll()
+            if result is not None:
+                self.apply_generation(result)
+                self.last_update_time = current_time
+            self.simulation.request()
         return Task.cont
 
     def next_generation(self):
-        self.generation += 1
-        
-        if PYCUDA_AVAILABLE:
-            self.next_generation_gpu()
-        else:
-            self.next_generation_cpu()
-        
+        """Step once right away, e.g. for the 'n' key"""
+        self.apply_generation(self.simulation.step_now())
+
+    def apply_generation(self, result):
+        """Make a stepped generation the one on screen: newborn cell data, history and cycle checks"""
+        self.generation = self.cells.generation = result.generation
+        self.current_grid = result.grid
+        self.cells.spawn(np.unravel_index(result.spawned, self.current_grid.shape))
+        self.cells.mirror_octant(self.fundamental_octant() != 0)
+        self.history.push(self.generation, self.current_grid)
+        
+        self.fade_from = self.visible.copy()
+        self.fade_start = globalClock.getFrameTime()
+        
+        if self.generation % self.status_interval == 0:
+            live_count = np.count_nonzero(self.current_grid)
+            print(f"Generation {self.generation}: {live_count} live cells ({result.seconds * 1000:.1f} ms step)")
+        # The worker diffed the grids off-thread, so the surface and cycle checks touch only changed cells
+        changed = np.union1d(result.births, result.deaths)
+        self.update_visualization(changed)
+        
+        flips = octant_indices(result.flips, self.current_grid.shape)
+        period = self.cycle_detector.observe(self.generation, octant_indices(changed, self.current_grid.shape), flips)
+        if period is not None:
+            self.handle_cycle(period)
+        elif self.update_interval != self.base_update_interval:
+            self.update_interval = self.base_update_interval
+            print("Activity resumed - normal speed")
+        
+        if self.checkpoint_interval and self.generation % self.checkpoint_interval == 0:
+            self.save_checkpoint()
+
+    def fundamental_octant(self):
         half_size = self.grid_size // 2
-        for x in range(half_size):
-            for y in range(half_size):
-                for z in range(half_size):
-                    if self.current_grid[x, y, z]:
-                        source_data = self.cell_data[x, y, z]
-                        symmetric_positions = [
-                            (self.grid_size - x - 1, y, z),
-                            (x, self.grid_size - y - 1, z),
-                            (x, y, self.grid_size - z - 1),
-                            (self.grid_size - x - 1, self.grid_size - y - 1, z),
-                            (self.grid_size - x - 1, y, self.grid_size - z - 1),
-                            (x, self.grid_size - y - 1, self.grid_size - z - 1),
-                            (self.grid_size - x - 1, self.grid_size - y - 1, self.grid_size - z - 1)
-                        ]
-                        for pos_x, pos_y, pos_z in symmetric_positions:
-                            self.current_grid[pos_x, pos_y, pos_z] = 1
-                            self.cell_data[pos_x, pos_y, pos_z] = {
-                                'char': source_data['char'],
-                                'is_red': source_data['is_red'],  # Copy the boolean flag
-                                'alive': True,
-                                'brightness': source_data['brightness'],
-                                'base_hue_shift': random.uniform(-0.01, 0.01),
-                                'hue_oscillation_speed': random.uniform(0.5, 3.0),
-                                'hue_oscillation_phase': random.uniform(0, 2 * math.pi),
-                                'brightness_phase': random.uniform(0, 2 * math.pi),
-                                'brightness_speed': random.uniform(5.0, 20.0),
-                                'saturation': random.uniform(0.7, 1.0),
-                                'pulse_phase': random.uniform(0, 2 * math.pi),
-                                'pulse_speed': random.uniform(2.0, 8.0),
-                                'flicker_intensity': random.uniform(0.5, 1.5),
-                                'hue_variation': random.uniform(-0.01, 0.01),
-                                'last_flicker_update': 0.0,
-                                'flicker_interval': random.uniform(0.05, 0.2)
-                            }
+        return self.current_grid[:half_size, :half_size, :half_size]
+
+    def handle_cycle(self, period):
+        """Apply cycle_action once the grid repeats the state from period generations ago"""
+        kind = "Still life" if period == 1 else f"Period-{period} cycle"
+        if self.cycle_action == 'reseed':
+            print(f"{kind} detected - reseeding")
+            self.initialize_random_pattern()
+        elif self.cycle_action == 'noise':
+            print(f"{kind} detected - injecting noise")
+            self.inject_noise()
+        elif self.cycle_action == 'slow':
+            slowest = self.base_update_interval * self.max_slowdown
+            if self.update_interval < slowest:
+                self.update_interval = min(self.update_interval * 2, slowest)
+                print(f"{kind} detected - stepping every {self.update_interval:g}s")
+
+    def cycle_cycle_action(self):
+        self.cycle_action = CYCLE_ACTIONS[(CYCLE_ACTIONS.index(self.cycle_action) + 1) % len(CYCLE_ACTIONS)]
+        self.update_interval = self.base_update_interval
+        print(f"On cycle: {self.cycle_action}")
+
+    def inject_noise(self):
+        """Toggle a random noise_fraction of the fundamental octant and its mirrors"""
+        half_size = self.grid_size // 2
+        noise = self.rng.random(self.generation, 'noise', np.arange(half_size ** 3))
+        mask = noise.reshape((half_size,) * 3) < self.noise_fraction
+        grid_views = octant_views(self.current_grid)
+        for view in grid_views:
+            view[mask] ^= 1
+        
+        # Cells the noise brought to life get fresh glyphs, mirrored like everything else
+        born = mask & (grid_views[0] != 0)
+        self.cells.generation = self.generation
+        self.cells.spawn(np.nonzero(born))
+        self.cells.mirror_octant(born)
+        
+        self.upload_grid()
+        self.history.push(self.generation, self.current_grid)
+        self.cycle_detector.reset(self.fundamental_octant(), self.generation)
+        self.update_visualization()
+
+    def checkpoint_path(self, generation):
+        # Generations restart at 0 with every new pattern and the epoch with every session;
+        # the seed (fresh per session unless restored) and epoch together keep runs apart
+        return os.path.join(self.checkpoint_dir,
+                            f"seed_{self.rng.seed:016x}_epoch_{self.rng.epoch:03d}_generation_{generation:06d}.life")
+
+    def save_checkpoint(self):
+        """Save grid, cell attributes and RNG state so the run can resume exactly from here"""
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        path = self.checkpoint_path(self.generation)
+        attributes = self.cells.arrays()
+        if self.life_rule.states > 2:
+            # The packed grid only says which cells are non-zero; keep the dying states too
+            attributes['life_state'] = self.current_grid
+        save_checkpoint(path, self.current_grid, self.generation,
+                        attributes=attributes, rng=self.rng,
+                        metadata={'life_backend': self.life_backend, 'life_rule': self.life_rule.notation()})
+        print(f"Checkpoint saved: {path}")
+
+    def restore_checkpoint(self, path=None):
+        """Resume from a checkpoint file, by default the newest one in checkpoint_dir"""
+        if path is None:
+            saved = [os.path.join(self.checkpoint_dir, name) for name in os.listdir(self.checkpoint_dir)
+                     if name.endswith('.life')] if os.path.isdir(self.checkpoint_dir) else []
+            if not saved:
+                print(f"No checkpoints in {self.checkpoint_dir}")
+                return
+            # Newest by save time: names only order generations within one run
+            path = max(saved, key=os.path.getmtime)
+        
+        checkpoint = load_checkpoint(path)
+        if checkpoint.shape != self.current_grid.shape:
+            print(f"Checkpoint {path} is {checkpoint.shape[0]}^3, grid is {self.grid_size}^3")
+            checkpoint.close()
+            return
+        
+        attributes = checkpoint.attributes()
+        self.current_grid = attributes.pop('life_state', None)
+        if self.current_grid is None:
+            self.current_grid = checkpoint.dense()
+        self.cells.load_arrays(attributes)
+        rule = parse_rule(checkpoint.metadata.get('life_rule', LIFE.notation()))
+        if rule != self.life_rule:
+            self.set_life_rule(rule)
+        self.generation = self.cells.generation = checkpoint.generation
+        # Checkpoints from before the counter-based RNG hold a numpy state; keep the current seed then
+        if (checkpoint.header['rng'] or {}).get('counter_rng'):
+            checkpoint.restore_rng(self.rng)
+        checkpoint.close()
+        
+        self.upload_grid()
+        self.history.clear()
+        self.history.push(self.generation, self.current_grid)
+        self.cycle_detector.reset(self.fundamental_octant(), self.generation)
+        self.update_visualization()
+        print(f"Checkpoint restored: {path} (generation {self.generation})")
+
+    def scrub_history(self, delta):
+        """
+        Pause and step through stored generations; stepping forward past the
+        newest stored one computes it. Resuming continues from the shown generation.
+        """
+        if self.running:
+            self.toggle_simulation()
         
-        live_count = np.sum(self.current_grid)
-        print(f"Generation {self.generation}: {live_count} live cells")
+        target = self.generation + delta
+        if target not in self.history:
+            if delta > 0 and self.generation == self.history.newest:
+                self.next_generation()
+            else:
+                print(f"Generation {target} is not in the history "
+                      f"({self.history.oldest}-{self.history.newest})")
+            return
+        
+        self.current_grid = self.history.get(target)
+        self.generation = self.cells.generation = target
+        self.upload_grid()
+        self.cycle_detector.reset(self.fundamental_octant(), self.generation)
         self.update_visualization()
+        print(f"Generation {self.generation} (history {self.history.oldest}-{self.history.newest})")
 
     def clear_grid(self):
         self.current_grid.fill(0)
-        self.generation = 0
+        self.generation = self.cells.generation = 0
         
-        for x in range(self.grid_size):
-            for y in range(self.grid_size):
-                for z in range(self.grid_size):
-                    self.cell_data[x, y, z] = {
-                        'char': 'a', 
-                        'is_red': True,  # Use boolean flag
-                        'alive': False,
-                        'brightness': 1.0,
-                        'base_hue_shift': random.uniform(-0.01, 0.01),
-                        'hue_oscillation_speed': random.uniform(0.5, 3.0),
-                        'hue_oscillation_phase': random.uniform(0, 2 * math.pi),
-                        'brightness_phase': random.uniform(0, 2 * math.pi),
-                        'brightness_speed': random.uniform(5.0, 20.0),
-                        'saturation': random.uniform(0.7, 1.0),
-                        'pulse_phase': random.uniform(0, 2 * math.pi),
-                        'pulse_speed': random.uniform(2.0, 8.0),
-                        'flicker_intensity': random.uniform(0.5, 1.5),
-                        'hue_variation': random.uniform(-0.01, 0.01),
-                        'last_flicker_update': 0.0,
-                        'flicker_interval': random.uniform(0.05, 0.2)
-                    }
+        self.cells.reset()
         
-        if PYCUDA_AVAILABLE:
-            self.current_grid_gpu.set(self.current_grid.astype(np.int32))
+        self.upload_grid()
+        self.history.clear()
+        self.history.push(self.generation, self.current_grid)
+        self.cycle_detector.reset(self.fundamental_octant(), self.generation)
         
         self.update_visualization()
         print("Grid cleared")
@@ -981,9 +1121,13 @@ class SymmetricGameOfLife3D(ShowBase):
         print(f"Simulation {state}")
 
     def quit(self):
+        self.simulation.close()
+        self.history.close()
         self.destroy()
         sys.exit(0)
 
 if __name__ == "__main__":
     app = SymmetricGameOfLife3D()
+    if len(sys.argv) > 1:
+        app.restore_checkpoint(sys.argv[1])
     app.run()
\ No newline at end of file
@@ -8,6 +8,7 @@ import os
 import math
 import sys
 from motion_blur import MotionBlur
+from glyph_pool import GlyphPool
 from panda3d.core import Fog
 from panda3d.core import loadPrcFileData
 
@@ -70,6 +71,9 @@ class FractalFireworks(ShowBase):
         self.setBackgroundColor(0, 0.005, 0.01, 1)
         self.setup_emissive_rendering()
         self.load_bam_meshes()
+        # Glyph copies are recycled rather than copied and destroyed as fireworks burst and fade
+        self.glyph_pool = GlyphPool(self.char_meshes)
+        self.taskMgr.doMethodLater(GlyphPool.TRIM_INTERVAL, self.glyph_pool.trim_task, "trim_glyph_pool")
         self.setup_camera()
         self.setup_ground_plane()
         
@@ -274,7 +278,7 @@ class FractalFireworks(ShowBase):
         # Remove dead flares
         for flare in flares_to_remove:
             if flare['node']:
-                flare['node'].removeNode()
+                self.glyph_pool.release(flare['node'])
             self.flares.remove(flare)
         
         return Task.cont
@@ -284,7 +288,7 @@ class FractalFireworks(ShowBase):
         if letter not in self.char_meshes:
             letter = '•'
             
-        node = self.char_meshes[letter].copyTo(self.render)
+        node = self.glyph_pool.acquire(letter, self.render)
         node.setPos(position)
         node.setScale(1.8 * brightness)  # Larger scale
         
@@ -370,7 +374,7 @@ class FractalFireworks(ShowBase):
         # Remove dead ignitions
         for ignition in ignitions_to_remove:
             if ignition['node']:
-                ignition['node'].removeNode()
+                self.glyph_pool.release(ignition['node'])
             self.ignitions.remove(ignition)
         
         return Task.cont
@@ -13,8 +13,6 @@ from panda3d.core import Fog
 from panda3d.core import loadPrcFileData
 from audio3d import Audio3d
 from panda3d.core import ClockObject
-import threading
-from queue import Queue
 
 # Configure before ShowBase initializes
 loadPrcFileData("", """
@@ -38,14 +36,6 @@ class StarfieldTunnel(ShowBase):
         # Choose the fog mode
         fog.setLinearRange(2, 8)
         fog.setExpDensity(0.05)
-        self.cell_creation_queue = Queue()
-        self.creation_thread = None
-        self.should_stop_creation = False
-        self.pending_cells = {}  # Track cells being created
-        self.pending_cells_lock = threading.Lock()  # Thread safety
-        
-        # Start the background thread after everything else is initialized
-        self.start_creation_thread()
         # Base frequency: 220Hz (A3) with playRate 1.0
         self.base_freq = 220.0
         # Camera velocity tracking
@@ -317,12 +307,6 @@ class StarfieldTunnel(ShowBase):
         
         return Task.cont
 
-    def start_creation_thread(self):
-        """Start background thread for cell creation"""
-        self.creation_thread = threading.Thread(target=self._cell_creation_worker, daemon=True)
-        self.creation_thread.start()
-        print("Background cell creation thread started")
-        
     def setup_drum_loop(self):
         """Setup looping drum beat that changes speed with camera velocity"""
         try:
@@ -371,102 +355,6 @@ class StarfieldTunnel(ShowBase):
             
             self.drum_sound.setPlayRate(smoothed_rate)
 
-    def _cell_creation_worker(self):
-        """Background worker for creating cells"""
-        while not self.should_stop_creation:
-            try:
-                # Get creation task from queue
-                task_data = self.cell_creation_queue.get(timeout=0.1)
-                if task_data is None:  # Stop signal
-                    break
-                    
-                cell_key, x, z, y, slice_rotation = task_data
-                self._create_cell_in_background(cell_key, x, z, y, slice_rotation)
-                
-                self.cell_creation_queue.task_done()
-            except:
-                pass  # Timeout, continue
-
-    def _create_cell_in_background(self, cell_key, x, z, y, slice_rotation):
-        """Create a cell in the background thread (mesh creation only)"""
-        try:
-            # Apply slice rotation to position
-            cos_rot = math.cos(slice_rotation)
-            sin_rot = math.sin(slice_rotation)
-            
-            # Rotate around Y axis
-            rotated_x = x * cos_rot - z * sin_rot
-            rotated_z = x * sin_rot + z * cos_rot
-            
-            world_x = rotated_x * 1.0
-            world_z = rotated_z * 1.0
-            world_y = y
-            
-            char = self.random_char()
-            
-            # Create cell data structure
-            cell_data = {
-                'char': char,
-                'is_red': self.random_color_type(),
-                'brightness': random.uniform(0.8, 1.5),
-                'flicker_speed': random.uniform(3.0, 8.0),
-                'flicker_phase': random.uniform(0, 2 * math.pi),
-                'hue_shift': random.uniform(-0.2, 0.2),
-                'pulse_speed': random.uniform(1.0, 4.0),
-                'pulse_phase': random.uniform(0, 2 * math.pi),
-                'world_pos': (world_x, world_y, world_z),
-                'slice_rotation': slice_rotation,
-                'base_pos': (x, z),
-                'last_played': 0.0
-            }
-            
-            # Create the mesh node in the background
-            if char not in self.char_meshes:
-                char = 'a'
-                
-            # This is the expensive part - creating the mesh
-            node = self.char_meshes[char].copyTo(NodePath())  # Don't attach to render yet
-            node.setPos(world_x, world_y, world_z)
-            node.setScale(0.08)
-            
-            # Set up visual properties
-            if cell_data['is_red']:
-                base_color = self.red_color
-            else:
-                base_color = self.blue_color
-                
-            color = Vec4(
-                base_color.x * cell_data['brightness'],
-                base_color.y * cell_data['brightness'],
-                base_color.z * cell_data['brightness'],
-                1.0
-            )
-            
-            material = Material()
-            material.setShininess(1.0)
-            material.setEmission(color)
-            material.setLocal(True)
-            
-            node.setColor(color)
-            node.setMaterial(material, 1)
-            node.setLightOff()
-            node.setTwoSided(True)
-            
-            # Store the prepared cell for main thread to finalize
-            with self.pending_cells_lock:
-                self.pending_cells[cell_key] = {
-                    'cell_data': cell_data,
-                    'node': node,
-                    'world_pos': (world_x, world_y, world_z)
-                }
-                
-        except Exception as e:
-            print(f"Error creating cell in background: {e}")
-
-    def queue_cell_creation(self, cell_key, x, z, y, slice_rotation):
-        """Queue a cell for creation in background thread"""
-        self.cell_creation_queue.put((cell_key, x, z, y, slice_rotation))
-        
     def setup_emissive_rendering(self):
         """Setup emissive rendering"""
         self.render.clearLight()
@@ -836,12 +724,6 @@ class StarfieldTunnel(ShowBase):
         return Task.cont
         
     def quit(self):
-        # Stop background thread
-        self.should_stop_creation = True
-        self.cell_creation_queue.put(None)  # Signal to stop
-        if self.creation_thread:
-            self.creation_thread.join(timeout=6.0)
-        
         # Clean up audio
         if hasattr(self, 'audio3d'):
             self.audio3d.stopLoopingAudio()
@@ -9,6 +9,7 @@ import math
 import sys
 import uuid
 from motion_blur import MotionBlur
+from glyph_pool import GlyphPool
 from panda3d.core import Fog
 from panda3d.core import loadPrcFileData
 from audio3d import Audio3d
@@ -228,6 +229,7 @@ class OceanOfLetters(ShowBase):
         # Setup
         self.setup_emissive_rendering()
         self.load_bam_meshes()
+        self.glyph_pool = GlyphPool(self.char_meshes)
         self.setup_camera()
         
         # Motion blur
@@ -321,7 +323,7 @@ class OceanOfLetters(ShowBase):
         
         try:
             # Create the mesh node
-            node = self.char_meshes[char].copyTo(self.render)
+            node = self.glyph_pool.acquire(char, self.render)
             node.setPos(*particle['position'])
             node.setScale(particle['scale'])
             node.setR(particle['rotation'])
@@ -0,0 +1,8 @@
+#version 140
+
+in vec4 glyph_color;
+out vec4 fragColor;
+
+void main() {
+    fragColor = glyph_color;
+}
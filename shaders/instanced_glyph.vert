@@ -0,0 +1,21 @@
+#version 140
+
+in vec4 p3d_Vertex;
+
+uniform mat4 p3d_ModelViewMatrix;
+uniform mat4 p3d_ProjectionMatrix;
+
+// Two texels per instance: (x, y, z, scale) then (r, g, b, a)
+uniform samplerBuffer instance_data;
+
+out vec4 glyph_color;
+
+void main() {
+    vec4 placement = texelFetch(instance_data, gl_InstanceID * 2);
+    glyph_color = texelFetch(instance_data, gl_InstanceID * 2 + 1);
+
+    // Billboard: lay the glyph's XZ plane flat against the view plane
+    vec4 center = p3d_ModelViewMatrix * vec4(placement.xyz, 1.0);
+    vec3 offset = vec3(p3d_Vertex.x, p3d_Vertex.z, -p3d_Vertex.y) * placement.w;
+    gl_Position = p3d_ProjectionMatrix * (center + vec4(offset, 0.0));
+}
@@ -9,6 +9,8 @@ import math
 import sys
 import uuid
 from motion_blur import MotionBlur
+from tunnel_layers import TunnelLayers
+from glyph_pool import GlyphPool
 from panda3d.core import Fog
 from panda3d.core import loadPrcFileData
 from audio3d import Audio3d
@@ -105,6 +107,8 @@ class StarfieldTunnel(ShowBase):
         
         # Storage
         self.cells = {}
+        # Cells grouped by tunnel slice, each slice under its own rotating node
+        self.tunnel = TunnelLayers(self.layer_spacing, self.render)
         self.mesh_nodes = {}
         self.char_meshes = {}
         self.slice_rotations = {}
@@ -114,6 +118,9 @@ class StarfieldTunnel(ShowBase):
         self.setBackgroundColor(0, 0, 0, 0)
         self.setup_emissive_rendering()
         self.load_bam_meshes()
+        # Glyph copies are recycled rather than copied and destroyed as cells come and go
+        self.glyph_pool = GlyphPool(self.char_meshes)
+        self.taskMgr.doMethodLater(GlyphPool.TRIM_INTERVAL, self.glyph_pool.trim_task, "trim_glyph_pool")
         self.setup_camera()
         self.audio3d = Audio3d(self.sfxManagerList, self.camera)
         # Initialize tunnel
@@ -245,29 +252,17 @@ class StarfieldTunnel(ShowBase):
         
         for layer in range(self.tunnel_layers):
             layer_y = layer * self.layer_spacing
-            slice_rotation = self.get_slice_rotation(layer_y)
             
             for x in range(-half_size, half_size + 1):
                 for z in range(-half_size, half_size + 1):
                     distance = math.sqrt(x*x + z*z)
                     if distance <= half_size and random.random() > 0.6:
-                        self.create_cell(x, z, layer_y, slice_rotation)
+                        self.create_cell(x, z, layer_y)
     
-    def create_cell(self, x, z, y, slice_rotation):
-        """Create a cell at specific 3D position with slice rotation"""
+    def create_cell(self, x, z, y):
+        """Create a cell at offset (x, z) within slice y; the slice node carries its rotation"""
         cell_key = (x, z, y)
-        
-        # Apply slice rotation to position
-        cos_rot = math.cos(slice_rotation)
-        sin_rot = math.sin(slice_rotation)
-        
-        # Rotate around Y axis
-        rotated_x = x * cos_rot - z * sin_rot
-        rotated_z = x * sin_rot + z * cos_rot
-        
-        world_x = rotated_x * 1.0
-        world_z = rotated_z * 1.0
-        world_y = y
+        self.tunnel.layer_for(y).cell_keys.add(cell_key)
         
         char = self.random_char()
         self.cells[cell_key] = {
@@ -279,23 +274,21 @@ class StarfieldTunnel(ShowBase):
             'hue_shift': random.uniform(-0.2, 0.2),
             'pulse_speed': random.uniform(1.0, 4.0),
             'pulse_phase': random.uniform(0, 2 * math.pi),
-            'world_pos': (world_x, world_y, world_z),
-            'slice_rotation': slice_rotation,
             'base_pos': (x, z),
             'last_played': 0.0
         }
         
-        self.create_cell_node(cell_key, world_x, world_y, world_z)
+        self.create_cell_node(cell_key, x, 0, z)
     
     def create_cell_node(self, cell_key, x, y, z):
-        """Create visual representation of a cell"""
+        """Create visual representation of a cell at an offset within its slice node"""
         cell_data = self.cells[cell_key]
         char = cell_data['char']
         
         if char not in self.char_meshes:
             char = 'a'
             
-        node = self.char_meshes[char].copyTo(self.render)
+        node = self.glyph_pool.acquire(char, self.tunnel.layer_for(cell_key[2]).node)
         node.setPos(x, y, z)
         node.setScale(1)
         
@@ -435,80 +428,39 @@ class StarfieldTunnel(ShowBase):
             self.rotation_direction *= -1
             self.slice_rotation = self.max_rotation * self.rotation_direction
         
-        # Update all cells with new rotations
-        for cell_key, cell_data in list(self.cells.items()):
-            x, z = cell_data['base_pos']
-            y = cell_key[2]
-            
-            # Get slice-specific rotation
-            slice_index = int(y / self.layer_spacing)
-            slice_base_rotation = (slice_index % 4) * (math.pi / 2)
-            
-            # Add the animated rotation
-            total_rotation = slice_base_rotation + self.slice_rotation
-            
-            # Apply rotation
-            cos_rot = math.cos(total_rotation)
-            sin_rot = math.sin(total_rotation)
-            
-            rotated_x = x * cos_rot - z * sin_rot
-            rotated_z = x * sin_rot + z * cos_rot
-            
-            world_x = rotated_x * 1.0
-            world_z = rotated_z * 1.0
-            
-            # Update cell position
-            cell_data['world_pos'] = (world_x, y, world_z)
-            cell_data['slice_rotation'] = total_rotation
-            
-            # Update visual node
-            if cell_key in self.mesh_nodes:
-                self.mesh_nodes[cell_key].setPos(world_x, y, world_z)
+        # Each slice is one node carrying its cells at fixed offsets: one roll per slice
+        for layer in self.tunnel:
+            total_rotation = self.get_slice_rotation(layer.y) + self.slice_rotation
+            layer.node.setR(-math.degrees(total_rotation))
         
         return Task.cont
     
     def update_tunnel(self, task):
         """Manage tunnel cells - seamless creation and destruction"""        
-        cells_to_remove = []
         half_size = self.grid_size // 2
         
         # Define visible range around camera
         visible_range_ahead = 30  # How far ahead to generate cells
         visible_range_behind = 10  # How far behind to keep cells
         
-        # Remove cells that are too far behind camera
-        for cell_key, cell_data in list(self.cells.items()):
-            world_y = cell_data['world_pos'][1]
-            
-            if world_y < self.camera_position - visible_range_behind:
-                cells_to_remove.append(cell_key)
-        
-        # Remove old cells
-        for cell_key in cells_to_remove:
-            if cell_key in self.mesh_nodes:
-                self.mesh_nodes[cell_key].removeNode()
-                del self.mesh_nodes[cell_key]
-            if cell_key in self.cells:
-                del self.cells[cell_key]
-        
-        # Find the farthest Y position we have cells for
-        farthest_y = max([cell_data['world_pos'][1] for cell_data in self.cells.values()]) if self.cells else self.camera_position
-        
-        # Keep generating new cells ahead of camera until we reach visible range
-        while farthest_y < self.camera_position + visible_range_ahead:
-            new_y = farthest_y + self.layer_spacing
-            
-            # Get rotation for this new slice
-            slice_rotation = self.get_slice_rotation(new_y) + self.slice_rotation
-            
-            # Fill the new layer with cells
+        # Retire whole slices that fell behind the camera
+        for layer in self.tunnel.retire(self.camera_position - visible_range_behind):
+            for cell_key in layer.cell_keys:
+                node = self.mesh_nodes.pop(cell_key, None)
+                if node is not None:
+                    self.audio3d.stopSfx(node)
+                    self.glyph_pool.release(node)
+                self.cells.pop(cell_key, None)
+            layer.node.removeNode()
+        
+        # Fill each new slice ahead of the camera until we reach visible range
+        for layer in self.tunnel.extend_to(self.camera_position + visible_range_ahead,
+                                           self.camera_position):
             for x in range(-half_size, half_size + 1):
                 for z in range(-half_size, half_size + 1):
                     distance = math.sqrt(x*x + z*z)
                     if distance <= half_size and random.random() > 0.6:
-                        self.create_cell(x, z, new_y, slice_rotation)
-            
-            farthest_y = new_y
+                        self.create_cell(x, z, layer.y)
         
         return Task.cont
     
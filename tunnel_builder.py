@@ -0,0 +1,94 @@
+import heapq
+import threading
+from queue import Queue
+
+
+class LayerPlan:
+    """
+    Everything a tunnel slice will contain, as plain data: a list of
+    (cell_key, cell_data) pairs of offsets, glyphs and attributes.
+    """
+
+    __slots__ = ('index', 'y', 'cells')
+
+    def __init__(self, index, y, cells):
+        self.index = index
+        self.y = y
+        self.cells = cells
+
+
+class NearestFirst:
+    """
+    Thread-safe heap of LayerPlans, usable as a WorkQueue's item container:
+    popleft() always returns the plan for the nearest slice, however many
+    are waiting, so attaching one costs the same at any backlog.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def append(self, plan):
+        with self.lock:
+            heapq.heappush(self.heap, (plan.y, plan.index, plan))
+
+    # A plan handed back as not ready simply rejoins the heap
+    appendleft = append
+
+    def popleft(self):
+        with self.lock:
+            return heapq.heappop(self.heap)[-1]
+
+    def clear(self):
+        with self.lock:
+            self.heap.clear()
+
+
+class TunnelBuilder:
+    """
+    Plans whole tunnel slices on a worker thread.
+
+    plan(index, y) runs on the worker and must only compute plain data:
+    no NodePath, material or other scene-graph call is made off the main
+    thread. Finished LayerPlans are pushed to ready, typically the WorkQueue
+    whose main-thread handler attaches each slice in one go.
+    """
+
+    def __init__(self, plan, ready):
+        self.plan = plan
+        self.ready = ready
+        self.requests = Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def request(self, index, y):
+        """Ask for slice index (at y) to be planned"""
+        self.requests.put((index, y))
+
+    def pending(self):
+        """Slices requested but not yet planned"""
+        return self.requests.qsize()
+
+    def is_alive(self):
+        return self.thread.is_alive()
+
+    def _run(self):
+        while True:
+            request = self.requests.get()
+            if request is None:  # Stop signal
+                break
+            index, y = request
+            try:
+                self.ready.push(LayerPlan(index, y, self.plan(index, y)))
+            except Exception as e:
+                print(f"Error planning tunnel slice {index}: {e}")
+
+    def stop(self, timeout=None):
+        self.requests.put(None)
+        if self.thread.is_alive():
+            self.thread.join(timeout)
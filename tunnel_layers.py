@@ -0,0 +1,109 @@
+from collections import deque
+
+
+class TunnelLayer:
+    """
+    One slice of the tunnel: its index along the track, the keys of its
+    cells and, when the tunnel has a parent node, the node its cells hang
+    from at fixed offsets.
+    """
+
+    __slots__ = ('index', 'y', 'cell_keys', 'node')
+
+    def __init__(self, index, y, node=None):
+        self.index = index
+        self.y = y
+        self.cell_keys = set()
+        self.node = node
+
+
+class TunnelLayers:
+    """
+    Tunnel cells grouped by slice, nearest slice first.
+
+    The camera only moves forward, so slices join at the far end and leave
+    from the near end. Keeping them in a deque makes retiring and extending
+    the tunnel cost one step per layer rather than a scan over every cell,
+    and the farthest slice is always the last one.
+
+    Given a parent NodePath, each slice also gets its own child node at
+    (0, y, 0), so spinning a slice is one transform write, not one per cell.
+    """
+
+    def __init__(self, spacing, parent=None):
+        self.spacing = spacing
+        self.parent = parent
+        self.layers = deque()
+
+    def __len__(self):
+        return len(self.layers)
+
+    def __iter__(self):
+        return iter(self.layers)
+
+    @property
+    def nearest_y(self):
+        return self.layers[0].y if self.layers else None
+
+    @property
+    def farthest_y(self):
+        return self.layers[-1].y if self.layers else None
+
+    def slice_index(self, y):
+        return int(y // self.spacing)
+
+    def layer_for(self, y):
+        """
+        The layer holding slice y, pushing it (and any slices in between)
+        onto the far end if the tunnel does not reach it yet.
+
+        Returns None for slices already retired off the near end.
+        """
+        index = self.slice_index(y)
+        if not self.layers:
+            self.layers.append(self._new_layer(index))
+        offset = index - self.layers[0].index
+        if offset < 0:
+            return None
+        while offset >= len(self.layers):
+            self.push()
+        return self.layers[offset]
+
+    def push(self):
+        """Add the next slice at the far end and return it"""
+        layer = self._new_layer(self.layers[-1].index + 1)
+        self.layers.append(layer)
+        return layer
+
+    def _new_layer(self, index):
+        y = index * self.spacing
+        node = None
+        if self.parent is not None:
+            node = self.parent.attachNewNode(f'slice_{index}')
+            node.setPos(0, y, 0)
+        return TunnelLayer(index, y, node)
+
+    def extend_to(self, y, start_y):
+        """
+        Push slices onto the far end until the tunnel reaches y, starting
+        from slice start_y if it is empty; returns the new layers.
+        """
+        added = []
+        if not self.layers:
+            added.append(self.layer_for(start_y))
+        while self.layers[-1].y < y:
+            added.append(self.push())
+        return added
+
+    def retire(self, min_y):
+        """Pop every slice nearer than min_y off the near end and return them, nearest first"""
+        retired = []
+        while self.layers and self.layers[0].y < min_y:
+            retired.append(self.layers.popleft())
+        return retired
+
+    def clear(self):
+        for layer in self.layers:
+            if layer.node is not None:
+                layer.node.removeNode()
+        self.layers.clear()
@@ -0,0 +1,93 @@
+"""
+Visibility pre-pass for the voxel renderer.
+
+A cell whose 6 face neighbours are all occupied is hidden behind them from
+every direction, so only occupied cells with at least one empty face
+neighbour need a glyph. Cells on the edge of the grid border empty space.
+"""
+import numpy as np
+
+# The 6 face neighbours of a cell
+FACE_OFFSETS = np.array([(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)])
+
+
+def surface_mask(occupied):
+    """Occupied cells with at least one empty face neighbour, as a boolean array"""
+    occupied = np.asarray(occupied, dtype=bool)
+    padded = np.pad(occupied, 1, constant_values=False)
+    enclosed = occupied.copy()
+    for axis in range(3):
+        for start in (0, 2):
+            window = [slice(1, -1)] * 3
+            window[axis] = slice(start, start + occupied.shape[axis])
+            enclosed &= padded[tuple(window)]
+    return occupied & ~enclosed
+
+
+class SurfaceTracker:
+    """
+    Keeps the surface mask of a grid up to date as cells change.
+
+    A cell can only enter or leave the surface when it or one of its face
+    neighbours changes, so each update re-tests just those cells. Once more
+    than full_update_fraction of the grid changed, one full pass is cheaper.
+
+    Occupancy and the mask are kept with a one-cell empty border, so the
+    neighbours of any cell are fixed flat offsets away and need no bounds checks.
+    """
+
+    def __init__(self, shape, full_update_fraction=0.05):
+        self.shape = tuple(shape)
+        self.full_update_fraction = full_update_fraction
+        padded_shape = tuple(size + 2 for size in self.shape)
+        self._occupied = np.zeros(padded_shape, dtype=bool)
+        self._mask = np.zeros(padded_shape, dtype=bool)
+        self._offsets = np.ravel_multi_index((FACE_OFFSETS + 1).T, padded_shape) - \
+            np.ravel_multi_index((1, 1, 1), padded_shape)
+        self._inner = (slice(1, -1),) * 3
+
+    @property
+    def occupied(self):
+        return self._occupied[self._inner]
+
+    @property
+    def mask(self):
+        return self._mask[self._inner]
+
+    def reset(self, grid):
+        self._occupied[self._inner] = np.asarray(grid) != 0
+        self._mask[self._inner] = surface_mask(self.occupied)
+        return self.mask
+
+    def update(self, grid, changed=None):
+        """
+        Bring the mask up to date with grid.
+
+        Args:
+            grid: The grid now shown, non-zero for occupied cells
+            changed: Flat indices of cells that changed since the last update,
+                found by diffing against the previous grid when None
+
+        Returns:
+            The boolean surface mask
+        """
+        grid = np.asarray(grid)
+        if changed is None:
+            changed = np.flatnonzero((grid != 0) != self.occupied)
+        if len(changed) == 0:
+            return self.mask
+        if len(changed) > self.full_update_fraction * grid.size:
+            return self.reset(grid)
+
+        flat_occupied = self._occupied.reshape(-1)
+        padded = np.ravel_multi_index(tuple(c + 1 for c in np.unravel_index(changed, self.shape)),
+                                      self._occupied.shape)
+        flat_occupied[padded] = grid.reshape(-1)[changed] != 0
+
+        # Re-test every cell whose surface test could have changed. Border
+        # cells are never occupied, so their result is False whatever their
+        # (clipped) neighbour lookups return.
+        affected = np.unique((padded[:, None] + np.append(self._offsets, 0)[None, :]).reshape(-1))
+        neighbours = flat_occupied.take(affected[:, None] + self._offsets[None, :], mode='clip')
+        self._mask.reshape(-1)[affected] = flat_occupied[affected] & ~neighbours.all(axis=1)
+        return self.mask